@@ -60,6 +60,7 @@ from src.models import (
     ChatMessageStreamDelta,
     ChatMessageToolCall,
     MessageRole,
+    StreamDeltaAccumulator,
 )
 from src.logger import (
     AgentLogger,
@@ -544,18 +545,19 @@ You have been provided with these additional arguments, that you can access usin
                 )
             ]
             if self.stream_outputs and hasattr(self.model, "generate_stream"):
-                plan_message_content = ""
+                plan_accumulator = StreamDeltaAccumulator()
                 output_stream = self.model.generate_stream(input_messages, stop_sequences=["<end_plan>"])  # type: ignore
                 input_tokens, output_tokens = 0, 0
                 with Live("", console=self.logger.console, vertical_overflow="visible") as live:
                     for event in output_stream:
                         if event.content is not None:
-                            plan_message_content += event.content
-                            live.update(Markdown(plan_message_content))
+                            plan_accumulator.add(event)
+                            live.update(Markdown(plan_accumulator.content))
                             if event.token_usage:
                                 output_tokens += event.token_usage.output_tokens
                                 input_tokens = event.token_usage.input_tokens
                         yield event
+                plan_message_content = plan_accumulator.content
             else:
                 plan_message = self.model.generate(input_messages, stop_sequences=["<end_plan>"])
                 plan_message_content = plan_message.content
@@ -605,7 +607,7 @@ You have been provided with these additional arguments, that you can access usin
             # remove last message from memory_messages because it is the current task
             input_messages = [plan_update_pre] + memory_messages[:-1] + [plan_update_post]
             if self.stream_outputs and hasattr(self.model, "generate_stream"):
-                plan_message_content = ""
+                plan_accumulator = StreamDeltaAccumulator()
                 input_tokens, output_tokens = 0, 0
                 with Live("", console=self.logger.console, vertical_overflow="visible") as live:
                     for event in self.model.generate_stream(
@@ -613,12 +615,13 @@ You have been provided with these additional arguments, that you can access usin
                         stop_sequences=["<end_plan>"],
                     ):  # type: ignore
                         if event.content is not None:
-                            plan_message_content += event.content
-                            live.update(Markdown(plan_message_content))
+                            plan_accumulator.add(event)
+                            live.update(Markdown(plan_accumulator.content))
                             if event.token_usage:
                                 output_tokens += event.token_usage.output_tokens
                                 input_tokens = event.token_usage.input_tokens
                         yield event
+                plan_message_content = plan_accumulator.content
             else:
                 plan_message = self.model.generate(input_messages, stop_sequences=["<end_plan>"])
                 plan_message_content = plan_message.content
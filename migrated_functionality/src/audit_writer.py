@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+📝 IZA OS AUDIT WRITER
+======================
+Background batching for audit records so request handlers only enqueue
+A bounded queue feeds one worker that flushes by batch size or by time
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DROP = "drop"
+BLOCK = "block"
+_STOP = object()
+
+
+class AuditWriter:
+    """Bounded audit queue drained in batches by a background task"""
+
+    def __init__(self, flush: Callable[[List[Any]], Awaitable[None]], max_queue: int = 10000,
+                 batch_size: int = 100, flush_interval: float = 0.5, policy: str = BLOCK):
+        if policy not in (DROP, BLOCK):
+            raise ValueError(f"Unknown audit queue policy: {policy}")
+        self.flush = flush
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.counters = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'blocked': 0,
+            'batches': 0,
+            'failed': 0,
+            'max_depth': 0,
+        }
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background flush task"""
+        if not self.running:
+            self._stopped = False
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, record: Any) -> bool:
+        """Enqueue a record; under the drop policy a full queue discards it and returns False"""
+        if self._stopped:
+            self.counters['dropped'] += 1
+            return False
+
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            if self.policy == DROP:
+                self.counters['dropped'] += 1
+                # Warn on the first drop and then every thousandth to keep the log readable
+                if self.counters['dropped'] % 1000 == 1:
+                    logger.warning(f"⚠️ Audit queue full ({self.max_queue}), "
+                                   f"{self.counters['dropped']} records dropped")
+                return False
+            self.counters['blocked'] += 1
+            await self._queue.put(record)
+
+        self.counters['enqueued'] += 1
+        depth = self._queue.qsize()
+        if depth > self.counters['max_depth']:
+            self.counters['max_depth'] = depth
+        return True
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+
+            # Fill the batch until it is full or the oldest record has waited flush_interval
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    record = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        record = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if record is _STOP:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            await self._flush_batch(batch)
+
+    async def _flush_batch(self, batch: List[Any]) -> None:
+        try:
+            await self.flush(batch)
+            self.counters['written'] += len(batch)
+            self.counters['batches'] += 1
+        except Exception as e:
+            self.counters['failed'] += len(batch)
+            logger.error(f"❌ Failed to flush {len(batch)} audit records: {e}")
+
+    async def stop(self) -> None:
+        """Flush everything already queued, then stop the background task"""
+        self._stopped = True
+        if self.running:
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+
+        # Records from producers that were blocked behind the stop marker, or queued before start
+        batch = []
+        while not self._queue.empty():
+            record = self._queue.get_nowait()
+            if record is not _STOP:
+                batch.append(record)
+        if batch:
+            await self._flush_batch(batch)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            'depth': self._queue.qsize(),
+            'max_queue': self.max_queue,
+            'policy': self.policy,
+        }
@@ -175,66 +175,97 @@ class MessageRole(str, Enum):
         return [r.value for r in cls]
 
 
+class StreamDeltaAccumulator:
+    """
+    Incrementally agglomerates stream deltas into a single `ChatMessage` as they arrive.
+
+    Content and tool call arguments are buffered as lists of chunks per stream and joined only when a message is
+    requested, so accumulating n deltas costs O(n) instead of quadratic string copying.
+    """
+
+    def __init__(self, role: MessageRole = MessageRole.ASSISTANT):
+        self.role = role
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._content_chunks: list[str] = []
+        self._tool_calls: dict[int, ChatMessageToolCallStreamDelta] = {}
+        self._tool_call_arguments: dict[int, list[str]] = {}
+
+    @staticmethod
+    def _join(chunks: list[str]) -> str:
+        # Collapse the buffer so that repeated partial messages do not join the same chunks again
+        if len(chunks) > 1:
+            chunks[:] = ["".join(chunks)]
+        return chunks[0] if chunks else ""
+
+    def add(self, stream_delta: ChatMessageStreamDelta) -> None:
+        if stream_delta.token_usage:
+            self.input_tokens += stream_delta.token_usage.input_tokens
+            self.output_tokens += stream_delta.token_usage.output_tokens
+        if stream_delta.content:
+            self._content_chunks.append(stream_delta.content)
+        if stream_delta.tool_calls:
+            for tool_call_delta in stream_delta.tool_calls:  # Normally there should be only one call at a time
+                if tool_call_delta.index is None:
+                    raise ValueError(f"Any call index is not provided in tool delta: {tool_call_delta}")
+                if tool_call_delta.index not in self._tool_calls:
+                    self._tool_calls[tool_call_delta.index] = ChatMessageToolCallStreamDelta(
+                        id=tool_call_delta.id,
+                        type=tool_call_delta.type,
+                        function=ChatMessageToolCallFunction(name="", arguments=""),
+                    )
+                    self._tool_call_arguments[tool_call_delta.index] = []
+                # Update the tool call at the specific index
+                tool_call = self._tool_calls[tool_call_delta.index]
+                if tool_call_delta.id:
+                    tool_call.id = tool_call_delta.id
+                if tool_call_delta.type:
+                    tool_call.type = tool_call_delta.type
+                if tool_call_delta.function:
+                    if tool_call_delta.function.name and len(tool_call_delta.function.name) > 0:
+                        tool_call.function.name = tool_call_delta.function.name
+                    if tool_call_delta.function.arguments:
+                        self._tool_call_arguments[tool_call_delta.index].append(tool_call_delta.function.arguments)
+
+    @property
+    def content(self) -> str:
+        return self._join(self._content_chunks)
+
+    def to_chat_message(self) -> ChatMessage:
+        """Returns the message agglomerated so far: call it for partial messages while streaming and once at the end."""
+        return ChatMessage(
+            role=self.role,
+            content=self.content,
+            tool_calls=[
+                ChatMessageToolCall(
+                    function=ChatMessageToolCallFunction(
+                        name=tool_call_stream_delta.function.name,
+                        arguments=self._join(self._tool_call_arguments[index]),
+                    ),
+                    id=tool_call_stream_delta.id or "",
+                    type="function",
+                )
+                for index, tool_call_stream_delta in self._tool_calls.items()
+                if tool_call_stream_delta.function
+            ],
+            token_usage=TokenUsage(
+                input_tokens=self.input_tokens,
+                output_tokens=self.output_tokens,
+            ),
+        )
+
+
 def agglomerate_stream_deltas(
     stream_deltas: list[ChatMessageStreamDelta], role: MessageRole = MessageRole.ASSISTANT
 ) -> ChatMessage:
     """
     Agglomerate a list of stream deltas into a single stream delta.
     """
-    accumulated_tool_calls: dict[int, ChatMessageToolCallStreamDelta] = {}
-    accumulated_content = ""
-    total_input_tokens = 0
-    total_output_tokens = 0
+    accumulator = StreamDeltaAccumulator(role=role)
     for stream_delta in stream_deltas:
-        if stream_delta.token_usage:
-            total_input_tokens += stream_delta.token_usage.input_tokens
-            total_output_tokens += stream_delta.token_usage.output_tokens
-        if stream_delta.content:
-            accumulated_content += stream_delta.content
-        if stream_delta.tool_calls:
-            for tool_call_delta in stream_delta.tool_calls:  # ?ormally there should be only one call at a time
-                # Extend accumulated_tool_calls list to accommodate the new tool call if needed
-                if tool_call_delta.index is not None:
-                    if tool_call_delta.index not in accumulated_tool_calls:
-                        accumulated_tool_calls[tool_call_delta.index] = ChatMessageToolCallStreamDelta(
-                            id=tool_call_delta.id,
-                            type=tool_call_delta.type,
-                            function=ChatMessageToolCallFunction(name="", arguments=""),
-                        )
-                    # Update the tool call at the specific index
-                    tool_call = accumulated_tool_calls[tool_call_delta.index]
-                    if tool_call_delta.id:
-                        tool_call.id = tool_call_delta.id
-                    if tool_call_delta.type:
-                        tool_call.type = tool_call_delta.type
-                    if tool_call_delta.function:
-                        if tool_call_delta.function.name and len(tool_call_delta.function.name) > 0:
-                            tool_call.function.name = tool_call_delta.function.name
-                        if tool_call_delta.function.arguments:
-                            tool_call.function.arguments += tool_call_delta.function.arguments
-                else:
-                    raise ValueError(f"Any call index is not provided in tool delta: {tool_call_delta}")
+        accumulator.add(stream_delta)
+    return accumulator.to_chat_message()
 
-    return ChatMessage(
-        role=role,
-        content=accumulated_content,
-        tool_calls=[
-            ChatMessageToolCall(
-                function=ChatMessageToolCallFunction(
-                    name=tool_call_stream_delta.function.name,
-                    arguments=tool_call_stream_delta.function.arguments,
-                ),
-                id=tool_call_stream_delta.id or "",
-                type="function",
-            )
-            for tool_call_stream_delta in accumulated_tool_calls.values()
-            if tool_call_stream_delta.function
-        ],
-        token_usage=TokenUsage(
-            input_tokens=total_input_tokens,
-            output_tokens=total_output_tokens,
-        ),
-    )
 
 
 tool_role_conversions = {
@@ -1881,4 +1912,5 @@ __all__ = [
     "AmazonBedrockServerModel",
     "AmazonBedrockModel",
     "ChatMessage",
+    "StreamDeltaAccumulator",
 ]
@@ -0,0 +1,145 @@
+import asyncio
+import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import httpx
+import numpy as np
+from fastapi import FastAPI, Request
+
+from audit_writer import AuditWriter
+from security_event_log import SegmentedEventLog
+
+
+@dataclass
+class AuditLog:
+    """Same fields as enterprise_security_system.AuditLog"""
+    log_id: str
+    user_id: Optional[str]
+    action: str
+    resource: str
+    details: Dict[str, Any]
+    ip_address: Optional[str]
+    user_agent: Optional[str]
+    timestamp: datetime
+    success: bool
+
+
+class AuditSink:
+    """The storage side of EnterpriseSecurityManager's audit logging"""
+
+    def __init__(self, directory, metric_latency):
+        self.audit_logs = deque(maxlen=50000)
+        self.audit_log = SegmentedEventLog(directory)
+        self.metric_latency = metric_latency
+
+    async def log_metric(self, name, value):
+        # Stands in for the metrics/cache round trip made by BaseManager
+        await asyncio.sleep(self.metric_latency)
+
+    async def write_inline(self, audit_log):
+        self.audit_logs.append(audit_log)
+        self.audit_log.append(vars(audit_log), audit_log.timestamp.timestamp())
+        await self.log_metric("audit_events", 1)
+
+    async def write_batch(self, batch):
+        self.audit_logs.extend(batch)
+        await asyncio.to_thread(self.audit_log.append_many, ((vars(a), a.timestamp.timestamp()) for a in batch))
+        await self.log_metric("audit_events", len(batch))
+
+
+def build_app(sink, writer, audit_latencies):
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def security_middleware(request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        audit_started = time.perf_counter()
+        audit_log = AuditLog(
+            log_id=f"audit_{int(time.time())}",
+            user_id=None,
+            action=f"{request.method} {request.url.path}",
+            resource=request.url.path,
+            details={
+                'method': request.method,
+                'status_code': response.status_code,
+                'processing_time': time.time() - start_time,
+                'user_agent': request.headers.get("user-agent", ""),
+            },
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent", ""),
+            timestamp=datetime.now(),
+            success=response.status_code < 400,
+        )
+        if writer is None:
+            await sink.write_inline(audit_log)
+        else:
+            await writer.submit(audit_log)
+        audit_latencies.append(time.perf_counter() - audit_started)
+        return response
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    return app
+
+
+async def load_test(directory, batched, requests, concurrency, metric_latency):
+    sink = AuditSink(directory, metric_latency)
+    writer = AuditWriter(sink.write_batch) if batched else None
+    if writer:
+        await writer.start()
+
+    latencies = []
+    audit_latencies = []
+    transport = httpx.ASGITransport(app=build_app(sink, writer, audit_latencies))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = asyncio.Queue()
+        for i in range(requests):
+            queue.put_nowait(i)
+
+        async def worker():
+            while not queue.empty():
+                i = queue.get_nowait()
+                start = time.perf_counter()
+                await client.get(f"/items/{i}")
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    if writer:
+        await writer.stop()
+    sink.audit_log.close()
+    assert sink.audit_log.appended == requests
+    return np.array(audit_latencies) * 1000, np.array(latencies) * 1000, requests / elapsed
+
+
+if __name__ == "__main__":
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    metric_latencies = [float(ms) / 1000 for ms in sys.argv[3:]] or [0.0, 0.0005]
+
+    print(f"{requests:,} requests, {concurrency} concurrent clients")
+    print("audit: time the middleware spends on audit logging after the response is ready")
+    print(f"{'metric rtt':>10}  {'audit path':<12}{'audit p50':>12}{'audit p99':>12}"
+          f"{'client p99':>12}{'req/s':>10}")
+    for metric_latency in metric_latencies:
+        for batched in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                audit, client, throughput = asyncio.run(
+                    load_test(Path(tmp), batched, requests, concurrency, metric_latency)
+                )
+            label = "queued" if batched else "inline"
+            print(f"{metric_latency * 1000:>8.1f}ms  {label:<12}{np.percentile(audit, 50):>12.3f}"
+                  f"{np.percentile(audit, 99):>12.3f}{np.percentile(client, 99):>12.2f}{throughput:>10,.0f}")
@@ -0,0 +1,59 @@
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from event_counters import SlidingWindowCounters
+
+EVENT_TYPES = ["login", "api_request", "data_access", "failed_login"]
+WINDOWS = {"login": 60, "api_request": 60, "data_access": 60, "failed_login": 3600}
+
+
+def sample_events(n, ips, users, rate=100_000, seed=11):
+    """(ip key, user key, window, timestamp) per event, arriving at rate events per second"""
+    rng = random.Random(seed)
+    ip_pool = [f"10.{i // 65536}.{i // 256 % 256}.{i % 256}" for i in range(ips)]
+    user_pool = [f"user_{i}" for i in range(users)]
+    start_time = 1_700_000_000.0
+    events = []
+    for i in range(n):
+        event_type = rng.choice(EVENT_TYPES)
+        events.append((
+            ("ip", rng.choice(ip_pool), event_type),
+            ("user", rng.choice(user_pool), event_type),
+            WINDOWS[event_type],
+            start_time + i / rate,
+        ))
+    return events
+
+
+def run(events, counters):
+    """Per event: record the (ip, type) and (user, type) keys, then read both windows, like the engine does"""
+    start = time.perf_counter()
+    for ip_key, user_key, window, now in events:
+        counters.add((ip_key, user_key), now)
+        max(counters.count(ip_key, window, now), counters.count(user_key, window, now))
+    return len(events) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    print(f"{n:,} events arriving at 100k events/s")
+    print(f"{'IPs':>8}{'users':>8}{'max keys':>10}{'events/s':>12}{'keys':>10}{'evicted':>10}{'memory (MB)':>13}")
+    for ips, users, max_keys in ((1_000, 500, 200_000), (20_000, 5_000, 200_000), (20_000, 5_000, 20_000)):
+        events = sample_events(n, ips, users)
+        counters = SlidingWindowCounters(max_keys=max_keys)
+        rate = run(events, counters)
+        # Memory measured on a second pass so tracing does not slow the timed run
+        traced = SlidingWindowCounters(max_keys=max_keys)
+        tracemalloc.start()
+        run(events[: n // 5], traced)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        stats = counters.stats()
+        print(f"{ips:>8,}{users:>8,}{max_keys:>10,}{rate:>12,.0f}{stats['keys']:>10,}"
+              f"{stats['evicted']:>10,}{memory / 1e6:>13.1f}")
@@ -0,0 +1,73 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fakeredis
+
+from business_intelligence_system import (
+    DataPipeline,
+    DirectoryFrameCacheBackend,
+    FrameCache,
+    RedisFrameCacheBackend,
+)
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(years):
+    pipeline = DataPipeline(cache_backend=RedisFrameCacheBackend(fakeredis.FakeRedis()))
+    end_date = datetime(2025, 1, 1)
+    start_date = end_date - timedelta(days=365 * years)
+    df = asyncio.run(pipeline.extract_data("system_performance", start_date, end_date))
+    columns = ["timestamp", "response_time"]
+    print(f"system_performance, {years} year(s) hourly: {len(df):,} rows x {df.shape[1]} columns")
+
+    formats = (
+        ("json (previous)", "json", None),
+        ("feather", "feather", None),
+        ("feather lz4", "feather", "lz4"),
+        ("feather zstd", "feather", "zstd"),
+        ("parquet snappy", "parquet", "snappy"),
+        ("parquet zstd", "parquet", "zstd"),
+    )
+    print(f"{'format':<18}{'size (KB)':>12}{'encode (ms)':>14}{'decode (ms)':>14}{'2 cols (ms)':>14}")
+    for name, fmt, compression in formats:
+        cache = FrameCache(RedisFrameCacheBackend(fakeredis.FakeRedis()), format=fmt, compression=compression)
+        encode_time, data = timed(lambda: cache.encode(df))
+        decode_time, _ = timed(lambda: cache.decode(data))
+        column_time, _ = timed(lambda: cache.decode(data, columns))
+        print(f"{name:<18}{len(data) / 1024:>12.1f}{encode_time * 1000:>14.2f}"
+              f"{decode_time * 1000:>14.2f}{column_time * 1000:>14.2f}")
+
+    # Round trip through each backend, including the fetch
+    print(f"\n{'backend':<30}{'put (ms)':>12}{'get (ms)':>12}{'get 2 cols (ms)':>18}")
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = (
+            ("fakeredis json", RedisFrameCacheBackend(fakeredis.FakeRedis()), "json", None),
+            ("fakeredis feather lz4", RedisFrameCacheBackend(fakeredis.FakeRedis()), "feather", "lz4"),
+            ("directory feather", DirectoryFrameCacheBackend(os.path.join(tmp, "plain")), "feather", None),
+            ("directory feather lz4", DirectoryFrameCacheBackend(os.path.join(tmp, "lz4")), "feather", "lz4"),
+        )
+        for name, backend, fmt, compression in backends:
+            cache = FrameCache(backend, format=fmt, compression=compression)
+            put_time, _ = timed(lambda: cache.put("analytics:system_performance:bench", df))
+            get_time, _ = timed(lambda: cache.get("analytics:system_performance:bench"))
+            column_time, _ = timed(lambda: cache.get("analytics:system_performance:bench", columns))
+            print(f"{name:<30}{put_time * 1000:>12.2f}{get_time * 1000:>12.2f}{column_time * 1000:>18.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
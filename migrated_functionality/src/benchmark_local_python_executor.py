@@ -0,0 +1,62 @@
+import sys
+import timeit
+from pathlib import Path
+
+root = str(Path(__file__).resolve().parents[1])
+sys.path.append(root)
+
+from src.tools.executor.local_python_executor import (
+    BASE_PYTHON_TOOLS,
+    compile_python_code,
+    evaluate_compiled_python_code,
+    evaluate_python_code,
+)
+
+# The successful cases of test_local_python_executor.py, followed by the loop-heavy actions agents typically write.
+BENCHMARK_CASES = {
+    "import_allowed_module": ("import math; x = math.sqrt(4)", ["math"]),
+    "import_submodule": ("import collections; c = collections.abc.Callable", ["collections", "collections.abc"]),
+    "import_from_submodule": ("from os.path import basename; x = basename('/a/b')", ["os.path"]),
+    "call_builtin": ("len([1,2,3])", []),
+    "dunder_indirect_len": ("x = [1,2]; len(x)", []),
+    "dunder_indirect_getitem": ("x = [10,20]; x[1]", []),
+    "for_loop": ("total = 0\nfor i in range(5000):\n    total += i * 2\ntotal", []),
+    "while_loop": ("i = 0\nwhile i < 5000:\n    i += 1\ni", []),
+    "list_comprehension": ("squares = [i * i for i in range(5000) if i % 3]\nlen(squares)", []),
+    "dict_rows": (
+        "rows = [{'id': i, 'value': i % 7} for i in range(2000)]\n"
+        "counts = {}\n"
+        "for row in rows:\n"
+        "    counts[row['value']] = counts.get(row['value'], 0) + 1\n"
+        "counts",
+        [],
+    ),
+    "function_calls": (
+        "def fib(n):\n    a, b = 0, 1\n    for _ in range(n):\n        a, b = b, a + b\n    return a\n"
+        "[fib(i) for i in range(200)][-1]",
+        [],
+    ),
+}
+
+
+def run_case(evaluate, code, authorized_imports, **kwargs):
+    evaluate(code, static_tools=BASE_PYTHON_TOOLS.copy(), custom_tools={}, state={}, authorized_imports=authorized_imports, **kwargs)
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'case':<26}{'tree-walking (ms)':>20}{'compiled (ms)':>16}{'precompiled (ms)':>19}{'speedup':>10}")
+    for name, (code, authorized_imports) in BENCHMARK_CASES.items():
+        interpreted = timeit.timeit(lambda: run_case(evaluate_python_code, code, authorized_imports), number=number)
+        compiled = timeit.timeit(
+            lambda: run_case(evaluate_compiled_python_code, code, authorized_imports), number=number
+        )
+        precompiled_code = compile_python_code(code, BASE_PYTHON_TOOLS, authorized_imports)
+        precompiled = timeit.timeit(
+            lambda: run_case(evaluate_compiled_python_code, code, authorized_imports, compiled=precompiled_code),
+            number=number,
+        )
+        print(
+            f"{name:<26}{interpreted / number * 1000:>20.3f}{compiled / number * 1000:>16.3f}"
+            f"{precompiled / number * 1000:>19.3f}{interpreted / compiled:>9.1f}x"
+        )
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+os.environ.setdefault("BI_MODEL_DIR", tempfile.mkdtemp())
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from business_intelligence_system import DataPipeline, PredictiveAnalytics
+
+
+async def train(analytics):
+    pipeline = DataPipeline()
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=365)
+    revenue = await pipeline.extract_data("revenue", start_date, end_date)
+    users = await pipeline.extract_data("user_activity", start_date, end_date)
+    return await analytics.train_revenue_prediction_model(pd.merge(revenue, users, on="date", how="inner"))
+
+
+def feature_rows(features, n, seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.normal(1_000, 100, size=(n, len(features)))
+    return [dict(zip(features, row)) for row in values]
+
+
+async def main(single_calls, batch_rows):
+    analytics = PredictiveAnalytics()
+    model_info = await train(analytics)
+    model_id = model_info.model_id
+    rows = feature_rows(model_info.features, batch_rows)
+
+    # The previous predict_revenue: deserialize the model from disk on every call
+    start = time.perf_counter()
+    for row in rows[:single_calls]:
+        stored = joblib.load(analytics.registry.model_path(model_id))
+        vector = np.array([row.get(f, 0) for f in model_info.features]).reshape(1, -1)
+        stored["model"].predict(stored["scaler"].transform(vector))
+    disk_single = (time.perf_counter() - start) / single_calls
+
+    analytics.warm_models()
+    start = time.perf_counter()
+    for row in rows[:single_calls]:
+        await analytics.predict_revenue(model_id, row)
+    resident_single = (time.perf_counter() - start) / single_calls
+
+    start = time.perf_counter()
+    result = await analytics.predict_many(model_id, rows)
+    batch_total = time.perf_counter() - start
+
+    # Batch and single-row paths must agree
+    single = await analytics.predict_revenue(model_id, rows[0])
+    assert abs(single["prediction"] - result["predictions"][0]) < 1e-6
+
+    print(f"{'path':<40}{'per prediction':>18}")
+    print(f"{'predict, joblib.load per call':<40}{disk_single * 1000:>15.2f} ms")
+    print(f"{'predict_revenue, resident model':<40}{resident_single * 1000:>15.2f} ms")
+    print(f"{'predict_many (' + str(batch_rows) + ' rows)':<40}{batch_total / batch_rows * 1000:>15.4f} ms")
+    print(f"predict_many total: {batch_total * 1000:.1f} ms; registry: {analytics.registry.stats()}")
+
+
+if __name__ == "__main__":
+    single_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    batch_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    asyncio.run(main(single_calls, batch_rows))
@@ -0,0 +1,120 @@
+import importlib.util
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# The tracker module name contains a hyphen, so load it from its path.
+spec = importlib.util.spec_from_file_location(
+    "product_monetization_tracker", Path(__file__).resolve().parent / "product-monetization-tracker.py"
+)
+tracker_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(tracker_module)
+AIProductMonetizationTracker = tracker_module.AIProductMonetizationTracker
+
+STATUSES = ["active", "paused", "completed", "cancelled"]
+
+
+def sample_products(n):
+    return [
+        {
+            "name": f"Product {i}",
+            "category": f"Category {i % 20}",
+            "description": "Benchmark product",
+            "current_value": i * 1_000,
+            "target_value": i * 2_000,
+            "revenue_potential": i * 10_000,
+            "development_stage": "production",
+            "priority": i % 10 + 1,
+            "market_size": i * 1_000_000,
+            "competition_level": ["low", "medium", "high"][i % 3],
+            "monetization_strategy": ["SaaS subscriptions"],
+            "revenue_streams": ["Subscription revenue"],
+            "target_customers": ["Enterprise"],
+            "status": STATUSES[i % len(STATUSES)],
+        }
+        for i in range(n)
+    ]
+
+
+def legacy_save(db_path, row):
+    """The previous _save_product: a fresh connection and commit per row."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(AIProductMonetizationTracker.PRODUCT_INSERT_SQL, row)
+    conn.commit()
+    conn.close()
+
+
+def legacy_get_products(db_path, status):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT * FROM products WHERE status = ?", (status,)).fetchall()
+    conn.close()
+    return rows
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    legacy_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    products = sample_products(rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Legacy path on a table without the new indexes
+        legacy_db = os.path.join(tmp, "legacy.db")
+        legacy_tracker = AIProductMonetizationTracker(legacy_db)
+        for index_name in AIProductMonetizationTracker.INDEXES:
+            legacy_tracker.conn.execute(f"DROP INDEX {index_name}")
+        legacy_tracker.close()
+        legacy_data = [
+            AIProductMonetizationTracker._product_row(legacy_tracker._build_product(p)) for p in products[:legacy_rows]
+        ]
+        start = time.perf_counter()
+        for row in legacy_data:
+            legacy_save(legacy_db, row)
+        legacy_insert = time.perf_counter() - start
+
+        tracker = AIProductMonetizationTracker(os.path.join(tmp, "bulk.db"))
+        start = time.perf_counter()
+        tracker.add_products(products)
+        bulk_insert = time.perf_counter() - start
+
+        # Bring the legacy table to the same size for the query comparison
+        legacy_conn = sqlite3.connect(legacy_db)
+        with legacy_conn:
+            legacy_conn.executemany(
+                AIProductMonetizationTracker.PRODUCT_INSERT_SQL,
+                [AIProductMonetizationTracker._product_row(tracker._build_product(p)) for p in products[legacy_rows:]],
+            )
+        legacy_conn.close()
+
+        queries = 20
+        start = time.perf_counter()
+        for i in range(queries):
+            legacy_get_products(legacy_db, "paused")
+        legacy_query = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        for i in range(queries):
+            tracker.conn.execute("SELECT * FROM products WHERE status = ?", ("paused",)).fetchall()
+        indexed_query = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        for i in range(queries):
+            tracker.conn.execute(
+                "SELECT COUNT(*) FROM products WHERE competition_level = ? AND status = ?", ("high", "active")
+            ).fetchone()
+        indexed_count = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        tracker.get_products(status="paused")
+        get_products = time.perf_counter() - start
+        tracker.close()
+
+    print(f"{'operation':<44}{'time':>12}{'rows/s':>14}")
+    print(f"{'insert, connect per row (' + str(legacy_rows) + ')':<44}{legacy_insert:>11.2f}s{legacy_rows / legacy_insert:>14,.0f}")
+    print(f"{'add_products, one transaction (' + str(rows) + ')':<44}{bulk_insert:>11.2f}s{rows / bulk_insert:>14,.0f}")
+    print(f"{'status query, connect per call, no index':<44}{legacy_query * 1000:>10.1f}ms")
+    print(f"{'status query, persistent connection':<44}{indexed_query * 1000:>10.1f}ms")
+    print(f"{'dashboard count, indexed':<44}{indexed_count * 1000:>10.2f}ms")
+    print(f"{'get_products(status) incl. JSON decoding':<44}{get_products * 1000:>10.1f}ms")
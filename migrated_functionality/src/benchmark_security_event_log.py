@@ -0,0 +1,94 @@
+import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from security_event_log import SegmentedEventLog, encode_record
+
+
+@dataclass
+class SecurityEvent:
+    """Same fields as enterprise_security_system.SecurityEvent"""
+    event_id: str
+    event_type: str
+    severity: str
+    description: str
+    user_id: Optional[str]
+    ip_address: Optional[str]
+    user_agent: Optional[str]
+    metadata: Dict[str, Any]
+    timestamp: datetime
+    resolved: bool = False
+    resolution: Optional[str] = None
+
+
+def make_event(i):
+    return SecurityEvent(
+        event_id=f"event_{i}",
+        event_type="api_request",
+        severity="low",
+        description=f"GET /api/v1/resources/{i}",
+        user_id=f"user_{i % 500}",
+        ip_address=f"10.0.{i % 256}.{i % 200}",
+        user_agent="Mozilla/5.0",
+        metadata={"path": f"/api/v1/resources/{i}", "method": "GET"},
+        timestamp=datetime.now(),
+    )
+
+
+def legacy_path(stored, events, window):
+    """Append, slice to the window, then serialize the whole list as cache_set did"""
+    start = time.perf_counter()
+    for event in events:
+        stored.append(event)
+        if len(stored) > window:
+            stored = stored[-window:]
+        encode_record([asdict(e) for e in stored])
+    return time.perf_counter() - start
+
+
+def log_path(events, window, directory):
+    stored = deque(maxlen=window)
+    log = SegmentedEventLog(directory)
+    start = time.perf_counter()
+    for event in events:
+        stored.append(event)
+        log.append(asdict(event), event.timestamp.timestamp())
+    elapsed = time.perf_counter() - start
+    log.close()
+    return elapsed
+
+
+if __name__ == "__main__":
+    window = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    legacy_events = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    log_events = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The legacy path starts with a full window, as in steady state
+        warm = [make_event(i) for i in range(window)]
+        legacy_rate = legacy_events / legacy_path(warm, [make_event(i) for i in range(legacy_events)], window)
+
+        directory = Path(tmp) / "security_events"
+        events = [make_event(i) for i in range(log_events)]
+        log_rate = log_events / log_path(events, window, directory)
+
+        log = SegmentedEventLog(directory)
+        start = time.perf_counter()
+        records = log.recover(window)
+        recover_time = time.perf_counter() - start
+        stats = log.stats()
+
+    print(f"window {window:,} events")
+    print(f"{'path':<44}{'events/s':>12}")
+    print(f"{'list + slice + full serialization':<44}{legacy_rate:>12,.0f}")
+    print(f"{'ring buffer + segmented log append':<44}{log_rate:>12,.0f}")
+    print(f"speedup {log_rate / legacy_rate:,.0f}x")
+    print(f"recover {len(records):,} of {log_events:,} records from {stats['segments']} segments "
+          f"({stats['bytes'] / 1e6:.1f} MB): {recover_time * 1000:.1f} ms")
@@ -0,0 +1,76 @@
+import random
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from event_counters import RollingEventTotals
+
+SEVERITIES = ['low', 'medium', 'high', 'critical']
+EVENT_TYPES = ['login', 'api_request', 'data_access', 'failed_login', 'ip_blocked']
+DEDUCTIONS = {'critical': 10, 'high': 5, 'medium': 2, 'low': 0.5}
+
+
+@dataclass
+class SecurityEvent:
+    """The fields of enterprise_security_system.SecurityEvent the metrics read"""
+    event_type: str
+    severity: str
+    timestamp: datetime
+
+
+def scan_metrics(events):
+    """get_security_metrics before: filter the last 24h, then count it again per severity and type"""
+    recent_events = [e for e in events if e.timestamp > datetime.now() - timedelta(hours=24)]
+    score = 100.0
+    for event in [e for e in events if e.timestamp > datetime.now() - timedelta(hours=24)]:
+        score -= DEDUCTIONS[event.severity]
+    event_types = {}
+    for event in recent_events:
+        event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
+    return (len(recent_events), len([e for e in recent_events if e.severity == 'critical']),
+            len([e for e in recent_events if e.severity == 'high']), max(score, 0.0), event_types)
+
+
+def totals_metrics(totals):
+    now = time.time()
+    severities = totals.by_severity(now)
+    score = 100.0
+    for severity, deduction in DEDUCTIONS.items():
+        score -= severities.get(severity, 0) * deduction
+    return (sum(severities.values()), severities.get('critical', 0), severities.get('high', 0),
+            max(score, 0.0), totals.by_event_type(now))
+
+
+def time_call(fn, *args, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(*args)
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    rng = random.Random(4)
+
+    print(f"{'events':>10}{'scan (ms)':>12}{'totals (ms)':>13}{'add (us)':>10}")
+    for n in sizes:
+        # Events spread over the last 30 hours, oldest first
+        now = time.time()
+        events = deque(
+            SecurityEvent(rng.choice(EVENT_TYPES), rng.choice(SEVERITIES),
+                          datetime.fromtimestamp(now - 30 * 3600 * (1 - i / n)))
+            for i in range(n)
+        )
+        totals = RollingEventTotals()
+        start = time.perf_counter()
+        for event in events:
+            totals.add(event.severity, event.event_type, event.timestamp.timestamp())
+        add_us = (time.perf_counter() - start) / n * 1e6
+        scan_ms, _ = time_call(scan_metrics, events)
+        totals_ms, _ = time_call(totals_metrics, totals)
+        print(f"{n:>10,}{scan_ms:>12.3f}{totals_ms:>13.4f}{add_us:>10.2f}")
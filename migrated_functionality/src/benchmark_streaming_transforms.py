@@ -0,0 +1,51 @@
+import asyncio
+import copy
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np
+
+from business_intelligence_system import DataPipeline, StreamingTransformer
+
+TRANSFORMATIONS = ["calculate_returns", "add_technical_indicators", "add_ewma", "normalize"]
+
+
+def main(years, new_rows):
+    pipeline = DataPipeline()
+    loop = asyncio.new_event_loop()
+    end_date = datetime(2025, 1, 1)
+
+    print(f"{'history rows':>14}{'new rows':>10}{'full recompute (ms)':>22}{'streaming (ms)':>16}{'max abs diff':>14}")
+    for n_years in years:
+        history = loop.run_until_complete(
+            pipeline.extract_data("system_performance", end_date - timedelta(days=365 * n_years), end_date)
+        ).rename(columns={"throughput": "revenue"})
+        seen, arrived = history.iloc[:-new_rows], history.iloc[-new_rows:]
+
+        stream = StreamingTransformer(TRANSFORMATIONS)
+        stream.update(seen)
+
+        full_time = stream_time = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            full = loop.run_until_complete(pipeline.transform_data(history, TRANSFORMATIONS))
+            full_time = min(full_time, time.perf_counter() - start)
+
+            # Each repeat advances a fresh copy of the same state
+            state = copy.deepcopy(stream)
+            start = time.perf_counter()
+            emitted = state.update(arrived)
+            stream_time = min(stream_time, time.perf_counter() - start)
+
+        numeric = emitted.select_dtypes(include=[np.number]).columns
+        diff = np.nanmax(np.abs(full[numeric].to_numpy(float)[-new_rows:] - emitted[numeric].to_numpy(float)))
+        print(f"{len(history):>14,}{new_rows:>10}{full_time * 1000:>22.2f}{stream_time * 1000:>16.2f}{diff:>14.2e}")
+
+
+if __name__ == "__main__":
+    years = [int(y) for y in sys.argv[1:]] or [1, 5, 20]
+    main(years, new_rows=1)
@@ -0,0 +1,97 @@
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from task_graph import TaskGraph
+
+
+def sample_tasks(n, max_dependencies=4, seed=7):
+    """A random DAG: every task depends only on tasks created before it"""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(n):
+        deps = rng.sample(range(i), min(i, rng.randint(0, max_dependencies)))
+        tasks.append((f"task-{i}", rng.randint(1, 10), [f"task-{d}" for d in deps]))
+    return tasks
+
+
+def create_db(tasks):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE tasks (id INTEGER PRIMARY KEY, name TEXT UNIQUE, priority INTEGER, "
+        "status TEXT, dependencies TEXT)"
+    )
+    conn.execute("CREATE INDEX ix_tasks_status ON tasks (status)")
+    conn.executemany(
+        "INSERT INTO tasks (name, priority, status, dependencies) VALUES (?, ?, 'pending', ?)",
+        [(name, priority, "\x1f".join(deps)) for name, priority, deps in tasks],
+    )
+    return conn
+
+
+def legacy_schedule(conn, batch):
+    """The previous get_next_tasks: a query per dependency per pending task, then a full sort"""
+    ticks = queries = 0
+    while True:
+        pending = conn.execute("SELECT id, name, priority, dependencies FROM tasks WHERE status = 'pending'").fetchall()
+        queries += 1
+        ready = []
+        for task_id, name, priority, deps in pending:
+            met = True
+            for dep in filter(None, deps.split("\x1f")):
+                queries += 1
+                row = conn.execute("SELECT status FROM tasks WHERE name = ?", (dep,)).fetchone()
+                if not row or row[0] != "completed":
+                    met = False
+                    break
+            if met:
+                ready.append((priority, task_id, name))
+        ready.sort()
+        if not ready:
+            return ticks, queries
+        for _, task_id, _ in ready[:batch]:
+            conn.execute("UPDATE tasks SET status = 'completed' WHERE id = ?", (task_id,))
+        ticks += 1
+
+
+def graph_schedule(conn, batch):
+    """One load, then completion events drive the ready heap"""
+    rows = conn.execute("SELECT name, priority, dependencies, status, id FROM tasks").fetchall()
+    graph = TaskGraph.from_tasks(
+        (name, priority, list(filter(None, deps.split("\x1f"))), status, task_id)
+        for name, priority, deps, status, task_id in rows
+    )
+    ticks = 0
+    while True:
+        names = graph.pop_ready(batch)
+        if not names:
+            return ticks, 1
+        for name in names:
+            graph.mark_completed(name)
+        ticks += 1
+
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [200, 1_000, 2_000]
+    batch = 5
+
+    print(f"{'tasks':>8}{'ticks':>8}{'legacy (s)':>12}{'queries':>12}{'graph (ms)':>12}{'queries':>10}")
+    for n in sizes:
+        tasks = sample_tasks(n)
+
+        conn = create_db(tasks)
+        start = time.perf_counter()
+        legacy_ticks, legacy_queries = legacy_schedule(conn, batch)
+        legacy_time = time.perf_counter() - start
+
+        conn = create_db(tasks)
+        start = time.perf_counter()
+        graph_ticks, graph_queries = graph_schedule(conn, batch)
+        graph_time = time.perf_counter() - start
+
+        assert legacy_ticks == graph_ticks
+        print(f"{n:>8,}{graph_ticks:>8,}{legacy_time:>12.2f}{legacy_queries:>12,}{graph_time * 1000:>12.2f}{graph_queries:>10}")
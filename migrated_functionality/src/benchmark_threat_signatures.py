@@ -0,0 +1,100 @@
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from threat_signatures import DEFAULT_SIGNATURES, SignatureMatcher
+
+KEYWORDS = ["select", "union", "drop", "insert", "script", "onload", "exec", "passwd", "cmd", "eval",
+            "alert", "table", "sleep", "benchmark", "iframe", "base64", "system32", "xp_", "load_file"]
+PUNCTUATION = ["'", "\"", "(", ")", "<", ">", "/", "../", "=", ";", "--", " ", "%27", "*"]
+
+
+def sample_signatures(n, indicators=100, seed=7):
+    """n signatures spread over indicators, built from attack-like keywords and punctuation"""
+    rng = random.Random(seed)
+    signatures = {name: list(patterns) for name, patterns in DEFAULT_SIGNATURES.items()}
+    while sum(len(p) for p in signatures.values()) < n:
+        parts = [rng.choice(KEYWORDS + PUNCTUATION) for _ in range(rng.randint(2, 4))]
+        parts.append(''.join(rng.choices(string.ascii_lowercase, k=2)))
+        signatures.setdefault(f"indicator_{rng.randrange(indicators)}", []).append(''.join(parts))
+    return signatures
+
+
+def sample_payloads(count, size, signatures, hit_rate=0.1, seed=9):
+    """Request bodies of size characters; hit_rate of them carry a signature"""
+    rng = random.Random(seed)
+    words = KEYWORDS + ["user", "id", "name", "value", "page", "query", "true", "false", "null"]
+    flat = [p for patterns in signatures.values() for p in patterns]
+    payloads = []
+    for _ in range(count):
+        text = []
+        while sum(map(len, text)) < size:
+            text.append(f'"{rng.choice(words)}": "{rng.choice(words)}{rng.randrange(10_000)}", ')
+        payload = ''.join(text)[:size]
+        if rng.random() < hit_rate:
+            at = rng.randrange(size)
+            payload = (payload[:at] + rng.choice(flat).upper() + payload[at:])[:size]
+        payloads.append(payload)
+    return payloads
+
+
+class AnyLoops:
+    """The per-indicator any(pattern in text) loops"""
+
+    def __init__(self, signatures):
+        self.signatures = {k: [p.lower() for p in v] for k, v in signatures.items()}
+
+    def indicators_for(self, text):
+        text = text.lower()
+        return [k for k, patterns in self.signatures.items() if any(p in text for p in patterns)]
+
+
+class AlternationRegex:
+    """One regex with a named group per indicator, alternatives in signature order"""
+
+    def __init__(self, signatures):
+        self.names = {f"g{i}": name for i, name in enumerate(signatures)}
+        groups = [f"(?P<g{i}>{'|'.join(map(re.escape, (p.lower() for p in patterns)))})"
+                  for i, patterns in enumerate(signatures.values())]
+        # Lookahead so overlapping hits from different indicators are all seen
+        self.regex = re.compile(f"(?=(?:{'|'.join(groups)}))")
+        self.order = list(signatures)
+
+    def indicators_for(self, text):
+        hits = {self.names[m.lastgroup] for m in self.regex.finditer(text.lower())}
+        return [k for k in self.order if k in hits]
+
+
+def run(matcher, payloads):
+    start = time.perf_counter()
+    results = [matcher.indicators_for(p) for p in payloads]
+    return len(payloads) / (time.perf_counter() - start), results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 4096
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    signatures = sample_signatures(n)
+    payloads = sample_payloads(count, size, signatures)
+    print(f"{sum(len(p) for p in signatures.values()):,} signatures in {len(signatures)} indicators, "
+          f"{count} payloads of {size:,} bytes")
+    print(f"{'matcher':<20}{'build (ms)':>12}{'payloads/s':>12}{'ms/payload':>12}")
+    expected = None
+    for name, cls in (("any() loops", AnyLoops), ("alternation regex", AlternationRegex),
+                      ("trie regex", SignatureMatcher)):
+        start = time.perf_counter()
+        matcher = cls(signatures)
+        build = time.perf_counter() - start
+        rate, results = run(matcher, payloads)
+        # The alternation regex only reports the first alternative at each position, so it can miss hits
+        agrees = expected is None or results == expected
+        expected = expected or results
+        print(f"{name:<20}{build * 1000:>12.1f}{rate:>12,.0f}{1000 / rate:>12.3f}"
+              f"{'' if agrees else '  (misses hits)'}")
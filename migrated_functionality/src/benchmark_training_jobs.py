@@ -0,0 +1,70 @@
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np
+import pandas as pd
+
+from business_intelligence_system import DataPipeline, PredictiveAnalytics, fit_revenue_prediction
+
+
+async def probe_latency(stop, interval=0.01):
+    """Event loop lag: how late a 10 ms sleep wakes up, as a stand-in for request latency"""
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+    return np.array(lags) * 1000
+
+
+async def measure(train):
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_latency(stop))
+    # Let the probe take a few samples before training starts
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await train()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    lags = await probe
+    return elapsed, lags
+
+
+async def main(days):
+    pipeline = DataPipeline()
+    end_date = datetime(2025, 1, 1)
+    start_date = end_date - timedelta(days=days)
+    revenue = await pipeline.extract_data("revenue", start_date, end_date)
+    users = await pipeline.extract_data("user_activity", start_date, end_date)
+    data = pd.merge(revenue, users, on="date", how="inner")
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        analytics = PredictiveAnalytics(model_dir=model_dir)
+
+        async def inline():
+            # The previous behaviour: the fit runs on the event loop
+            fit_revenue_prediction(data.copy())
+
+        async def scheduled():
+            await analytics.train_revenue_prediction_model(data.copy())
+
+        # Start the worker process outside the measurement
+        await analytics.train_revenue_prediction_model(data.copy())
+
+        print(f"{days} days of history, revenue model")
+        print(f"{'training':<20}{'wall (s)':>10}{'loop lag p50 (ms)':>20}{'p99 (ms)':>10}{'max (ms)':>10}")
+        for name, train in (("inline on loop", inline), ("process pool", scheduled)):
+            elapsed, lags = await measure(train)
+            print(f"{name:<20}{elapsed:>10.2f}{np.percentile(lags, 50):>20.2f}"
+                  f"{np.percentile(lags, 99):>10.2f}{lags.max():>10.2f}")
+        analytics.scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 730))
@@ -0,0 +1,60 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from benchmark_venture_store import populate
+from venture_store import SQLiteVentureDatabase, VentureRepository
+
+
+async def timed(fn, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+async def main(per_user, users):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ventures.db")
+        user_ids = populate(path, users, per_user)
+        db = SQLiteVentureDatabase(path, pool_size=2)
+        await db.connect()
+        await db.init_schema()
+        repository = VentureRepository(db)
+
+        start = time.perf_counter()
+        await repository.ensure_portfolio_stats()
+        rebuild_time = time.perf_counter() - start
+
+        user_id = user_ids[0]
+        scratch_time, scratch = await timed(lambda: repository.analytics_from_scratch(user_id))
+        maintained_time, maintained = await timed(lambda: repository.analytics(user_id))
+        assert maintained["total_ventures"] == scratch["total_ventures"] == per_user
+        assert maintained["stage_distribution"] == scratch["stage_distribution"]
+
+        # Write cost: the summary upserts run in the same transaction as the venture write
+        async def create_and_delete():
+            venture = await repository.create(user_id, name="Bench", industry="AI", stage="MVP", funding=1.0)
+            await repository.delete(venture["id"], user_id)
+
+        write_time, _ = await timed(create_and_delete, repeat=200)
+
+        print(f"{users} users x {per_user:,} ventures; summaries built in {rebuild_time:.2f}s")
+        print(f"{'analytics':<34}{'time (ms)':>12}")
+        print(f"{'from-scratch aggregates':<34}{scratch_time * 1000:>12.2f}")
+        print(f"{'maintained summaries':<34}{maintained_time * 1000:>12.2f}")
+        print(f"{'create + delete incl. summaries':<34}{write_time * 1000:>12.2f}")
+        await db.close()
+
+
+if __name__ == "__main__":
+    per_user = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    asyncio.run(main(per_user, users))
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import numpy as np
+
+from venture_store import SQLiteVentureDatabase, VentureRepository
+
+STAGES = ["IDEA", "MVP", "GROWTH", "SCALE", "EXIT"]
+INDUSTRIES = ["AI", "Fintech", "Health", "Climate", "Education", "Retail"]
+
+
+def populate(path, users, per_user):
+    db = SQLiteVentureDatabase(path)
+    conn = sqlite3.connect(path)
+    for statement in db.SCHEMA:
+        conn.execute(statement)
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1)
+    user_ids = [str(uuid4()) for _ in range(users)]
+    rows = []
+    for user_id in user_ids:
+        for i in range(per_user):
+            created = db.encode_timestamp(start + timedelta(minutes=rng.randint(0, 500_000)))
+            valuation = rng.random() * 1e8
+            rows.append((str(uuid4()), f"Venture {i}", "Benchmark venture", rng.choice(INDUSTRIES), rng.choice(STAGES),
+                         "ACTIVE", valuation, valuation / 10, rng.randint(1, 50), '["Founder"]', "{}", user_id,
+                         created, created))
+    with conn:
+        conn.executemany("INSERT INTO ventures VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.close()
+    return user_ids
+
+
+class LegacyVentures:
+    """The previous pattern: one blocking connection used from async handlers, COUNT(*) plus OFFSET."""
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+
+    async def list_ventures(self, user_id, page, limit=20):
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM ventures WHERE user_id = ?", (user_id,))
+        total = cursor.fetchone()[0]
+        cursor.execute(
+            "SELECT * FROM ventures WHERE user_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (user_id, limit, (page - 1) * limit),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows, total
+
+
+async def run_clients(clients, requests_per_client, request):
+    latencies = []
+
+    async def client(n):
+        for i in range(requests_per_client):
+            start = time.perf_counter()
+            await request(n, i)
+            latencies.append(time.perf_counter() - start)
+
+    probe_lags = []
+    stop = asyncio.Event()
+
+    async def probe():
+        # A trivial handler sharing the loop, standing in for /health
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            probe_lags.append(time.perf_counter() - start - 0.005)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(client(n) for n in range(clients)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe_task
+    latencies = np.array(latencies) * 1000
+    return len(latencies) / elapsed, np.percentile(latencies, 50), np.percentile(latencies, 99), np.percentile(np.array(probe_lags) * 1000, 99)
+
+
+async def main(users, per_user, clients, pages):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ventures.db")
+        user_ids = populate(path, users, per_user)
+        print(f"{users} users x {per_user:,} ventures, {clients} concurrent clients, {pages} pages each")
+
+        legacy = LegacyVentures(path)
+
+        async def legacy_request(n, i):
+            await legacy.list_ventures(user_ids[n % users], page=i + 1)
+
+        db = SQLiteVentureDatabase(path, pool_size=8)
+        await db.connect()
+        repository = VentureRepository(db)
+        cursors = {}
+
+        async def pooled_request(n, i):
+            page = await repository.list_page(user_ids[n % users], 20, cursor=cursors.get(n))
+            cursors[n] = page["next_cursor"]
+
+        print(f"{'path':<36}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}{'/health p99 (ms)':>18}")
+        for name, request in (("sync cursor, COUNT + OFFSET", legacy_request), ("aiosqlite pool, keyset pages", pooled_request)):
+            throughput, p50, p99, probe_p99 = await run_clients(clients, pages, request)
+            print(f"{name:<36}{throughput:>10,.0f}{p50:>10.2f}{p99:>10.2f}{probe_p99:>18.2f}")
+
+        # A deep page: OFFSET has to skip rows, keyset seeks to the cursor
+        deep = per_user // 20 - 1
+        start = time.perf_counter()
+        await legacy.list_ventures(user_ids[0], page=deep)
+        offset_time = time.perf_counter() - start
+        cursor = None
+        for _ in range(deep - 1):
+            cursor = (await repository.list_page(user_ids[0], 20, cursor=cursor))["next_cursor"]
+        start = time.perf_counter()
+        await repository.list_page(user_ids[0], 20, cursor=cursor)
+        keyset_time = time.perf_counter() - start
+        print(f"\npage {deep}: OFFSET {offset_time * 1000:.2f} ms, keyset {keyset_time * 1000:.2f} ms")
+        await db.close()
+
+
+if __name__ == "__main__":
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    per_user = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    asyncio.run(main(users, per_user, clients=100, pages=10))
@@ -52,7 +52,7 @@ from src.utils import (
 )
 
 from src.base.multistep_agent import MultiStepAgent, PromptTemplates, populate_template, ActionOutput
-from src.models import Model, ChatMessageStreamDelta, agglomerate_stream_deltas, CODEAGENT_RESPONSE_FORMAT
+from src.models import Model, ChatMessageStreamDelta, StreamDeltaAccumulator, CODEAGENT_RESPONSE_FORMAT
 
 from src.logger import YELLOW_HEX
 
@@ -187,15 +187,13 @@ class CodeAgent(MultiStepAgent):
                     stop_sequences=["<end_code>", "Observation:", "Calling tools:"],
                     **additional_args,
                 )
-                chat_message_stream_deltas: list[ChatMessageStreamDelta] = []
+                stream_accumulator = StreamDeltaAccumulator()
                 with Live("", console=self.logger.console, vertical_overflow="visible") as live:
                     for event in output_stream:
-                        chat_message_stream_deltas.append(event)
-                        live.update(
-                            Markdown(agglomerate_stream_deltas(chat_message_stream_deltas).render_as_markdown())
-                        )
+                        stream_accumulator.add(event)
+                        live.update(Markdown(stream_accumulator.to_chat_message().render_as_markdown()))
                         yield event
-                chat_message = agglomerate_stream_deltas(chat_message_stream_deltas)
+                chat_message = stream_accumulator.to_chat_message()
                 memory_step.model_output_message = chat_message
                 output_text = chat_message.content
             else:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import json5
 import re
@@ -86,6 +87,8 @@ class ResearchContext(BaseModel):
     visited_urls: Set[str] = Field(default_factory=set, description="URLs visited during research")
     current_depth: int = Field(default=0, description="Current depth of research exploration", ge=0)
     max_depth: int = Field(default=2, description="Maximum depth of research to reach", ge=1)
+    explored_queries: Set[str] = Field(default_factory=set, description="Normalized queries already researched")
+    level_timings: List[float] = Field(default_factory=list, description="Seconds spent expanding each depth level")
 
 class ResearchSummary(BaseModel):
     """Comprehensive summary of deep research results."""
@@ -252,6 +255,8 @@ class DeepResearcherTool(AsyncTool):
                  max_insights: int = 20,
                  time_limit_seconds: int = 120,
                  max_follow_ups: int = 3,
+                 max_branching: int = 2,
+                 max_concurrency: int = 4,
                  **kwargs):
 
         super(DeepResearcherTool, self).__init__()
@@ -261,6 +266,8 @@ class DeepResearcherTool(AsyncTool):
         self.max_insights = max_insights
         self.time_limit_seconds = time_limit_seconds
         self.max_follow_ups = max_follow_ups
+        self.max_branching = max_branching
+        self.max_concurrency = max(1, max_concurrency)
 
         self.model = model_manager.registed_models[self.model_id]
         self.web_searcher = WebSearcherTool()
@@ -351,6 +358,11 @@ class DeepResearcherTool(AsyncTool):
             logger.error(res)
             return query, None
 
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a query so that trivially different follow-ups are explored only once."""
+        return " ".join(query.lower().split())
+
     async def _research_graph(
         self,
         context: ResearchContext,
@@ -358,56 +370,96 @@ class DeepResearcherTool(AsyncTool):
         filter_year: Optional[int] = None,
         deadline: Optional[float] = None,
     ) -> None:
-        """Run a complete research cycle (search, analyze, generate follow-ups)."""
-        # Check termination conditions
-        if time.time() >= deadline or context.current_depth >= context.max_depth:
-            return
+        """Run the research breadth-first, expanding every query of a depth level concurrently."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        context.explored_queries.add(self._normalize_query(query))
+        frontier = [query]
+
+        while frontier and context.current_depth < context.max_depth and time.time() < deadline:
+            level_start = time.time()
+            logger.info(f"DeepResearchTool Research level {context.current_depth + 1} - Queries: {frontier}")
+
+            results = await asyncio.gather(
+                *[
+                    self._research_node(context, frontier_query, filter_year, deadline, semaphore)
+                    for frontier_query in frontier
+                ],
+                return_exceptions=True,
+            )
 
-        logger.info(f"DeepResearchTool Research cycle at depth {context.current_depth + 1} - Query: {query}")
+            next_frontier = []
+            level_has_insights = False
+            for frontier_query, result in zip(frontier, results):
+                if isinstance(result, Exception):
+                    logger.error(f"DeepResearchTool research cycle failed for query '{frontier_query}': {str(result)}")
+                    continue
+                if result is None:
+                    continue
+                level_has_insights = True
+                for follow_up in result[:self.max_branching]:  # Limit branching factor
+                    normalized = self._normalize_query(follow_up)
+                    if normalized in context.explored_queries:
+                        continue
+                    context.explored_queries.add(normalized)
+                    next_frontier.append(follow_up)
+
+            level_time = time.time() - level_start
+            context.level_timings.append(level_time)
+            logger.info(
+                f"DeepResearchTool Research level {context.current_depth + 1} finished in {level_time:.2f}s "
+                f"({len(frontier)} queries, {len(next_frontier)} follow-ups)"
+            )
 
-        # 1. Web search
-        search_results = await self._search_web(query, filter_year)
+            if not level_has_insights:
+                return
 
-        if not search_results:
-            return
+            # Update depth and proceed to next level
+            context.current_depth += 1
+            frontier = next_frontier
 
-        # 2. Extract insights
-        new_insights = await self._extract_insights(
-            context,
-            search_results,
-            context.query,
-            deadline
-        )
+    async def _research_node(
+        self,
+        context: ResearchContext,
+        query: str,
+        filter_year: Optional[int],
+        deadline: float,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[List[str]]:
+        """Run one research cycle (search, analyze, generate follow-ups).
+
+        Returns the follow-up queries, or None when the cycle produced no insights.
+        """
+        async with semaphore:
+            # Check the deadline again: the task may have waited for a slot
+            if time.time() >= deadline:
+                return None
+
+            # 1. Web search
+            search_results = await self._search_web(query, filter_year)
+
+            if not search_results:
+                return None
+
+            # 2. Extract insights
+            new_insights = await self._extract_insights(
+                context,
+                search_results,
+                context.query,
+                deadline
+            )
 
-        if not new_insights:
-            return
+            if not new_insights:
+                return None
 
-        # 3. Generate follow-up queries
-        follow_up_queries = await self._generate_follow_ups(
-            new_insights,
-            query,
-            context.query
-        )
-        context.follow_up_queries.extend(follow_up_queries)
-
-        # Update depth and proceed to next level
-        context.current_depth += 1
-
-        # 4. Continue research with follow-up queries
-        if follow_up_queries and context.current_depth < context.max_depth:
-            tasks = []  # Create a list to hold the tasks
-            for follow_up in follow_up_queries[:2]:  # Limit branching factor
-                if time.time() >= deadline:
-                    break
-
-                # Create a coroutine for the recursive research call
-                task = await self._research_graph(
-                    context=context,
-                    query=follow_up,
-                    filter_year=filter_year,
-                    deadline=deadline,
-                )
-                tasks.append(task)  # Add the task to the list
+            # 3. Generate follow-up queries
+            follow_up_queries = await self._generate_follow_ups(
+                new_insights,
+                query,
+                context.query
+            )
+            context.follow_up_queries.extend(follow_up_queries)
+
+            return follow_up_queries
 
     async def _search_web(self,
                     query: str,
@@ -12,8 +12,11 @@ import os
 import hashlib
 import secrets
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from itertools import islice
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
 import json
 import jwt
@@ -23,13 +26,30 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Only needed for threat counters shared between workers
+    aioredis = None
+
 # Import shared library components
 from shared.core.base_manager import BaseManager, DatabaseManager
 from shared.core.security import SecurityManager, User, get_current_user
 from shared.core.config import get_config, get_service_config
 
+from audit_writer import AuditWriter
+from event_counters import RedisWindowCounters, RollingEventTotals, SlidingWindowCounters
+from security_event_log import SegmentedEventLog
+from threat_signatures import load_signature_matcher
+
 logger = logging.getLogger(__name__)
 
+# Hot windows kept in memory; older records stay in the on-disk event logs
+SECURITY_EVENT_WINDOW = 10000
+AUDIT_LOG_WINDOW = 50000
+
+# Security score points deducted per event in the last 24h
+SEVERITY_DEDUCTIONS = {'critical': 10, 'high': 5, 'medium': 2, 'low': 0.5}
+
 @dataclass
 class SecurityEvent:
     """Security event model"""
@@ -83,6 +103,16 @@ class AuditLog:
     timestamp: datetime
     success: bool
 
+def _security_event_from_record(record: Dict[str, Any]) -> SecurityEvent:
+    return SecurityEvent(**{**record, 'timestamp': datetime.fromisoformat(record['timestamp'])})
+
+def _audit_log_from_record(record: Dict[str, Any]) -> AuditLog:
+    return AuditLog(**{**record, 'timestamp': datetime.fromisoformat(record['timestamp'])})
+
+def recent_entries(entries: Deque, limit: int) -> List:
+    """The newest limit entries of a ring buffer, oldest first"""
+    return list(islice(reversed(entries), limit))[::-1]
+
 class EncryptionManager:
     """Enterprise-grade encryption manager"""
     
@@ -143,8 +173,9 @@ class EncryptionManager:
 class ThreatDetectionEngine:
     """Advanced threat detection engine"""
     
-    def __init__(self):
-        self.threat_patterns = {}
+    def __init__(self, shared_counters: Optional[RedisWindowCounters] = None):
+        # Signatures compiled into one matcher; THREAT_SIGNATURES_FILE replaces the built-in set
+        self.threat_patterns = load_signature_matcher(os.getenv('THREAT_SIGNATURES_FILE'))
         self.behavioral_baselines = {}
         self.anomaly_thresholds = {
             'login_frequency': 10,  # logins per minute
@@ -152,6 +183,12 @@ class ThreatDetectionEngine:
             'data_access': 50,      # data access operations per minute
             'failed_attempts': 5    # failed attempts per hour
         }
+        # Sliding-window counts per (ip, event_type) and (user_id, event_type)
+        self.event_counters = SlidingWindowCounters(
+            max_keys=int(os.getenv('THREAT_COUNTER_MAX_KEYS', '100000'))
+        )
+        # When set, counts come from Redis so every API worker sees the same numbers
+        self.shared_counters = shared_counters
     
     async def analyze_event(self, event: SecurityEvent) -> Dict[str, Any]:
         """Analyze security event for threats"""
@@ -193,22 +230,8 @@ class ThreatDetectionEngine:
     
     async def _check_threat_patterns(self, event: SecurityEvent) -> List[str]:
         """Check for known threat patterns"""
-        indicators = []
-        
-        # SQL Injection patterns
-        sql_patterns = ['union select', 'drop table', 'insert into', 'delete from', 'update set']
-        if any(pattern in event.description.lower() for pattern in sql_patterns):
-            indicators.append('sql_injection_attempt')
-        
-        # XSS patterns
-        xss_patterns = ['<script>', 'javascript:', 'onerror=', 'onload=']
-        if any(pattern in event.description.lower() for pattern in xss_patterns):
-            indicators.append('xss_attempt')
-        
-        # Path traversal patterns
-        path_patterns = ['../', '..\\', '/etc/passwd', 'windows/system32']
-        if any(pattern in event.description.lower() for pattern in path_patterns):
-            indicators.append('path_traversal_attempt')
+        # SQL injection, XSS, path traversal and any configured signatures in one pass
+        indicators = self.threat_patterns.indicators_for(event.description)
         
         # Brute force patterns
         if event.event_type == 'failed_login' and event.metadata.get('attempt_count', 0) > 5:
@@ -220,6 +243,9 @@ class ThreatDetectionEngine:
         """Check for behavioral anomalies"""
         indicators = []
         
+        # Count this event before checking the windows it falls in
+        await self._record_event(event)
+        
         # Check login frequency
         if event.event_type == 'login':
             recent_logins = await self._count_recent_events(event.ip_address, 'login', minutes=1)
@@ -232,6 +258,20 @@ class ThreatDetectionEngine:
             if recent_requests > self.anomaly_thresholds['request_rate']:
                 indicators.append('high_request_rate')
         
+        # Check data access rate
+        if event.event_type == 'data_access':
+            recent_access = await self._count_recent_events(event.ip_address, 'data_access', minutes=1,
+                                                            user_id=event.user_id)
+            if recent_access > self.anomaly_thresholds['data_access']:
+                indicators.append('high_data_access_rate')
+        
+        # Check failed attempts
+        if event.event_type == 'failed_login':
+            recent_failures = await self._count_recent_events(event.ip_address, 'failed_login', minutes=60,
+                                                              user_id=event.user_id)
+            if recent_failures > self.anomaly_thresholds['failed_attempts']:
+                indicators.append('repeated_failed_attempts')
+        
         # Check for unusual time access
         hour = event.timestamp.hour
         if hour < 6 or hour > 22:  # Unusual hours
@@ -243,11 +283,45 @@ class ThreatDetectionEngine:
         
         return {'indicators': indicators}
     
-    async def _count_recent_events(self, ip_address: str, event_type: str, minutes: int) -> int:
-        """Count recent events for anomaly detection"""
-        # This would typically query a time-series database
-        # For now, return a mock count
-        return 0
+    @staticmethod
+    def _counter_keys(ip_address: Optional[str], user_id: Optional[str], event_type: str) -> List[tuple]:
+        keys = []
+        if ip_address:
+            keys.append(('ip', ip_address, event_type))
+        if user_id:
+            keys.append(('user', user_id, event_type))
+        return keys
+    
+    async def _record_event(self, event: SecurityEvent):
+        """Add an event to the sliding-window counters"""
+        keys = self._counter_keys(event.ip_address, event.user_id, event.event_type)
+        if not keys:
+            return
+        
+        now = event.timestamp.timestamp()
+        self.event_counters.add(keys, now)
+        if self.shared_counters:
+            try:
+                await self.shared_counters.add(keys, now)
+            except Exception as e:
+                logger.warning(f"⚠️ Shared event counters unavailable, using local counts: {e}")
+    
+    async def _count_recent_events(self, ip_address: Optional[str], event_type: str, minutes: int,
+                                   user_id: Optional[str] = None) -> int:
+        """Count recent events for anomaly detection, the higher of the IP and user counts"""
+        keys = self._counter_keys(ip_address, user_id, event_type)
+        if not keys:
+            return 0
+        
+        seconds = minutes * 60
+        now = time.time()
+        if self.shared_counters:
+            try:
+                return max([await self.shared_counters.count(key, seconds, now) for key in keys])
+            except Exception as e:
+                logger.warning(f"⚠️ Shared event counters unavailable, using local counts: {e}")
+        
+        return max(self.event_counters.count(key, seconds, now) for key in keys)
     
     def _is_suspicious_ip(self, ip_address: str) -> bool:
         """Check if IP address is suspicious"""
@@ -279,6 +353,8 @@ class ThreatDetectionEngine:
             'brute_force_attempt': 0.2,
             'high_login_frequency': 0.1,
             'high_request_rate': 0.1,
+            'high_data_access_rate': 0.1,
+            'repeated_failed_attempts': 0.2,
             'unusual_access_time': 0.1,
             'suspicious_ip_address': 0.2
         }
@@ -305,7 +381,8 @@ class ThreatDetectionEngine:
             recommendations.append('Implement output encoding')
             recommendations.append('Set Content Security Policy headers')
         
-        if 'brute_force_attempt' in analysis['indicators']:
+        if ('brute_force_attempt' in analysis['indicators']
+                or 'repeated_failed_attempts' in analysis['indicators']):
             recommendations.append('Implement account lockout policy')
             recommendations.append('Add CAPTCHA for login attempts')
         
@@ -321,14 +398,37 @@ class EnterpriseSecurityManager(BaseManager):
     def __init__(self):
         super().__init__("enterprise_security", get_config().to_dict())
         self.encryption = EncryptionManager()
-        self.threat_engine = ThreatDetectionEngine()
-        self.security_events = []
-        self.audit_logs = []
+        self.threat_engine = ThreatDetectionEngine(self._create_shared_counters())
+        self.security_events: Deque[SecurityEvent] = deque(maxlen=SECURITY_EVENT_WINDOW)
+        self.audit_logs: Deque[AuditLog] = deque(maxlen=AUDIT_LOG_WINDOW)
+        # 24h counts by (severity, event_type) in minute buckets, so metrics never scan the events
+        self.event_totals = RollingEventTotals(window_seconds=24 * 3600)
+        log_dir = Path(os.getenv('SECURITY_LOG_DIR', 'security_logs'))
+        self.event_log = SegmentedEventLog(log_dir / 'security_events')
+        self.audit_log = SegmentedEventLog(log_dir / 'audit_logs')
+        # Audit records are queued by callers and written in batches off the request path
+        self.audit_writer = AuditWriter(
+            self._write_audit_batch,
+            max_queue=int(os.getenv('AUDIT_QUEUE_SIZE', '10000')),
+            batch_size=int(os.getenv('AUDIT_BATCH_SIZE', '100')),
+            flush_interval=float(os.getenv('AUDIT_FLUSH_INTERVAL', '0.5')),
+            policy=os.getenv('AUDIT_QUEUE_POLICY', 'block')
+        )
         self.threat_intelligence = {}
         self.security_policies = {}
         self.blocked_ips = set()
         self.suspicious_users = set()
         
+    def _create_shared_counters(self) -> Optional[RedisWindowCounters]:
+        """Redis-backed threat counters when THREAT_COUNTER_REDIS_URL is set"""
+        redis_url = os.getenv('THREAT_COUNTER_REDIS_URL')
+        if not redis_url:
+            return None
+        if aioredis is None:
+            self.logger.warning("⚠️ THREAT_COUNTER_REDIS_URL is set but redis is not installed, using local counters")
+            return None
+        return RedisWindowCounters(aioredis.from_url(redis_url))
+    
     async def initialize(self) -> bool:
         """Initialize enterprise security system"""
         try:
@@ -337,6 +437,9 @@ class EnterpriseSecurityManager(BaseManager):
             # Load existing data
             await self._load_security_data()
             
+            # Start the background audit writer
+            await self.audit_writer.start()
+            
             # Initialize security policies
             await self._initialize_security_policies()
             
@@ -350,14 +453,21 @@ class EnterpriseSecurityManager(BaseManager):
     async def _load_security_data(self):
         """Load existing security data"""
         try:
-            # Load from cache
-            events_data = await self.cache_get("security_events")
-            if events_data:
-                self.security_events = events_data
+            # Refill the hot windows from the tail segments of the event logs
+            events_data = await asyncio.to_thread(self.event_log.recover, SECURITY_EVENT_WINDOW)
+            self.security_events.extend(_security_event_from_record(r) for r in events_data)
             
-            audit_data = await self.cache_get("audit_logs")
-            if audit_data:
-                self.audit_logs = audit_data
+            # The rolling totals cover the whole day, including events older than the window above
+            day_data = await asyncio.to_thread(lambda: list(self.event_log.read_since(time.time() - 24 * 3600)))
+            for record in day_data:
+                timestamp = datetime.fromisoformat(record['timestamp']).timestamp()
+                self.event_totals.add(record['severity'], record['event_type'], timestamp)
+            
+            audit_data = await asyncio.to_thread(self.audit_log.recover, AUDIT_LOG_WINDOW)
+            self.audit_logs.extend(_audit_log_from_record(r) for r in audit_data)
+            
+            self.logger.info(f"✅ Recovered {len(self.security_events)} security events "
+                             f"and {len(self.audit_logs)} audit logs")
             
             policies_data = await self.cache_get("security_policies")
             if policies_data:
@@ -445,15 +555,10 @@ class EnterpriseSecurityManager(BaseManager):
             threat_analysis = await self.threat_engine.analyze_event(event)
             event.severity = threat_analysis['threat_level']
             
-            # Store event
+            # Store event: the ring buffer drops the oldest, the log gets only this record
             self.security_events.append(event)
-            
-            # Keep only last 10000 events
-            if len(self.security_events) > 10000:
-                self.security_events = self.security_events[-10000:]
-            
-            # Cache events
-            await self.cache_set("security_events", self.security_events)
+            self.event_log.append(asdict(event), event.timestamp.timestamp())
+            self.event_totals.add(event.severity, event.event_type, event.timestamp.timestamp())
             
             # Log metrics
             await self.log_metric("security_events", 1)
@@ -525,7 +630,7 @@ class EnterpriseSecurityManager(BaseManager):
     async def log_audit_event(self, user_id: str, action: str, resource: str,
                             details: Dict[str, Any], ip_address: str = None,
                             user_agent: str = None, success: bool = True):
-        """Log audit event"""
+        """Queue an audit event for the background writer"""
         try:
             log_id = f"audit_{int(time.time())}"
             
@@ -541,25 +646,25 @@ class EnterpriseSecurityManager(BaseManager):
                 success=success
             )
             
-            # Store audit log
-            self.audit_logs.append(audit_log)
-            
-            # Keep only last 50000 audit logs
-            if len(self.audit_logs) > 50000:
-                self.audit_logs = self.audit_logs[-50000:]
-            
-            # Cache audit logs
-            await self.cache_set("audit_logs", self.audit_logs)
-            
-            # Log metrics
-            await self.log_metric("audit_events", 1)
-            
-            self.logger.info(f"✅ Audit event logged: {log_id}")
+            await self.audit_writer.submit(audit_log)
             
         except Exception as e:
             self.logger.error(f"❌ Failed to log audit event: {e}")
             raise
     
+    async def _write_audit_batch(self, batch: List[AuditLog]):
+        """Store a batch of audit logs: ring buffer, then one log write off the event loop"""
+        self.audit_logs.extend(batch)
+        await asyncio.to_thread(
+            self.audit_log.append_many,
+            ((vars(audit_log), audit_log.timestamp.timestamp()) for audit_log in batch)
+        )
+        
+        # Log metrics
+        await self.log_metric("audit_events", len(batch))
+        
+        self.logger.debug(f"✅ Audit batch written: {len(batch)} events")
+    
     async def encrypt_sensitive_data(self, data: str) -> str:
         """Encrypt sensitive data"""
         return self.encryption.encrypt(data)
@@ -623,26 +728,23 @@ class EnterpriseSecurityManager(BaseManager):
     async def get_security_metrics(self) -> Dict[str, Any]:
         """Get security metrics"""
         try:
-            # Calculate metrics from recent events
-            recent_events = [e for e in self.security_events 
-                           if e.timestamp > datetime.now() - timedelta(hours=24)]
+            # Calculate metrics from the rolling 24h totals
+            now = time.time()
+            severities = self.event_totals.by_severity(now)
             
             metrics = {
-                'total_events_24h': len(recent_events),
-                'critical_events_24h': len([e for e in recent_events if e.severity == 'critical']),
-                'high_events_24h': len([e for e in recent_events if e.severity == 'high']),
+                'total_events_24h': sum(severities.values()),
+                'critical_events_24h': severities.get('critical', 0),
+                'high_events_24h': severities.get('high', 0),
                 'blocked_ips': len(self.blocked_ips),
                 'suspicious_users': len(self.suspicious_users),
                 'active_policies': len([p for p in self.security_policies.values() if p.active]),
                 'total_audit_logs': len(self.audit_logs),
-                'security_score': self._calculate_security_score()
+                'security_score': self._calculate_security_score(severities)
             }
             
             # Event type breakdown
-            event_types = {}
-            for event in recent_events:
-                event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
-            metrics['event_types'] = event_types
+            metrics['event_types'] = self.event_totals.by_event_type(now)
             
             return metrics
             
@@ -650,25 +752,17 @@ class EnterpriseSecurityManager(BaseManager):
             self.logger.error(f"❌ Failed to get security metrics: {e}")
             raise
     
-    def _calculate_security_score(self) -> float:
+    def _calculate_security_score(self, severities: Optional[Dict[str, int]] = None) -> float:
         """Calculate overall security score (0-100)"""
         try:
             # Base score
             score = 100.0
             
-            # Deduct points for security events
-            recent_events = [e for e in self.security_events 
-                           if e.timestamp > datetime.now() - timedelta(hours=24)]
-            
-            for event in recent_events:
-                if event.severity == 'critical':
-                    score -= 10
-                elif event.severity == 'high':
-                    score -= 5
-                elif event.severity == 'medium':
-                    score -= 2
-                elif event.severity == 'low':
-                    score -= 0.5
+            # Deduct points for security events in the last 24h
+            if severities is None:
+                severities = self.event_totals.by_severity()
+            for severity, deduction in SEVERITY_DEDUCTIONS.items():
+                score -= severities.get(severity, 0) * deduction
             
             # Deduct points for blocked IPs and suspicious users
             score -= len(self.blocked_ips) * 2
@@ -692,6 +786,12 @@ class EnterpriseSecurityManager(BaseManager):
                     'audit_logging': 'healthy',
                     'policy_enforcement': 'healthy'
                 },
+                'event_logs': {
+                    'security_events': self.event_log.stats(),
+                    'audit_logs': self.audit_log.stats()
+                },
+                'audit_writer': self.audit_writer.stats(),
+                'threat_counters': self.threat_engine.event_counters.stats(),
                 'metrics': {
                     'security_score': self._calculate_security_score(),
                     'active_policies': len(self.security_policies),
@@ -708,6 +808,22 @@ class EnterpriseSecurityManager(BaseManager):
                 'components': {},
                 'metrics': {}
             }
+    
+    async def shutdown(self) -> bool:
+        """Shutdown security system"""
+        try:
+            # Flush queued audit records before the log is closed
+            await self.audit_writer.stop()
+            self.event_log.close()
+            self.audit_log.close()
+            await super().shutdown()
+            
+            self.logger.info("✅ Enterprise Security System shutdown")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"❌ Security system shutdown failed: {e}")
+            return False
 
 # FastAPI application
 from fastapi import FastAPI, HTTPException, Depends, Request, Response
@@ -774,7 +890,7 @@ async def security_middleware(request: Request, call_next):
     # Process request
     response = await call_next(request)
     
-    # Log request
+    # Queue the audit record; the background writer batches it to the audit log
     processing_time = time.time() - start_time
     
     await security_manager.log_audit_event(
@@ -860,13 +976,13 @@ async def get_security_metrics():
 @app.get("/events")
 async def get_security_events(limit: int = 100):
     """Get recent security events"""
-    events = security_manager.security_events[-limit:]
+    events = recent_entries(security_manager.security_events, limit)
     return {"events": [asdict(event) for event in events]}
 
 @app.get("/audit-logs")
 async def get_audit_logs(limit: int = 100):
     """Get recent audit logs"""
-    logs = security_manager.audit_logs[-limit:]
+    logs = recent_entries(security_manager.audit_logs, limit)
     return {"audit_logs": [asdict(log) for log in logs]}
 
 @app.get("/policies")
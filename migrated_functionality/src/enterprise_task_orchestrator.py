@@ -36,6 +36,8 @@ import sentry_sdk
 from sentry_sdk.integrations.asyncio import AsyncioIntegration
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
+from task_graph import TaskCycleError, TaskGraph
+
 # Configure structured logging with correlation IDs
 structlog.configure(
     processors=[
@@ -569,8 +571,9 @@ class CompletionEngineFactory:
 class TaskOrchestrator:
     """Main orchestrator for autonomous task management with enterprise-grade practices"""
     
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, max_concurrent_tasks: int = 3):
         self.base_path = base_path
+        self.max_concurrent_tasks = max_concurrent_tasks
         self.db_path = base_path / "task_orchestration.db"
         self.engine = create_engine(f'sqlite:///{self.db_path}', echo=False)
         Base.metadata.create_all(self.engine)
@@ -598,6 +601,9 @@ class TaskOrchestrator:
         # Task definitions with proper validation
         self.task_definitions = self._load_task_definitions()
         
+        # Dependency graph of the tasks table, loaded by initialize_tasks
+        self.task_graph: Optional[TaskGraph] = None
+        
         # Initialize context
         self.context = OrchestrationContext(base_path, self.engine, self.docker_client)
         
@@ -641,6 +647,16 @@ class TaskOrchestrator:
                            error=str(e))
                 raise
         
+        # Reject dependency cycles before anything reaches the database
+        try:
+            TaskGraph.from_tasks(
+                (d.name, d.priority.value, d.dependencies, TaskStatus.PENDING.value, i)
+                for i, d in enumerate(definitions)
+            )
+        except TaskCycleError as e:
+            logger.error("Task definitions contain a dependency cycle", cycle=e.cycle)
+            raise
+        
         return definitions
     
     @lru_cache(maxsize=128)
@@ -654,7 +670,7 @@ class TaskOrchestrator:
         logger.info("Initializing task orchestration system")
         
         try:
-            with database_session(self.engine) as session:
+            async with database_session(self.engine) as session:
                 for task_def in self.task_definitions:
                     existing_task = session.query(Task).filter_by(name=task_def.name).first()
                     
@@ -674,6 +690,8 @@ class TaskOrchestrator:
                         )
                         session.add(task)
             
+            await self.load_task_graph()
+            
             logger.info("Task initialization completed", 
                        task_count=len(self.task_definitions))
             
@@ -681,40 +699,56 @@ class TaskOrchestrator:
             logger.error("Task initialization failed", error=str(e))
             raise
     
+    async def load_task_graph(self) -> TaskGraph:
+        """Build the dependency graph from the tasks table in one query"""
+        async with database_session(self.engine) as session:
+            rows = session.query(
+                Task.name, Task.priority, Task.dependencies, Task.status, Task.id
+            ).all()
+        
+        try:
+            self.task_graph = TaskGraph.from_tasks(rows)
+        except TaskCycleError as e:
+            logger.error("Task dependency cycle detected", cycle=e.cycle)
+            raise
+        
+        for task_name, missing in self.task_graph.missing_dependencies().items():
+            logger.warning("Task depends on unknown tasks", task_name=task_name, missing=missing)
+        
+        logger.info("Task graph loaded", 
+                   task_count=len(self.task_graph), 
+                   ready_count=self.task_graph.ready_count)
+        return self.task_graph
+    
+    async def _get_tasks_by_name(self, names: List[str]) -> List[Task]:
+        """Load tasks detached from the session, in the order given"""
+        if not names:
+            return []
+        
+        async with database_session(self.engine) as session:
+            tasks = session.query(Task).filter(Task.name.in_(names)).all()
+            session.expunge_all()
+        
+        by_name = {task.name: task for task in tasks}
+        return [by_name[name] for name in names if name in by_name]
+    
+    async def _save_task(self, task: Task) -> None:
+        """Persist changes made to a detached task"""
+        async with database_session(self.engine) as session:
+            session.merge(task)
+    
     async def get_next_tasks(self, limit: int = 5) -> List[Task]:
-        """Get next tasks to be completed with proper dependency resolution"""
+        """Get the highest priority tasks whose dependencies are complete"""
         try:
-            with database_session(self.engine) as session:
-                pending_tasks = session.query(Task).filter_by(
-                    status=TaskStatus.PENDING.value
-                ).all()
-                
-                # Filter by dependencies
-                ready_tasks = []
-                for task in pending_tasks:
-                    if await self._are_dependencies_met(task, session):
-                        ready_tasks.append(task)
-                
-                # Sort by priority and return top tasks
-                ready_tasks.sort(key=lambda x: x.priority)
-                return ready_tasks[:limit]
+            if self.task_graph is None:
+                await self.load_task_graph()
+            
+            return await self._get_tasks_by_name(self.task_graph.peek_ready(limit))
                 
         except Exception as e:
             logger.error("Failed to get next tasks", error=str(e))
             return []
     
-    async def _are_dependencies_met(self, task: Task, session) -> bool:
-        """Check if all dependencies for a task are met"""
-        if not task.dependencies:
-            return True
-        
-        for dep_name in task.dependencies:
-            dep_task = session.query(Task).filter_by(name=dep_name).first()
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED.value:
-                return False
-        
-        return True
-    
     @monitor_task_execution
     async def auto_complete_task(self, task: Task) -> bool:
         """Automatically complete a task using the appropriate engine"""
@@ -726,10 +760,9 @@ class TaskOrchestrator:
         
         try:
             # Update task status
-            with database_session(self.engine) as session:
-                task.status = TaskStatus.IN_PROGRESS.value
-                task.updated_at = datetime.utcnow()
-                session.commit()
+            task.status = TaskStatus.IN_PROGRESS.value
+            task.updated_at = datetime.utcnow()
+            await self._save_task(task)
             
             # Get the appropriate completion engine
             category = TaskCategory(task.category)
@@ -747,12 +780,12 @@ class TaskOrchestrator:
                 verification_passed = await engine.verify_completion(task, self.context)
                 
                 if verification_passed:
-                    with database_session(self.engine) as session:
-                        task.status = TaskStatus.COMPLETED.value
-                        task.completed_at = datetime.utcnow()
-                        task.verification_status = VerificationStatus.PASSED.value
-                        task.alignment_score = await self._calculate_alignment_score(task)
-                        session.commit()
+                    task.status = TaskStatus.COMPLETED.value
+                    task.completed_at = datetime.utcnow()
+                    task.verification_status = VerificationStatus.PASSED.value
+                    task.alignment_score = await self._calculate_alignment_score(task)
+                    await self._save_task(task)
+                    self._record_task_event(task)
                     
                     TASK_ALIGNMENT_SCORE.labels(task_name=task.name).set(task.alignment_score)
                     logger.info("Task completed and verified", 
@@ -760,18 +793,18 @@ class TaskOrchestrator:
                               task_name=task.name,
                               alignment_score=task.alignment_score)
                 else:
-                    with database_session(self.engine) as session:
-                        task.status = TaskStatus.FAILED.value
-                        task.verification_status = VerificationStatus.FAILED.value
-                        session.commit()
+                    task.status = TaskStatus.FAILED.value
+                    task.verification_status = VerificationStatus.FAILED.value
+                    await self._save_task(task)
+                    self._record_task_event(task)
                     
                     logger.error("Task completion verification failed", 
                                task_id=task.id, 
                                task_name=task.name)
             else:
-                with database_session(self.engine) as session:
-                    task.status = TaskStatus.FAILED.value
-                    session.commit()
+                task.status = TaskStatus.FAILED.value
+                await self._save_task(task)
+                self._record_task_event(task)
                 
                 logger.error("Task auto-completion failed", 
                            task_id=task.id, 
@@ -785,12 +818,24 @@ class TaskOrchestrator:
                         task_name=task.name, 
                         error=str(e))
             
-            with database_session(self.engine) as session:
-                task.status = TaskStatus.FAILED.value
-                session.commit()
+            task.status = TaskStatus.FAILED.value
+            self._record_task_event(task)
+            await self._save_task(task)
             
             return False
     
+    def _record_task_event(self, task: Task) -> None:
+        """Feed a completion or failure into the dependency graph"""
+        if self.task_graph is None or task.name not in self.task_graph:
+            return
+        
+        if task.status == TaskStatus.COMPLETED.value:
+            newly_ready = self.task_graph.mark_completed(task.name)
+            if newly_ready:
+                logger.info("Dependencies met", task_name=task.name, ready_tasks=newly_ready)
+        elif task.status == TaskStatus.FAILED.value:
+            self.task_graph.mark_failed(task.name)
+    
     async def _calculate_alignment_score(self, task: Task) -> int:
         """Calculate alignment score for a completed task"""
         score = 0
@@ -862,35 +907,49 @@ class TaskOrchestrator:
             return {}
     
     async def run_autonomous_orchestration(self) -> None:
-        """Run the autonomous orchestration process with proper error handling"""
-        logger.info("Starting autonomous task orchestration")
+        """Run ready tasks concurrently, up to max_concurrent_tasks, as dependencies complete"""
+        logger.info("Starting autonomous task orchestration", 
+                   max_concurrent_tasks=self.max_concurrent_tasks)
         
+        running: Dict[asyncio.Task, Task] = {}
         try:
+            if self.task_graph is None:
+                await self.load_task_graph()
+            
             while True:
-                # Get next tasks to complete
-                next_tasks = await self.get_next_tasks(3)
+                # Claim ready tasks for every free slot
+                while len(running) < self.max_concurrent_tasks:
+                    names = self.task_graph.pop_ready(self.max_concurrent_tasks - len(running))
+                    if not names:
+                        break
+                    
+                    for task in await self._get_tasks_by_name(names):
+                        if task.auto_completable:
+                            logger.info("Processing task", 
+                                      task_id=task.id, 
+                                      task_name=task.name, 
+                                      priority=task.priority)
+                            running[asyncio.create_task(self.auto_complete_task(task))] = task
+                        else:
+                            # Stays claimed so it is not handed out again
+                            logger.info("Task requires manual intervention", 
+                                      task_id=task.id, 
+                                      task_name=task.name)
                 
-                if not next_tasks:
+                if not running:
                     logger.info("No more tasks to complete. Orchestration complete!")
                     break
                 
-                # Process each task
-                for task in next_tasks:
-                    logger.info("Processing task", 
-                              task_id=task.id, 
-                              task_name=task.name, 
-                              priority=task.priority)
-                    
-                    # Auto-complete if possible
-                    if task.auto_completable:
-                        await self.auto_complete_task(task)
-                    else:
-                        logger.info("Task requires manual intervention", 
-                                  task_id=task.id, 
-                                  task_name=task.name)
-                
-                # Wait before next iteration
-                await asyncio.sleep(30)
+                # Completion events free slots and may make dependents ready
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    task = running.pop(finished)
+                    if finished.exception() is not None:
+                        logger.error("Task execution raised", 
+                                   task_id=task.id, 
+                                   task_name=task.name, 
+                                   error=str(finished.exception()))
+                        self.task_graph.mark_failed(task.name)
                 
         except KeyboardInterrupt:
             logger.info("Orchestration interrupted by user")
@@ -898,6 +957,9 @@ class TaskOrchestrator:
             logger.error("Error in orchestration loop", error=str(e))
             ORCHESTRATION_HEALTH.set(0)
             raise
+        finally:
+            for pending in running:
+                pending.cancel()
 
 # Main execution with proper error handling
 async def main():
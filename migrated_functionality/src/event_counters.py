@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+⏱️ IZA OS EVENT COUNTERS
+========================
+Sliding-window event counts for behavioral anomaly detection
+Fixed rings of time buckets per key, idle-key eviction, and an optional Redis backend shared by workers
+Rolling totals by (severity, event_type) back the 24h security metrics
+"""
+
+import logging
+import time
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (bucket seconds, bucket count): one minute in seconds, one hour in minutes
+DEFAULT_RINGS = ((1, 60), (60, 60))
+
+
+def _advance(state: List[int], offset: int, size: int, bucket: int) -> None:
+    """Move a ring forward to bucket, clearing the buckets that leave it"""
+    last = state[offset]
+    if bucket - last >= size:
+        state[offset + 1] = 0
+        state[offset + 2:offset + 2 + size] = [0] * size
+    else:
+        # Buckets that leave the ring drop out of the running total
+        for expired in range(last + 1, bucket + 1):
+            slot = offset + 2 + expired % size
+            state[offset + 1] -= state[slot]
+            state[slot] = 0
+    state[offset] = bucket
+
+
+class SlidingWindowCounters:
+    """In-process sliding-window counts keyed by tuples such as ('ip', address, event_type)
+
+    Each key owns one flat list holding a ring per resolution:
+    [last bucket, running total, bucket counts...] for each ring in turn.
+    """
+
+    def __init__(self, rings: Tuple[Tuple[int, int], ...] = DEFAULT_RINGS,
+                 max_keys: int = 100_000, idle_seconds: Optional[float] = None):
+        self.rings = tuple(sorted(rings))
+        self.max_keys = max_keys
+        # A key idle longer than the widest window has nothing left to count
+        self.idle_seconds = idle_seconds or max(res * size for res, size in self.rings)
+
+        self._layout: List[Tuple[int, int, int]] = []
+        template: List[int] = []
+        for resolution, size in self.rings:
+            self._layout.append((len(template), resolution, size))
+            template += [-1, 0] + [0] * size
+        self._template = template
+        self._windows: Dict[int, Tuple[int, int, int, int]] = {}
+
+        # Two generations: keys seen since the last rotation, and keys seen in the one before it
+        self._current: Dict[Hashable, List[int]] = {}
+        self._previous: Dict[Hashable, List[int]] = {}
+        self._next_rotation: Optional[float] = None
+        self.evicted = 0
+
+    def _rotate(self, now: float) -> None:
+        """Drop every key not seen for a whole generation, in O(1)"""
+        self.evicted += len(self._previous)
+        self._previous = self._current
+        self._current = {}
+        self._next_rotation = now + self.idle_seconds
+
+    def add(self, keys: Iterable[Hashable], now: Optional[float] = None) -> None:
+        """Count one event for each key"""
+        now = time.time() if now is None else now
+        if self._next_rotation is None:
+            self._next_rotation = now + self.idle_seconds
+        elif now >= self._next_rotation or len(self._current) >= self.max_keys // 2:
+            # Each generation holds at most half of max_keys
+            self._rotate(now)
+
+        current = self._current
+        positions = [(offset, size, int(now // resolution)) for offset, resolution, size in self._layout]
+        for key in keys:
+            state = current.get(key)
+            if state is None:
+                state = self._previous.pop(key, None)
+                if state is None:
+                    state = self._template.copy()
+                current[key] = state
+            for offset, size, bucket in positions:
+                last = state[offset]
+                slot = offset + 2 + bucket % size
+                if bucket == last:
+                    state[slot] += 1
+                    state[offset + 1] += 1
+                elif bucket == last + 1:
+                    # Next bucket: it replaces the oldest one in the ring
+                    state[offset + 1] += 1 - state[slot]
+                    state[slot] = 1
+                    state[offset] = bucket
+                elif bucket > last:
+                    _advance(state, offset, size, bucket)
+                    state[slot] += 1
+                    state[offset + 1] += 1
+                elif last - bucket < size:
+                    state[slot] += 1
+                    state[offset + 1] += 1
+
+    def _window(self, seconds: int) -> Tuple[int, int, int, int]:
+        window = self._windows.get(seconds)
+        if window is None:
+            # The finest ring that covers the window
+            for offset, resolution, size in self._layout:
+                if resolution * size >= seconds:
+                    window = self._windows[seconds] = (offset, resolution, size, max(seconds // resolution, 1))
+                    break
+            else:
+                raise ValueError(f"No counter ring covers {seconds} seconds")
+        return window
+
+    def count(self, key: Hashable, seconds: int, now: Optional[float] = None) -> int:
+        """Events for key in the last seconds, at the resolution of the finest ring that covers it"""
+        offset, resolution, size, span = self._windows.get(seconds) or self._window(seconds)
+        state = self._current.get(key) or self._previous.get(key)
+        if state is None:
+            return 0
+        now = time.time() if now is None else now
+        bucket = int(now // resolution)
+        last = state[offset]
+        if bucket == last and span >= size:
+            return state[offset + 1]
+        # Buckets inside both the window and the part of the ring still held
+        low = max(bucket - span + 1, last - size + 1)
+        high = min(bucket, last)
+        return sum(state[offset + 2 + b % size] for b in range(low, high + 1))
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'keys': len(self), 'max_keys': self.max_keys, 'evicted': self.evicted}
+
+
+class RollingEventTotals:
+    """Event counts over a trailing window by (severity, event_type), kept in a ring of minute buckets
+
+    Bucket m holds the events stamped in ((m - 1) * resolution, m * resolution], so a window ending on
+    a bucket edge counts exactly the events stamped after now - window_seconds. Otherwise the oldest
+    partial bucket is left out.
+    """
+
+    def __init__(self, window_seconds: int = 86400, resolution: int = 60):
+        self.resolution = resolution
+        self.size = window_seconds // resolution
+        self._buckets: List[Dict[Tuple[str, str], int]] = [{} for _ in range(self.size)]
+        self._last: Optional[int] = None
+        # Sum over every bucket in the ring, maintained on add and expiry
+        self.totals: Dict[Tuple[str, str], int] = {}
+
+    def _bucket(self, timestamp: float) -> int:
+        return -int(-timestamp // self.resolution)
+
+    def _advance(self, bucket: int) -> None:
+        """Move the ring forward to bucket, taking expired buckets out of the totals"""
+        if self._last is None:
+            self._last = bucket
+            return
+        if bucket <= self._last:
+            return
+        if bucket - self._last >= self.size:
+            for counts in self._buckets:
+                counts.clear()
+            self.totals.clear()
+        else:
+            totals = self.totals
+            for expired in range(self._last + 1, bucket + 1):
+                counts = self._buckets[expired % self.size]
+                for key, n in counts.items():
+                    remaining = totals[key] - n
+                    if remaining:
+                        totals[key] = remaining
+                    else:
+                        del totals[key]
+                counts.clear()
+        self._last = bucket
+
+    def add(self, severity: str, event_type: str, timestamp: Optional[float] = None) -> None:
+        """Count one event"""
+        bucket = self._bucket(time.time() if timestamp is None else timestamp)
+        self._advance(bucket)
+        if self._last - bucket >= self.size:
+            return  # Older than the window
+        key = (severity, event_type)
+        counts = self._buckets[bucket % self.size]
+        counts[key] = counts.get(key, 0) + 1
+        self.totals[key] = self.totals.get(key, 0) + 1
+
+    def counts(self, now: Optional[float] = None) -> Dict[Tuple[str, str], int]:
+        """(severity, event_type) -> events in the window ending at now"""
+        self._advance(self._bucket(time.time() if now is None else now))
+        return dict(self.totals)
+
+    def by_severity(self, now: Optional[float] = None) -> Dict[str, int]:
+        severities: Dict[str, int] = {}
+        for (severity, _), n in self.counts(now).items():
+            severities[severity] = severities.get(severity, 0) + n
+        return severities
+
+    def by_event_type(self, now: Optional[float] = None) -> Dict[str, int]:
+        event_types: Dict[str, int] = {}
+        for (_, event_type), n in self.counts(now).items():
+            event_types[event_type] = event_types.get(event_type, 0) + n
+        return event_types
+
+
+class RedisWindowCounters:
+    """Shared sliding-window counts: one expiring Redis key per (counter key, ring, bucket)"""
+
+    def __init__(self, client, prefix: str = "event_counts",
+                 rings: Tuple[Tuple[int, int], ...] = DEFAULT_RINGS):
+        self.client = client
+        self.prefix = prefix
+        self.rings = tuple(sorted(rings))
+
+    def _bucket_key(self, key: Hashable, resolution: int, bucket: int) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        return f"{self.prefix}:{resolution}:{'|'.join(map(str, parts))}:{bucket}"
+
+    async def add(self, keys: Iterable[Hashable], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            for resolution, size in self.rings:
+                bucket_key = self._bucket_key(key, resolution, int(now // resolution))
+                pipe.incr(bucket_key)
+                pipe.expire(bucket_key, resolution * (size + 1))
+        await pipe.execute()
+
+    async def count(self, key: Hashable, seconds: int, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        for resolution, size in self.rings:
+            if resolution * size >= seconds:
+                break
+        else:
+            raise ValueError(f"No counter ring covers {seconds} seconds")
+        bucket = int(now // resolution)
+        span = max(seconds // resolution, 1)
+        values: List[Optional[bytes]] = await self.client.mget(
+            [self._bucket_key(key, resolution, b) for b in range(bucket - span + 1, bucket + 1)]
+        )
+        return sum(int(value) for value in values if value)
@@ -35,7 +35,7 @@ from src.logger import (LogLevel,
                         logger)
 from src.models import (Model,
                         parse_json_if_needed,
-                        agglomerate_stream_deltas,
+                        StreamDeltaAccumulator,
                         ChatMessage,
                         ChatMessageStreamDelta)
 from src.utils.agent_types import (
@@ -150,15 +150,13 @@ class GeneralAgent(AsyncMultiStepAgent):
                     tools_to_call_from=self.tools_and_managed_agents,
                 )
 
-                chat_message_stream_deltas: list[ChatMessageStreamDelta] = []
+                stream_accumulator = StreamDeltaAccumulator()
                 with Live("", console=self.logger.console, vertical_overflow="visible") as live:
                     for event in output_stream:
-                        chat_message_stream_deltas.append(event)
-                        live.update(
-                            Markdown(agglomerate_stream_deltas(chat_message_stream_deltas).render_as_markdown())
-                        )
+                        stream_accumulator.add(event)
+                        live.update(Markdown(stream_accumulator.to_chat_message().render_as_markdown()))
                         yield event
-                chat_message = agglomerate_stream_deltas(chat_message_stream_deltas)
+                chat_message = stream_accumulator.to_chat_message()
             else:
                 chat_message: ChatMessage = await self.model(
                     input_messages,
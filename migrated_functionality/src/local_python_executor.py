@@ -17,14 +17,16 @@
 import ast
 import builtins
 import difflib
+import hashlib
 import inspect
 import logging
 import math
 import re
+from collections import OrderedDict
 from collections.abc import Callable, Mapping
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import import_module
-from types import BuiltinFunctionType, FunctionType, ModuleType
+from types import BuiltinFunctionType, FrameType, FunctionType, ModuleType, TracebackType
 from typing import Any
 
 from src.utils import BASE_BUILTIN_MODULES, truncate_content
@@ -55,9 +57,28 @@ def custom_print(*args):
     return None
 
 
+# Attributes that lead from generators, coroutines and tracebacks to live frames, and from there to the
+# interpreter's own locals and globals
+FORBIDDEN_FRAME_ATTRIBUTES = {
+    "gi_frame",
+    "gi_code",
+    "cr_frame",
+    "ag_frame",
+    "f_back",
+    "f_locals",
+    "f_globals",
+    "f_builtins",
+    "f_code",
+    "tb_frame",
+    "tb_next",
+}
+
+
 def nodunder_getattr(obj, name, default=None):
     if name.startswith("__") and name.endswith("__"):
         raise InterpreterError(f"Forbidden access to dunder attribute: {name}")
+    if name in FORBIDDEN_FRAME_ATTRIBUTES:
+        raise InterpreterError(f"Forbidden access to attribute: {name}")
     return getattr(obj, name, default)
 
 
@@ -300,6 +321,10 @@ def fix_final_answer_code(code: str) -> str:
     return code
 
 
+# Marks a node of the import tree whose path is itself an authorized import, not only a prefix of one
+_AUTHORIZED_IMPORT = ""
+
+
 def build_import_tree(authorized_imports: list[str]) -> dict[str, Any]:
     tree = {}
     for import_path in authorized_imports:
@@ -309,18 +334,25 @@ def build_import_tree(authorized_imports: list[str]) -> dict[str, Any]:
             if part not in current:
                 current[part] = {}
             current = current[part]
+        current[_AUTHORIZED_IMPORT] = {}
     return tree
 
 
+@lru_cache(maxsize=64)
+def _cached_import_tree(authorized_imports: tuple[str, ...]) -> dict[str, Any]:
+    return build_import_tree(list(authorized_imports))
+
+
 def check_import_authorized(import_to_check: str, authorized_imports: list[str]) -> bool:
-    current_node = build_import_tree(authorized_imports)
+    current_node = _cached_import_tree(tuple(authorized_imports))
     for part in import_to_check.split("."):
         if "*" in current_node:
             return True
         if part not in current_node:
             return False
         current_node = current_node[part]
-    return True
+    # Authorizing `os.path` does not authorize `os` itself
+    return _AUTHORIZED_IMPORT in current_node or "*" in current_node
 
 
 def evaluate_attribute(
@@ -1466,6 +1498,80 @@ class FinalAnswerException(Exception):
         self.value = value
 
 
+def parse_python_code(code: str) -> ast.Module:
+    try:
+        return ast.parse(code)
+    except SyntaxError as e:
+        raise InterpreterError(
+            f"Code parsing failed on line {e.lineno} due to: {type(e).__name__}\n"
+            f"{e.text}"
+            f"{' ' * (e.offset or 0)}^\n"
+            f"Error: {str(e)}"
+        )
+
+
+class CodeCache:
+    """
+    Bounded LRU cache of parsed code, and of validated and compiled code for the compiled execution mode.
+
+    Entries are keyed by a hash of the source and the set of authorized imports (plus the static tool names for
+    compiled code, since validation depends on them), so agents re-running the same code blob across steps and
+    retries skip parsing and validation.
+
+    Args:
+        max_size (`int`, defaults to 256):
+            Maximum number of entries kept in the cache.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+
+    def _get_or_build(self, key: tuple, build: Callable[[], Any]) -> Any:
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        value = build()
+        self._entries[key] = value
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _code_key(code: str, authorized_imports: list[str]) -> tuple:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest(), frozenset(authorized_imports)
+
+    def get_parsed(self, code: str, authorized_imports: list[str]) -> ast.Module:
+        return self._get_or_build(
+            ("parsed", *self._code_key(code, authorized_imports)), lambda: parse_python_code(code)
+        )
+
+    def get_compiled(
+        self, code: str, static_tools: dict[str, Callable], authorized_imports: list[str]
+    ) -> tuple[ast.Module, Any]:
+        return self._get_or_build(
+            ("compiled", *self._code_key(code, authorized_imports), frozenset(static_tools)),
+            lambda: compile_python_code(code, static_tools, authorized_imports),
+        )
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        import_tree_info = _cached_import_tree.cache_info()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "import_tree_hits": import_tree_info.hits,
+            "import_tree_misses": import_tree_info.misses,
+        }
+
+
 def evaluate_python_code(
     code: str,
     static_tools: dict[str, Callable] | None = None,
@@ -1473,6 +1579,7 @@ def evaluate_python_code(
     state: dict[str, Any] | None = None,
     authorized_imports: list[str] = BASE_BUILTIN_MODULES,
     max_print_outputs_length: int = DEFAULT_MAX_LEN_OUTPUT,
+    code_cache: CodeCache | None = None,
 ):
     """
     Evaluate a python expression using the content of the variables stored in a state and only evaluating a given set
@@ -1493,16 +1600,13 @@ def evaluate_python_code(
             A dictionary mapping variable names to values. The `state` should contain the initial inputs but will be
             updated by this function to contain all variables as they are evaluated.
             The print outputs will be stored in the state under the key "_print_outputs".
+        code_cache (`CodeCache`, *optional*):
+            Cache of parsed code to reuse across calls.
     """
-    try:
-        expression = ast.parse(code)
-    except SyntaxError as e:
-        raise InterpreterError(
-            f"Code parsing failed on line {e.lineno} due to: {type(e).__name__}\n"
-            f"{e.text}"
-            f"{' ' * (e.offset or 0)}^\n"
-            f"Error: {str(e)}"
-        )
+    if code_cache is not None:
+        expression = code_cache.get_parsed(code, authorized_imports)
+    else:
+        expression = parse_python_code(code)
 
     if state is None:
         state = {}
@@ -1543,6 +1647,388 @@ def evaluate_python_code(
         )
 
 
+COMPILED_CODE_FILENAME = "<sandboxed_code>"
+
+# Statement and expression nodes that `evaluate_ast` knows how to run. Compiled execution accepts the same set so
+# that code behaves the same way whichever mode runs it.
+COMPILED_SUPPORTED_NODES = (
+    ast.Assign,
+    ast.AnnAssign,
+    ast.AugAssign,
+    ast.Call,
+    ast.Constant,
+    ast.Tuple,
+    ast.ListComp,
+    ast.GeneratorExp,
+    ast.DictComp,
+    ast.SetComp,
+    ast.UnaryOp,
+    ast.Starred,
+    ast.BoolOp,
+    ast.Break,
+    ast.Continue,
+    ast.BinOp,
+    ast.Compare,
+    ast.Lambda,
+    ast.FunctionDef,
+    ast.Dict,
+    ast.Expr,
+    ast.For,
+    ast.FormattedValue,
+    ast.If,
+    ast.JoinedStr,
+    ast.List,
+    ast.Name,
+    ast.Subscript,
+    ast.IfExp,
+    ast.Attribute,
+    ast.Slice,
+    ast.While,
+    ast.Import,
+    ast.ImportFrom,
+    ast.ClassDef,
+    ast.Try,
+    ast.Raise,
+    ast.Assert,
+    ast.With,
+    ast.Set,
+    ast.Return,
+    ast.Pass,
+    ast.Delete,
+)
+
+# Dunder names that sandboxed code may still reference: `__import__` is routed through the import check at runtime.
+ALLOWED_DUNDER_NAMES = {"__name__", "__import__"}
+
+_COMPILED_RESULT_NAME = "__sandbox_result__"
+_COMPILED_TICK_NAME = "__sandbox_tick__"
+_COMPILED_CHECK_NAME = "__sandbox_check__"
+
+
+class _ImportPathModule(ModuleType):
+    """Stands in for the parents of an authorized submodule: holds the path to it and nothing else."""
+
+
+def _iter_nodes(node: ast.AST):
+    """Yields the node and its descendants depth-first, in source order."""
+    yield node
+    for child in ast.iter_child_nodes(node):
+        yield from _iter_nodes(child)
+
+
+def validate_compiled_node(node: ast.AST, static_tools: dict[str, Callable], authorized_imports: list[str]) -> None:
+    """
+    Statically checks a top-level statement against the rules `evaluate_ast` enforces while walking the tree.
+
+    Raises:
+        InterpreterError: If the statement uses an unsupported construct, a forbidden import, a dunder attribute,
+            a dangerous builtin or assigns to a static tool.
+    """
+    dangerous_builtins = {
+        qualified_name.rsplit(".", 1)[1]
+        for qualified_name in DANGEROUS_FUNCTIONS
+        if qualified_name.startswith("builtins.")
+    } - ALLOWED_DUNDER_NAMES
+    for sub_node in _iter_nodes(node):
+        if isinstance(sub_node, (ast.stmt, ast.expr)) and not isinstance(sub_node, COMPILED_SUPPORTED_NODES):
+            raise InterpreterError(f"{sub_node.__class__.__name__} is not supported.")
+        if isinstance(sub_node, ast.Import):
+            for alias in sub_node.names:
+                if not check_import_authorized(alias.name, authorized_imports):
+                    raise InterpreterError(
+                        f"Import of {alias.name} is not allowed. Authorized imports are: {str(list(authorized_imports))}"
+                    )
+        elif isinstance(sub_node, ast.ImportFrom):
+            if sub_node.level or sub_node.module is None:
+                raise InterpreterError("Relative imports are not supported.")
+            if not check_import_authorized(sub_node.module, authorized_imports):
+                raise InterpreterError(
+                    f"Import from {sub_node.module} is not allowed. Authorized imports are: {str(list(authorized_imports))}"
+                )
+        elif isinstance(sub_node, ast.Attribute):
+            if sub_node.attr.startswith("__") and sub_node.attr.endswith("__"):
+                raise InterpreterError(f"Forbidden access to dunder attribute: {sub_node.attr}")
+            if sub_node.attr in FORBIDDEN_FRAME_ATTRIBUTES:
+                raise InterpreterError(f"Forbidden access to attribute: {sub_node.attr}")
+        elif isinstance(sub_node, ast.Name):
+            if sub_node.id.startswith("__") and sub_node.id not in ALLOWED_DUNDER_NAMES:
+                raise InterpreterError(f"Forbidden access to dunder name: {sub_node.id}")
+            if isinstance(sub_node.ctx, ast.Load):
+                if sub_node.id in dangerous_builtins and sub_node.id not in static_tools:
+                    raise InterpreterError(f"Forbidden access to function: {sub_node.id}")
+            elif sub_node.id in static_tools:
+                raise InterpreterError(
+                    f"Cannot assign to name '{sub_node.id}': doing this would erase the existing tool!"
+                )
+        elif isinstance(sub_node, (ast.FunctionDef, ast.ClassDef)) and sub_node.name in static_tools:
+            raise InterpreterError(f"Cannot assign to name '{sub_node.name}': doing this would erase the existing tool!")
+
+
+class SandboxTransformer(ast.NodeTransformer):
+    """
+    Rewrites a validated tree so that the compiled code keeps the runtime guarantees of `evaluate_ast`:
+    results of calls and attribute loads go through the safety check, and every loop iteration counts
+    towards `MAX_OPERATIONS`.
+    """
+
+    @staticmethod
+    def _call(name: str, args: list[ast.expr]) -> ast.Call:
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+    def _checked(self, node: ast.expr) -> ast.AST:
+        return ast.copy_location(self._call(_COMPILED_CHECK_NAME, [node]), node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        return self._checked(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load):
+            return self._checked(node)
+        return node
+
+    def _visit_loop(self, node: ast.For | ast.While) -> ast.AST:
+        self.generic_visit(node)
+        node.body.insert(0, ast.copy_location(ast.Expr(value=self._call(_COMPILED_TICK_NAME, [])), node.body[0]))
+        return node
+
+    visit_For = _visit_loop
+    visit_While = _visit_loop
+
+    def visit_comprehension(self, node: ast.comprehension) -> ast.AST:
+        self.generic_visit(node)
+        node.ifs.insert(0, self._call(_COMPILED_TICK_NAME, []))
+        return node
+
+
+def compile_python_code(
+    code: str,
+    static_tools: dict[str, Callable] | None = None,
+    authorized_imports: list[str] = BASE_BUILTIN_MODULES,
+) -> tuple[ast.Module, Any]:
+    """
+    Parses and validates the code once, then compiles it into a code object that `evaluate_compiled_python_code`
+    can run.
+
+    Args:
+        code (`str`):
+            The code to compile.
+        static_tools (`Dict[str, Callable]`, *optional*):
+            The tools whose names the code is not allowed to assign to.
+        authorized_imports (`List[str]`):
+            The list of modules that can be imported by the code.
+
+    Returns:
+        `tuple[ast.Module, CodeType]`: The original parsed tree, used for error reporting, and the compiled code.
+    """
+    expression = parse_python_code(code)
+    static_tools = static_tools or {}
+    for node in expression.body:
+        try:
+            validate_compiled_node(node, static_tools, authorized_imports)
+        except InterpreterError as e:
+            raise InterpreterError(
+                f"Code execution failed at line '{ast.get_source_segment(code, node)}' due to: {type(e).__name__}: {e}"
+            )
+
+    # Transform a fresh tree so that the parsed one still matches the source for error reporting
+    sandboxed = SandboxTransformer().visit(ast.parse(code))
+    if sandboxed.body and isinstance(sandboxed.body[-1], ast.Expr):
+        # Keep the value of a trailing expression, as evaluate_python_code does
+        last = sandboxed.body[-1]
+        sandboxed.body[-1] = ast.copy_location(
+            ast.Assign(targets=[ast.Name(id=_COMPILED_RESULT_NAME, ctx=ast.Store())], value=last.value), last
+        )
+    ast.fix_missing_locations(sandboxed)
+    return expression, compile(sandboxed, COMPILED_CODE_FILENAME, "exec")
+
+
+def _compiled_failing_node(expression: ast.Module, error: BaseException) -> ast.AST | None:
+    lineno = None
+    traceback = error.__traceback__
+    while traceback is not None:
+        if traceback.tb_frame.f_code.co_filename == COMPILED_CODE_FILENAME:
+            lineno = traceback.tb_lineno
+        traceback = traceback.tb_next
+    if lineno is None:
+        return None
+    for node in expression.body:
+        if node.lineno <= lineno <= (node.end_lineno or node.lineno):
+            return node
+    return None
+
+
+def _compiled_result(expression: ast.Module, state: dict[str, Any]) -> Any:
+    if not expression.body:
+        return None
+    last = expression.body[-1]
+    if isinstance(last, ast.Expr):
+        return state.pop(_COMPILED_RESULT_NAME, None)
+    if isinstance(last, ast.Assign):
+        return state.get(last.targets[0].id) if isinstance(last.targets[0], ast.Name) else None
+    if isinstance(last, (ast.AnnAssign, ast.AugAssign)) and isinstance(last.target, ast.Name):
+        return state.get(last.target.id)
+    return None
+
+
+def evaluate_compiled_python_code(
+    code: str,
+    static_tools: dict[str, Callable] | None = None,
+    custom_tools: dict[str, Callable] | None = None,
+    state: dict[str, Any] | None = None,
+    authorized_imports: list[str] = BASE_BUILTIN_MODULES,
+    max_print_outputs_length: int = DEFAULT_MAX_LEN_OUTPUT,
+    compiled: tuple[ast.Module, Any] | None = None,
+    code_cache: CodeCache | None = None,
+):
+    """
+    Evaluate python code like `evaluate_python_code`, but validate the tree once and run it as a compiled code object
+    instead of walking the tree node by node.
+
+    Import, dunder and tool-assignment rules are checked statically before anything runs. At runtime, imports go
+    through the same authorization check, call results and attribute loads go through `check_safer_result`, and each
+    loop iteration counts as one operation towards `MAX_OPERATIONS`. The state dict is used as the globals of the
+    code, so variables, functions and classes defined by the code are stored in it.
+
+    The returned result is the value of the last statement when it is an expression or an assignment to a name.
+
+    Args:
+        code (`str`):
+            The code to evaluate.
+        static_tools (`Dict[str, Callable]`):
+            The functions that may be called during the evaluation. These tools cannot be overwritten in the code.
+        custom_tools (`Dict[str, Callable]`):
+            The functions that may be called during the evaluation. These tools can be overwritten in the code.
+        state (`Dict[str, Any]`):
+            A dictionary mapping variable names to values, updated with the variables defined by the code.
+            The print outputs will be stored in the state under the key "_print_outputs".
+        compiled (`tuple[ast.Module, CodeType]`, *optional*):
+            The output of `compile_python_code` for this code, to skip parsing and validation.
+        code_cache (`CodeCache`, *optional*):
+            Cache of compiled code to reuse across calls, used when `compiled` is not given.
+    """
+    if state is None:
+        state = {}
+    # A private copy: nothing the code reaches at runtime can widen the imports it is checked against
+    authorized_imports = tuple(authorized_imports)
+    static_tools = static_tools.copy() if static_tools is not None else {}
+    custom_tools = custom_tools if custom_tools is not None else {}
+    if compiled is None:
+        if code_cache is not None:
+            compiled = code_cache.get_compiled(code, static_tools, authorized_imports)
+        else:
+            compiled = compile_python_code(code, static_tools, authorized_imports)
+    expression, code_object = compiled
+
+    for name, value in state.items():
+        if isinstance(value, _ImportPathModule):
+            continue
+        try:
+            check_safer_result(value, static_tools, authorized_imports)
+        except InterpreterError as e:
+            raise InterpreterError(f"Code execution failed due to variable '{name}': {type(e).__name__}: {e}")
+
+    state["_print_outputs"] = PrintContainer()
+    state["_operations_count"] = {"counter": 0}
+    operations_count = state["_operations_count"]
+    print_outputs = state["_print_outputs"]
+
+    if "final_answer" in static_tools:
+        previous_final_answer = static_tools["final_answer"]
+
+        def final_answer(*args, **kwargs):  # Allow arbitrary arguments to be passed
+            raise FinalAnswerException(previous_final_answer(*args, **kwargs))
+
+        static_tools["final_answer"] = final_answer
+
+    dangerous_functions = {
+        tuple(qualified_name.rsplit(".", 1))
+        for qualified_name in DANGEROUS_FUNCTIONS
+        if qualified_name.rsplit(".", 1)[1] not in static_tools
+    }
+
+    def sandbox_check(result):
+        if isinstance(result, (FunctionType, BuiltinFunctionType)):
+            if (getattr(result, "__module__", None), result.__name__) in dangerous_functions:
+                raise InterpreterError(f"Forbidden access to function: {result.__name__}")
+        elif isinstance(result, (ModuleType, dict)):
+            if not isinstance(result, _ImportPathModule):
+                check_safer_result(result, static_tools, authorized_imports)
+        elif isinstance(result, (FrameType, TracebackType)):
+            raise InterpreterError(f"Forbidden access to {type(result).__name__} object")
+        return result
+
+    def checked_tool(tool):
+        # Lighter than `safer_func`: wrapping every tool on each run must stay cheap for short code actions
+        def call_tool(*args, **kwargs):
+            return sandbox_check(tool(*args, **kwargs))
+
+        return call_tool
+
+    def sandbox_tick():
+        operations_count["counter"] += 1
+        if operations_count["counter"] >= MAX_OPERATIONS:
+            raise InterpreterError(
+                f"Reached the max number of operations of {MAX_OPERATIONS}. Maybe there is an infinite loop somewhere in the code, or you're just asking too many calculations."
+            )
+        return True
+
+    def sandbox_print(*args, sep=" ", end="\n", **kwargs):
+        print_outputs.append(sep.join(map(str, args)) + end)
+
+    def sandbox_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level:
+            raise InterpreterError("Relative imports are not supported.")
+        if not check_import_authorized(name, authorized_imports):
+            raise InterpreterError(
+                f"Import of {name} is not allowed. Authorized imports are: {str(list(authorized_imports))}"
+            )
+        module = get_safe_module(import_module(name), authorized_imports)
+        if fromlist or "." not in name:
+            return module
+        # `import a.b` binds `a`: when only the submodule is authorized, expose nothing but the path to it
+        parts = name.split(".")
+        if check_import_authorized(parts[0], authorized_imports):
+            return get_safe_module(import_module(parts[0]), authorized_imports)
+        module.__name__ = name
+        root = current = _ImportPathModule(parts[0])
+        for index, part in enumerate(parts[1:-1], start=2):
+            child = _ImportPathModule(".".join(parts[:index]))
+            setattr(current, part, child)
+            current = child
+        setattr(current, parts[-1], module)
+        return root
+
+    sandbox_builtins = {
+        **ERRORS,
+        **custom_tools,
+        **{name: tool if isinstance(tool, type) else checked_tool(tool) for name, tool in static_tools.items()},
+        "print": sandbox_print,
+        "super": super,
+        "__import__": sandbox_import,
+        "__build_class__": builtins.__build_class__,
+        "__name__": "__main__",
+        _COMPILED_CHECK_NAME: sandbox_check,
+        _COMPILED_TICK_NAME: sandbox_tick,
+    }
+
+    state["__builtins__"] = sandbox_builtins
+    try:
+        exec(code_object, state)
+        return _compiled_result(expression, state), False
+    except FinalAnswerException as e:
+        return e.value, True
+    except Exception as e:
+        node = _compiled_failing_node(expression, e)
+        location = f" at line '{ast.get_source_segment(code, node)}'" if node is not None else ""
+        raise InterpreterError(f"Code execution failed{location} due to: {type(e).__name__}: {e}")
+    finally:
+        state.pop("__builtins__", None)
+        state.pop(_COMPILED_RESULT_NAME, None)
+        print_outputs.value = truncate_content(str(print_outputs), max_length=max_print_outputs_length)
+
+
 class PythonExecutor:
     pass
 
@@ -1563,6 +2049,12 @@ class LocalPythonExecutor(PythonExecutor):
             Maximum length of the print outputs.
         additional_functions (`dict[str, Callable]`, *optional*):
             Additional Python functions to be added to the executor.
+        compiled (`bool`, defaults to `False`):
+            Whether to validate each code action once and run it as compiled code with `evaluate_compiled_python_code`
+            instead of walking its tree with `evaluate_python_code`. Much faster on loop-heavy code.
+        code_cache_size (`int`, defaults to 256):
+            Maximum number of parsed or compiled code actions kept in the executor's `CodeCache`. Set to 0 to disable
+            caching. Hit and miss counters are available through `cache_stats()`.
     """
 
     def __init__(
@@ -1570,6 +2062,8 @@ class LocalPythonExecutor(PythonExecutor):
         additional_authorized_imports: list[str],
         max_print_outputs_length: int | None = None,
         additional_functions: dict[str, Callable] | None = None,
+        compiled: bool = False,
+        code_cache_size: int = 256,
     ):
         self.custom_tools = {}
         self.state = {"__name__": "__main__"}
@@ -1581,19 +2075,29 @@ class LocalPythonExecutor(PythonExecutor):
         # TODO: assert self.authorized imports are all installed locally
         self.static_tools = None
         self.additional_functions = additional_functions or {}
+        self.compiled = compiled
+        self.code_cache = CodeCache(max_size=code_cache_size) if code_cache_size > 0 else None
 
     def __call__(self, code_action: str) -> tuple[Any, str, bool]:
-        output, is_final_answer = evaluate_python_code(
+        evaluate = evaluate_compiled_python_code if self.compiled else evaluate_python_code
+        output, is_final_answer = evaluate(
             code_action,
             static_tools=self.static_tools,
             custom_tools=self.custom_tools,
             state=self.state,
             authorized_imports=self.authorized_imports,
             max_print_outputs_length=self.max_print_outputs_length,
+            code_cache=self.code_cache,
         )
         logs = str(self.state["_print_outputs"])
         return output, logs, is_final_answer
 
+    def cache_stats(self) -> dict[str, int]:
+        """Returns the hit and miss counters of the code cache and of the memoized import trees."""
+        if self.code_cache is None:
+            return {}
+        return self.code_cache.stats()
+
     def send_variables(self, variables: dict):
         self.state.update(variables)
 
@@ -1602,4 +2106,4 @@ class LocalPythonExecutor(PythonExecutor):
         self.static_tools = {**tools, **BASE_PYTHON_TOOLS.copy(), **self.additional_functions}
 
 
-__all__ = ["evaluate_python_code", "LocalPythonExecutor"]
+__all__ = ["evaluate_python_code", "evaluate_compiled_python_code", "LocalPythonExecutor"]
@@ -87,15 +87,100 @@ class MonetizationOpportunity:
 class AIProductMonetizationTracker:
     """AI-powered product and monetization tracking system"""
     
+    # Statement texts are constant so sqlite3's statement cache reuses the prepared statements
+    PRODUCT_INSERT_SQL = 'INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    PROJECT_INSERT_SQL = 'INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    OPPORTUNITY_INSERT_SQL = 'INSERT OR REPLACE INTO monetization_opportunities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    
+    # Expected value of an opportunity, as ranked by the dashboard
+    EXPECTED_VALUE_SQL = 'COALESCE(revenue_potential, 0) * COALESCE(success_probability, 0)'
+    
+    # Columns the dashboards and get_* filters query on
+    INDEXES = {
+        "idx_products_status": "products (status)",
+        "idx_products_category": "products (category)",
+        "idx_products_development_stage": "products (development_stage)",
+        "idx_products_competition_level": "products (competition_level)",
+        "idx_projects_status": "projects (status)",
+        "idx_projects_product_id": "projects (product_id)",
+        "idx_opportunities_status": "monetization_opportunities (status)",
+        "idx_opportunities_product_id": "monetization_opportunities (product_id)",
+        "idx_opportunities_type": "monetization_opportunities (opportunity_type)",
+        # Lets the top-k read k index entries instead of scoring and sorting every row
+        "idx_opportunities_expected_value": f"monetization_opportunities ({EXPECTED_VALUE_SQL})",
+    }
+    
+    PRODUCT_JSON_FIELDS = ('resources_required', 'dependencies', 'monetization_strategy',
+                           'revenue_streams', 'target_customers', 'ai_insights')
+    PROJECT_JSON_FIELDS = ('deliverables', 'milestones', 'risks', 'dependencies', 'ai_insights')
+    OPPORTUNITY_JSON_FIELDS = ('ai_insights',)
+    
+    # Dashboard aggregates: one scan per table over numeric columns only
+    PRODUCT_STATS_SQL = """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(revenue_potential), 0),
+            COALESCE(SUM(market_size), 0),
+            COALESCE(SUM(CASE competition_level WHEN 'high' THEN 1 WHEN 'medium' THEN 0.5 ELSE 0 END), 0),
+            COALESCE(SUM(competition_level = 'high'), 0),
+            COALESCE(SUM(COALESCE(market_size, 0) > 50000000000), 0),
+            COALESCE(SUM(COALESCE(market_size, 0) > 10000000000 AND COALESCE(market_size, 0) <= 50000000000), 0),
+            COALESCE(SUM(COALESCE(market_size, 0) <= 10000000000), 0)
+        FROM products
+    """
+    PROJECT_STATS_SQL = """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(status = 'active'), 0),
+            COALESCE(SUM(COALESCE(actual_cost, 0) * 1.0 / MAX(COALESCE(budget, 1), 1) > 0.9), 0),
+            COALESCE(SUM(COALESCE(progress, 0) < 0.3 AND COALESCE(timeline, 0) > 4), 0),
+            COALESCE(SUM(CASE WHEN status = 'active' THEN COALESCE(progress, 0) END), 0),
+            COALESCE(SUM(CASE WHEN status = 'active' THEN COALESCE(actual_cost, 0) END), 0),
+            COALESCE(SUM(CASE WHEN status = 'active' THEN MAX(COALESCE(budget, 1), 1) END), 0),
+            COALESCE(SUM(status = 'active' AND COALESCE(progress, 0) * 1.0 / MAX(COALESCE(timeline, 1), 1) > 0.8), 0)
+        FROM projects
+    """
+    OPPORTUNITY_STATS_SQL = f"""
+        SELECT
+            COUNT(*),
+            COALESCE(SUM({EXPECTED_VALUE_SQL}), 0),
+            COALESCE(SUM(COALESCE(success_probability, 0) < 0.3), 0),
+            COALESCE(SUM(COALESCE(revenue_potential, 0) > 1000000000), 0)
+        FROM monetization_opportunities
+    """
+    
     def __init__(self, db_path: str = "product_monetization.db"):
         self.db_path = db_path
         self.ecosystem_value = 698_000_000_000  # $698B
         self.current_date = datetime.now().isoformat()
+        self._conn = None
         self.init_database()
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Persistent connection, opened on first use in WAL mode"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            if self.db_path != ":memory:":
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+        return self._conn
+    
+    def close(self):
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         # Products table
@@ -171,8 +256,10 @@ class AIProductMonetizationTracker:
             )
         ''')
         
+        for index_name, target in self.INDEXES.items():
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {target}')
+        
         conn.commit()
-        conn.close()
         
         print("✅ Database initialized successfully")
     
@@ -315,6 +402,21 @@ class AIProductMonetizationTracker:
     
     def add_product(self, product_data: Dict) -> str:
         """Add a new product"""
+        product = self._build_product(product_data)
+        self._save_product(product)
+        print(f"✅ Product '{product.name}' added with AI analysis")
+        return product.id
+    
+    def add_products(self, products_data: List[Dict]) -> List[str]:
+        """Add many products in a single transaction"""
+        products = [self._build_product(product_data) for product_data in products_data]
+        with self.conn:
+            self.conn.executemany(self.PRODUCT_INSERT_SQL, [self._product_row(product) for product in products])
+        print(f"✅ {len(products)} products added with AI analysis")
+        return [product.id for product in products]
+    
+    def _build_product(self, product_data: Dict) -> Product:
+        """Create a Product with AI insights from raw data"""
         product_id = str(uuid.uuid4())
         
         # Generate AI insights
@@ -343,13 +445,25 @@ class AIProductMonetizationTracker:
             status=product_data.get('status', 'active'),
             ai_insights=ai_insights
         )
-        
-        self._save_product(product)
-        print(f"✅ Product '{product.name}' added with AI analysis")
-        return product_id
+        return product
     
     def add_project(self, project_data: Dict) -> str:
         """Add a new project"""
+        project = self._build_project(project_data)
+        self._save_project(project)
+        print(f"✅ Project '{project.name}' added with AI analysis")
+        return project.id
+    
+    def add_projects(self, projects_data: List[Dict]) -> List[str]:
+        """Add many projects in a single transaction"""
+        projects = [self._build_project(project_data) for project_data in projects_data]
+        with self.conn:
+            self.conn.executemany(self.PROJECT_INSERT_SQL, [self._project_row(project) for project in projects])
+        print(f"✅ {len(projects)} projects added with AI analysis")
+        return [project.id for project in projects]
+    
+    def _build_project(self, project_data: Dict) -> Project:
+        """Create a Project with AI insights from raw data"""
         project_id = str(uuid.uuid4())
         
         # Generate AI insights
@@ -374,13 +488,28 @@ class AIProductMonetizationTracker:
             status=project_data.get('status', 'active'),
             ai_insights=ai_insights
         )
-        
-        self._save_project(project)
-        print(f"✅ Project '{project.name}' added with AI analysis")
-        return project_id
+        return project
     
     def add_monetization_opportunity(self, opportunity_data: Dict) -> str:
         """Add a new monetization opportunity"""
+        opportunity = self._build_monetization_opportunity(opportunity_data)
+        self._save_monetization_opportunity(opportunity)
+        print(f"✅ Monetization opportunity '{opportunity.name}' added with AI analysis")
+        return opportunity.id
+    
+    def add_monetization_opportunities(self, opportunities_data: List[Dict]) -> List[str]:
+        """Add many monetization opportunities in a single transaction"""
+        opportunities = [self._build_monetization_opportunity(data) for data in opportunities_data]
+        with self.conn:
+            self.conn.executemany(
+                self.OPPORTUNITY_INSERT_SQL,
+                [self._opportunity_row(opportunity) for opportunity in opportunities]
+            )
+        print(f"✅ {len(opportunities)} monetization opportunities added with AI analysis")
+        return [opportunity.id for opportunity in opportunities]
+    
+    def _build_monetization_opportunity(self, opportunity_data: Dict) -> MonetizationOpportunity:
+        """Create a MonetizationOpportunity with AI insights from raw data"""
         opportunity_id = str(uuid.uuid4())
         
         # Generate AI insights
@@ -403,19 +532,12 @@ class AIProductMonetizationTracker:
             status=opportunity_data.get('status', 'active'),
             ai_insights=ai_insights
         )
-        
-        self._save_monetization_opportunity(opportunity)
-        print(f"✅ Monetization opportunity '{opportunity.name}' added with AI analysis")
-        return opportunity_id
+        return opportunity
     
-    def _save_product(self, product: Product):
-        """Save product to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    @staticmethod
+    def _product_row(product: Product) -> Tuple:
+        """Product as a products table row"""
+        return (
             product.id, product.name, product.category, product.description,
             product.current_value, product.target_value, product.revenue_potential,
             product.development_stage, product.priority, product.market_size,
@@ -427,19 +549,12 @@ class AIProductMonetizationTracker:
             json.dumps(product.target_customers),
             product.created_date, product.last_updated, product.status,
             json.dumps(product.ai_insights)
-        ))
-        
-        conn.commit()
-        conn.close()
+        )
     
-    def _save_project(self, project: Project):
-        """Save project to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    @staticmethod
+    def _project_row(project: Project) -> Tuple:
+        """Project as a projects table row"""
+        return (
             project.id, project.name, project.product_id, project.description,
             project.budget, project.actual_cost, project.timeline, project.progress,
             project.team_size,
@@ -449,19 +564,12 @@ class AIProductMonetizationTracker:
             json.dumps(project.dependencies),
             project.created_date, project.deadline, project.status,
             json.dumps(project.ai_insights)
-        ))
-        
-        conn.commit()
-        conn.close()
+        )
     
-    def _save_monetization_opportunity(self, opportunity: MonetizationOpportunity):
-        """Save monetization opportunity to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO monetization_opportunities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    @staticmethod
+    def _opportunity_row(opportunity: MonetizationOpportunity) -> Tuple:
+        """Monetization opportunity as a monetization_opportunities table row"""
+        return (
             opportunity.id, opportunity.name, opportunity.product_id,
             opportunity.opportunity_type, opportunity.revenue_potential,
             opportunity.conversion_rate, opportunity.customer_acquisition_cost,
@@ -469,155 +577,179 @@ class AIProductMonetizationTracker:
             opportunity.implementation_effort, opportunity.time_to_implement,
             opportunity.success_probability, opportunity.created_date,
             opportunity.status, json.dumps(opportunity.ai_insights)
-        ))
-        
-        conn.commit()
-        conn.close()
+        )
+    
+    def _save_product(self, product: Product):
+        """Save product to database"""
+        with self.conn:
+            self.conn.execute(self.PRODUCT_INSERT_SQL, self._product_row(product))
+    
+    def _save_project(self, project: Project):
+        """Save project to database"""
+        with self.conn:
+            self.conn.execute(self.PROJECT_INSERT_SQL, self._project_row(project))
+    
+    def _save_monetization_opportunity(self, opportunity: MonetizationOpportunity):
+        """Save monetization opportunity to database"""
+        with self.conn:
+            self.conn.execute(self.OPPORTUNITY_INSERT_SQL, self._opportunity_row(opportunity))
     
     def get_products(self, status: str = None) -> List[Dict]:
         """Get all products or filter by status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         if status:
             cursor.execute('SELECT * FROM products WHERE status = ?', (status,))
         else:
             cursor.execute('SELECT * FROM products')
         
-        columns = [description[0] for description in cursor.description]
-        products = []
-        
-        for row in cursor.fetchall():
-            product_dict = dict(zip(columns, row))
-            # Parse JSON fields
-            for field in ['resources_required', 'dependencies', 'monetization_strategy', 
-                         'revenue_streams', 'target_customers', 'ai_insights']:
-                if product_dict[field]:
-                    product_dict[field] = json.loads(product_dict[field])
-            products.append(product_dict)
-        
-        conn.close()
-        return products
+        return self._decode_rows(cursor, self.PRODUCT_JSON_FIELDS)
     
     def get_projects(self, status: str = None) -> List[Dict]:
         """Get all projects or filter by status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         if status:
             cursor.execute('SELECT * FROM projects WHERE status = ?', (status,))
         else:
             cursor.execute('SELECT * FROM projects')
         
-        columns = [description[0] for description in cursor.description]
-        projects = []
-        
-        for row in cursor.fetchall():
-            project_dict = dict(zip(columns, row))
-            # Parse JSON fields
-            for field in ['deliverables', 'milestones', 'risks', 'dependencies', 'ai_insights']:
-                if project_dict[field]:
-                    project_dict[field] = json.loads(project_dict[field])
-            projects.append(project_dict)
-        
-        conn.close()
-        return projects
+        return self._decode_rows(cursor, self.PROJECT_JSON_FIELDS)
     
     def get_monetization_opportunities(self, status: str = None) -> List[Dict]:
         """Get all monetization opportunities or filter by status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         if status:
             cursor.execute('SELECT * FROM monetization_opportunities WHERE status = ?', (status,))
         else:
             cursor.execute('SELECT * FROM monetization_opportunities')
         
+        return self._decode_rows(cursor, self.OPPORTUNITY_JSON_FIELDS)
+    
+    @staticmethod
+    def _decode_rows(cursor: sqlite3.Cursor, json_fields: Tuple[str, ...]) -> List[Dict]:
+        """Fetch rows as dicts, parsing JSON fields"""
         columns = [description[0] for description in cursor.description]
-        opportunities = []
+        rows = []
         
-        for row in cursor.fetchall():
-            opportunity_dict = dict(zip(columns, row))
-            # Parse JSON fields
-            if opportunity_dict['ai_insights']:
-                opportunity_dict['ai_insights'] = json.loads(opportunity_dict['ai_insights'])
-            opportunities.append(opportunity_dict)
+        for row in cursor:
+            row_dict = dict(zip(columns, row))
+            for field in json_fields:
+                if row_dict[field]:
+                    row_dict[field] = json.loads(row_dict[field])
+            rows.append(row_dict)
         
-        conn.close()
-        return opportunities
+        return rows
     
     def generate_ai_dashboard(self) -> Dict:
         """Generate comprehensive AI-powered dashboard"""
-        products = self.get_products()
-        projects = self.get_projects()
-        opportunities = self.get_monetization_opportunities()
+        stats = self._get_dashboard_stats()
         
         dashboard = {
             "dashboard_generated": self.current_date,
             "ecosystem_value": self.ecosystem_value,
             "summary": {
-                "total_products": len(products),
-                "total_projects": len(projects),
-                "total_monetization_opportunities": len(opportunities),
-                "total_revenue_potential": sum(p.get('revenue_potential', 0) for p in products),
-                "total_active_projects": len([p for p in projects if p.get('status') == 'active'])
+                "total_products": stats["total_products"],
+                "total_projects": stats["total_projects"],
+                "total_monetization_opportunities": stats["total_opportunities"],
+                "total_revenue_potential": stats["total_revenue_potential"],
+                "total_active_projects": stats["active_projects"]
             },
             "ai_insights": {
-                "top_revenue_opportunities": self._get_top_revenue_opportunities(opportunities),
-                "critical_projects": self._get_critical_projects(projects),
-                "market_analysis": self._get_market_analysis(products),
-                "risk_assessment": self._get_risk_assessment(products, projects, opportunities),
-                "recommendations": self._get_ai_recommendations(products, projects, opportunities)
+                "top_revenue_opportunities": self._get_top_revenue_opportunities(),
+                "critical_projects": self._get_critical_projects(),
+                "market_analysis": self._get_market_analysis(stats),
+                "risk_assessment": self._get_risk_assessment(stats),
+                "recommendations": self._get_ai_recommendations(stats)
             },
-            "financial_projections": self._get_financial_projections(products, opportunities),
-            "performance_metrics": self._get_performance_metrics(projects)
+            "financial_projections": self._get_financial_projections(stats),
+            "performance_metrics": self._get_performance_metrics(stats)
         }
         
         return dashboard
     
-    def _get_top_revenue_opportunities(self, opportunities: List[Dict]) -> List[Dict]:
-        """Get top revenue opportunities sorted by potential"""
-        return sorted(opportunities, 
-                     key=lambda x: x.get('revenue_potential', 0) * x.get('success_probability', 0), 
-                     reverse=True)[:5]
+    def _get_dashboard_stats(self) -> Dict:
+        """All dashboard counts and sums, computed by SQLite without materializing rows"""
+        (total_products, total_revenue_potential, total_market_size, competition_sum,
+         high_competition, high_value, medium_value, low_value) = self.conn.execute(self.PRODUCT_STATS_SQL).fetchone()
+        (total_projects, active_projects, over_budget, delayed, active_progress_sum,
+         active_cost_sum, active_budget_sum, on_time) = self.conn.execute(self.PROJECT_STATS_SQL).fetchone()
+        (total_opportunities, opportunity_value, low_success,
+         high_value_opportunities) = self.conn.execute(self.OPPORTUNITY_STATS_SQL).fetchone()
+        
+        return {
+            "total_products": total_products,
+            "total_revenue_potential": total_revenue_potential,
+            "total_market_size": total_market_size,
+            "competition_sum": competition_sum,
+            "high_competition_products": high_competition,
+            "high_value_products": high_value,
+            "medium_value_products": medium_value,
+            "low_value_products": low_value,
+            "total_projects": total_projects,
+            "active_projects": active_projects,
+            "over_budget_projects": over_budget,
+            "delayed_projects": delayed,
+            "active_progress_sum": active_progress_sum,
+            "active_cost_sum": active_cost_sum,
+            "active_budget_sum": active_budget_sum,
+            "on_time_projects": on_time,
+            "total_opportunities": total_opportunities,
+            "total_opportunity_value": opportunity_value,
+            "low_success_probability_opportunities": low_success,
+            "high_value_opportunities": high_value_opportunities
+        }
+    
+    def _get_top_revenue_opportunities(self, k: int = 5) -> List[Dict]:
+        """Get top revenue opportunities by expected value"""
+        # Walks the expected-value index from the top; ties keep insertion order like a stable sort
+        rowids = [rowid for (rowid,) in self.conn.execute(
+            f'SELECT rowid FROM monetization_opportunities ORDER BY {self.EXPECTED_VALUE_SQL} DESC, rowid LIMIT ?',
+            (k,)
+        )]
+        if not rowids:
+            return []
+        
+        # Only the returned rows are fetched in full and JSON-decoded
+        cursor = self.conn.execute(
+            f'SELECT rowid AS _rowid, * FROM monetization_opportunities WHERE rowid IN ({", ".join("?" * len(rowids))})',
+            rowids
+        )
+        by_rowid = {row.pop('_rowid'): row for row in self._decode_rows(cursor, self.OPPORTUNITY_JSON_FIELDS)}
+        return [by_rowid[rowid] for rowid in rowids]
     
-    def _get_critical_projects(self, projects: List[Dict]) -> List[Dict]:
+    def _get_critical_projects(self) -> List[Dict]:
         """Get critical projects that need attention"""
-        critical = []
-        for project in projects:
-            if project.get('status') == 'active':
-                progress = project.get('progress', 0)
-                budget_utilization = project.get('actual_cost', 0) / max(project.get('budget', 1), 1)
-                if progress < 0.3 or budget_utilization > 0.8:
-                    critical.append(project)
-        return critical
-    
-    def _get_market_analysis(self, products: List[Dict]) -> Dict:
+        cursor = self.conn.execute(
+            "SELECT * FROM projects WHERE status = 'active' "
+            "AND (COALESCE(progress, 0) < 0.3 OR COALESCE(actual_cost, 0) * 1.0 / MAX(COALESCE(budget, 1), 1) > 0.8)"
+        )
+        return self._decode_rows(cursor, self.PROJECT_JSON_FIELDS)
+    
+    def _get_market_analysis(self, stats: Dict) -> Dict:
         """Get market analysis insights"""
-        total_market_size = sum(p.get('market_size', 0) for p in products)
-        avg_competition = sum(1 if p.get('competition_level') == 'high' else 0.5 if p.get('competition_level') == 'medium' else 0 
-                             for p in products) / max(len(products), 1)
-        
         return {
-            "total_addressable_market": total_market_size,
-            "average_competition_level": avg_competition,
+            "total_addressable_market": stats["total_market_size"],
+            "average_competition_level": stats["competition_sum"] / max(stats["total_products"], 1),
             "market_categories": {
-                "high_value": len([p for p in products if p.get('market_size', 0) > 50_000_000_000]),
-                "medium_value": len([p for p in products if 10_000_000_000 < p.get('market_size', 0) <= 50_000_000_000]),
-                "low_value": len([p for p in products if p.get('market_size', 0) <= 10_000_000_000])
+                "high_value": stats["high_value_products"],
+                "medium_value": stats["medium_value_products"],
+                "low_value": stats["low_value_products"]
             }
         }
     
-    def _get_risk_assessment(self, products: List[Dict], projects: List[Dict], opportunities: List[Dict]) -> Dict:
+    def _get_risk_assessment(self, stats: Dict) -> Dict:
         """Get comprehensive risk assessment"""
         risks = {
-            "high_competition_products": len([p for p in products if p.get('competition_level') == 'high']),
-            "over_budget_projects": len([p for p in projects if p.get('actual_cost', 0) / max(p.get('budget', 1), 1) > 0.9]),
-            "low_success_probability_opportunities": len([o for o in opportunities if o.get('success_probability', 0) < 0.3]),
-            "delayed_projects": len([p for p in projects if p.get('progress', 0) < 0.3 and p.get('timeline', 0) > 4])
+            "high_competition_products": stats["high_competition_products"],
+            "over_budget_projects": stats["over_budget_projects"],
+            "low_success_probability_opportunities": stats["low_success_probability_opportunities"],
+            "delayed_projects": stats["delayed_projects"]
         }
         
-        risk_score = sum(risks.values()) / max(len(products) + len(projects) + len(opportunities), 1)
+        total_items = stats["total_products"] + stats["total_projects"] + stats["total_opportunities"]
+        risk_score = sum(risks.values()) / max(total_items, 1)
         
         return {
             "overall_risk_score": risk_score,
@@ -625,31 +757,28 @@ class AIProductMonetizationTracker:
             "specific_risks": risks
         }
     
-    def _get_ai_recommendations(self, products: List[Dict], projects: List[Dict], opportunities: List[Dict]) -> List[str]:
+    def _get_ai_recommendations(self, stats: Dict) -> List[str]:
         """Get AI-powered recommendations"""
         recommendations = []
         
         # Revenue optimization
-        total_revenue_potential = sum(p.get('revenue_potential', 0) for p in products)
-        if total_revenue_potential < self.ecosystem_value * 0.1:
+        if stats["total_revenue_potential"] < self.ecosystem_value * 0.1:
             recommendations.append("Focus on high-value product development to reach $698B target")
         
         # Project efficiency
-        active_projects = [p for p in projects if p.get('status') == 'active']
-        if len(active_projects) > 10:
+        if stats["active_projects"] > 10:
             recommendations.append("Consider consolidating projects to improve focus and efficiency")
         
         # Market opportunities
-        high_value_opportunities = [o for o in opportunities if o.get('revenue_potential', 0) > 1_000_000_000]
-        if len(high_value_opportunities) > 0:
-            recommendations.append(f"Prioritize {len(high_value_opportunities)} high-value monetization opportunities")
+        if stats["high_value_opportunities"] > 0:
+            recommendations.append(f"Prioritize {stats['high_value_opportunities']} high-value monetization opportunities")
         
         return recommendations
     
-    def _get_financial_projections(self, products: List[Dict], opportunities: List[Dict]) -> Dict:
+    def _get_financial_projections(self, stats: Dict) -> Dict:
         """Get financial projections"""
-        total_revenue_potential = sum(p.get('revenue_potential', 0) for p in products)
-        total_opportunity_revenue = sum(o.get('revenue_potential', 0) * o.get('success_probability', 0) for o in opportunities)
+        total_revenue_potential = stats["total_revenue_potential"]
+        total_opportunity_revenue = stats["total_opportunity_value"]
         
         return {
             "year_1_projection": total_revenue_potential * 0.05,
@@ -659,21 +788,17 @@ class AIProductMonetizationTracker:
             "ecosystem_target_achievement": (total_revenue_potential + total_opportunity_revenue) / self.ecosystem_value
         }
     
-    def _get_performance_metrics(self, projects: List[Dict]) -> Dict:
+    def _get_performance_metrics(self, stats: Dict) -> Dict:
         """Get performance metrics"""
-        active_projects = [p for p in projects if p.get('status') == 'active']
+        active_projects = stats["active_projects"]
         if not active_projects:
             return {"average_progress": 0, "budget_efficiency": 0, "on_time_projects": 0}
         
-        avg_progress = sum(p.get('progress', 0) for p in active_projects) / len(active_projects)
-        budget_efficiency = sum(p.get('actual_cost', 0) for p in active_projects) / sum(max(p.get('budget', 1), 1) for p in active_projects)
-        on_time_projects = len([p for p in active_projects if p.get('progress', 0) / max(p.get('timeline', 1), 1) > 0.8])
-        
         return {
-            "average_progress": avg_progress,
-            "budget_efficiency": budget_efficiency,
-            "on_time_projects": on_time_projects,
-            "total_active_projects": len(active_projects)
+            "average_progress": stats["active_progress_sum"] / active_projects,
+            "budget_efficiency": stats["active_cost_sum"] / stats["active_budget_sum"],
+            "on_time_projects": stats["on_time_projects"],
+            "total_active_projects": active_projects
         }
     
     def export_to_csv(self, data_type: str, filename: str = None):
@@ -1,8 +1,11 @@
+import asyncio
 import json
+import time
+import weakref
 from typing import Dict, List, Optional, Any
 from collections.abc import Generator
 from openai.types.chat import ChatCompletion
-import requests
+import httpx
 import os
 from PIL import Image
 
@@ -14,27 +17,189 @@ from src.models.base import (ApiModel,
                              ChatMessageToolCallStreamDelta)
 from src.models.message_manager import MessageManager
 from src.logger import TokenUsage, logger
-from src.utils import encode_image_base64
+from src.utils import _is_package_available, encode_image_base64
 
 
-class RestfulClient():
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RestfulTransport():
+    """Pooled HTTP transport shared by the Restful clients.
+
+    Keeps one keep-alive connection pool for synchronous calls and one per event loop for asynchronous calls (an
+    `httpx.AsyncClient` cannot be used from a loop other than the one it first ran on), uses HTTP/2 when
+    the `h2` package is installed, and retries on 429/5xx responses and connection errors with exponential backoff
+    (honouring `Retry-After` when the server sends it).
+
+    Parameters:
+        max_connections (`int`, default `100`):
+            Maximum number of concurrent connections in each pool.
+        max_keepalive_connections (`int`, default `20`):
+            Maximum number of idle connections kept alive in each pool.
+        timeout (`float`, default `600.0`):
+            Read/write timeout in seconds.
+        connect_timeout (`float`, default `60.0`):
+            Connection timeout in seconds.
+        http2 (`bool`, default `True`):
+            Whether to negotiate HTTP/2 when the `h2` package is available.
+        max_retries (`int`, default `3`):
+            Number of retries after the first attempt.
+        backoff_factor (`float`, default `0.5`):
+            Base delay in seconds, doubled after every retry.
+        proxy (`str`, *optional*):
+            Proxy URL for all requests.
+    """
+
+    def __init__(self,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 timeout: float = 600.0,
+                 connect_timeout: float = 60.0,
+                 http2: bool = True,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 proxy: Optional[str] = None):
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections)
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.http2 = http2 and _is_package_available("h2")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.proxy = proxy
+
+        self._client: Optional[httpx.Client] = None
+        # Dropped with their loop, so a later `asyncio.run` never gets a client bound to a closed one
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(limits=self.limits, timeout=self.timeout, http2=self.http2, proxy=self.proxy)
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        async_client = self._async_clients.get(loop)
+        if async_client is None:
+            async_client = httpx.AsyncClient(limits=self.limits,
+                                             timeout=self.timeout,
+                                             http2=self.http2,
+                                             proxy=self.proxy)
+            self._async_clients[loop] = async_client
+        return async_client
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff_factor * (2 ** attempt)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        for attempt in range(self.max_retries + 1):
+            response = None
+            try:
+                response = self.client.post(url, **kwargs)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return response
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+            delay = self._retry_delay(attempt, response)
+            logger.warning(f"Request to {url} failed (attempt {attempt + 1}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    async def apost(self, url: str, **kwargs) -> httpx.Response:
+        for attempt in range(self.max_retries + 1):
+            response = None
+            try:
+                response = await self.async_client.post(url, **kwargs)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return response
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+            delay = self._retry_delay(attempt, response)
+            logger.warning(f"Request to {url} failed (attempt {attempt + 1}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        """Close the client of the running event loop."""
+        async_client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if async_client is not None:
+            await async_client.aclose()
+
+
+_DEFAULT_TRANSPORT: Optional[RestfulTransport] = None
+
+
+def get_default_transport() -> RestfulTransport:
+    """Return the process-wide transport shared by every Restful client created without one."""
+    global _DEFAULT_TRANSPORT
+    if _DEFAULT_TRANSPORT is None:
+        _DEFAULT_TRANSPORT = RestfulTransport(proxy=os.getenv("LOCAL_PROXY_BASE", None))
+    return _DEFAULT_TRANSPORT
+
+
+class RestfulBaseClient():
+    """Base class of the Restful clients: subclasses build the request and parse the response, and the shared
+    transport sends it either synchronously (`completion`) or without blocking the event loop (`acompletion`)."""
+
     def __init__(self,
                  api_base: str,
                  api_key: str,
-                 api_type: str = "chat/completions",
-                 model_id: str = "o3",
-                 http_client=None):
+                 api_type: str,
+                 model_id: str,
+                 http_client=None,
+                 transport: Optional[RestfulTransport] = None):
         self.api_base = api_base
         self.api_key = api_key
         self.api_type = api_type
         self.model_id = model_id
 
         self.http_client = http_client
+        self.transport = transport or get_default_transport()
+
+    @property
+    def url(self) -> str:
+        return f"{self.api_base}/{self.api_type}"
+
+    def _build_request(self, *args, **kwargs) -> Dict[str, Any]:
+        raise NotImplementedError
 
-    def completion(self,
-                   model,
-                   messages,
-                   **kwargs):
+    def _parse_response(self, response: httpx.Response) -> Any:
+        return response.json()
+
+    def completion(self, *args, **kwargs):
+        response = self.transport.post(self.url, **self._build_request(*args, **kwargs))
+        return self._parse_response(response)
+
+    async def acompletion(self, *args, **kwargs):
+        response = await self.transport.apost(self.url, **self._build_request(*args, **kwargs))
+        return self._parse_response(response)
+
+
+class RestfulClient(RestfulBaseClient):
+    def __init__(self,
+                 api_base: str,
+                 api_key: str,
+                 api_type: str = "chat/completions",
+                 model_id: str = "o3",
+                 http_client=None,
+                 transport: Optional[RestfulTransport] = None):
+        super().__init__(api_base, api_key, api_type, model_id, http_client=http_client, transport=transport)
+
+    def _build_request(self,
+                       model,
+                       messages,
+                       **kwargs):
 
         headers = {
             "app_key": self.api_key,
@@ -51,33 +216,23 @@ class RestfulClient():
         if kwargs:
             data.update(kwargs)
 
-        response = requests.post(
-            f"{self.api_base}/{self.api_type}",
-            json=data,
-            headers=headers,
-        )
-
-        return response.json()
+        return {"json": data, "headers": headers}
 
-class RestfulResponseClient():
+class RestfulResponseClient(RestfulBaseClient):
     def __init__(self,
                  api_base: str,
                  api_key: str,
                  api_type: str = "responses",
                  model_id: str = "o3",
-                 http_client=None):
-        self.api_base = api_base
-        self.api_key = api_key
-        self.api_type = api_type
-        self.model_id = model_id
-
-        self.http_client = http_client
+                 http_client=None,
+                 transport: Optional[RestfulTransport] = None):
+        super().__init__(api_base, api_key, api_type, model_id, http_client=http_client, transport=transport)
 
-    def completion(self,
-                   model,
-                   input,
-                   tools,
-                   **kwargs):
+    def _build_request(self,
+                       model,
+                       input,
+                       tools,
+                       **kwargs):
 
         headers = {
             "app_key": self.api_key,
@@ -96,12 +251,9 @@ class RestfulResponseClient():
         if kwargs:
             data.update(kwargs)
 
-        response = requests.post(
-            f"{self.api_base}/{self.api_type}",
-            json=data,
-            headers=headers,
-        )
+        return {"json": data, "headers": headers}
 
+    def _parse_response(self, response: httpx.Response) -> Any:
         response_text = response.text
         for line in response_text.split('\n'):
             if line.strip():
@@ -115,51 +267,44 @@ class RestfulResponseClient():
                     logger.error(f"Error parsing line: {line}, error: {e}")
 
 
-class RestfulTranscribeClient():
+class RestfulTranscribeClient(RestfulBaseClient):
     def __init__(self,
                  api_base: str,
                  api_key: str,
                  api_type: str = "wisper",
                  model_id: str = "wisper",
-                 http_client=None):
-        self.api_base = api_base
-        self.api_key = api_key
-        self.api_type = api_type
-        self.model_id = model_id
-
-        self.http_client = http_client
+                 http_client=None,
+                 transport: Optional[RestfulTransport] = None):
+        super().__init__(api_base, api_key, api_type, model_id, http_client=http_client, transport=transport)
 
-    def completion(self,
-                   model,
-                   file_stream,
-                   **kwargs):
+    def _build_request(self,
+                       model,
+                       file_stream,
+                       **kwargs):
 
+        # Read the stream once so that retried requests upload the same content
+        if hasattr(file_stream, "read"):
+            file_stream = (os.path.basename(getattr(file_stream, "name", "file")), file_stream.read())
         files = {'file': file_stream}
         headers = {
             "app_key": self.api_key,
         }
-        response = requests.post(f"{self.api_base}/{self.api_type}", headers=headers, files=files)
-
-        return response.json()
+        return {"headers": headers, "files": files}
 
-class RestfulImagenClient():
+class RestfulImagenClient(RestfulBaseClient):
     def __init__(self,
                  api_base: str,
                  api_key: str,
                  api_type: str = "imagen",
                  model_id: str = "imagen",
-                 http_client=None):
-        self.api_base = api_base
-        self.api_key = api_key
-        self.api_type = api_type
-        self.model_id = model_id
-
-        self.http_client = http_client
+                 http_client=None,
+                 transport: Optional[RestfulTransport] = None):
+        super().__init__(api_base, api_key, api_type, model_id, http_client=http_client, transport=transport)
 
-    def completion(self,
-                   model,
-                   prompt: str,
-                   **kwargs):
+    def _build_request(self,
+                       model,
+                       prompt: str,
+                       **kwargs):
         headers = {
             "app_key": self.api_key,
             "Content-Type": "application/json"
@@ -181,34 +326,24 @@ class RestfulImagenClient():
         if kwargs:
             data.update(kwargs)
 
-        response = requests.post(
-            f"{self.api_base}/{self.api_type}",
-            json=data,
-            headers=headers,
-        )
-
-        return response.json()
+        return {"json": data, "headers": headers}
 
 
-class RestfulVeoPredictClient():
+class RestfulVeoPredictClient(RestfulBaseClient):
     def __init__(self,
                  api_base: str,
                  api_key: str,
                  api_type: str = "veo/predict",
                  model_id: str = "veo3",
-                 http_client=None):
-        self.api_base = api_base
-        self.api_key = api_key
-        self.api_type = api_type
-        self.model_id = model_id
-
-        self.http_client = http_client
-
-    def completion(self,
-                   model,
-                   prompt: str,
-                   image: str = None,
-                   **kwargs):
+                 http_client=None,
+                 transport: Optional[RestfulTransport] = None):
+        super().__init__(api_base, api_key, api_type, model_id, http_client=http_client, transport=transport)
+
+    def _build_request(self,
+                       model,
+                       prompt: str,
+                       image: str = None,
+                       **kwargs):
         headers = {
             "app_key": self.api_key,
             "Content-Type": "application/json"
@@ -238,32 +373,22 @@ class RestfulVeoPredictClient():
         if kwargs:
             data.update(kwargs)
 
-        response = requests.post(
-            f"{self.api_base}/{self.api_type}",
-            json=data,
-            headers=headers,
-        )
+        return {"json": data, "headers": headers}
 
-        return response.json()
-
-class RestfulVeoFetchClient():
+class RestfulVeoFetchClient(RestfulBaseClient):
     def __init__(self,
                  api_base: str,
                  api_key: str,
                  api_type: str = "veo/fetch",
                  model_id: str = "veo3",
-                 http_client=None):
-        self.api_base = api_base
-        self.api_key = api_key
-        self.api_type = api_type
-        self.model_id = model_id
-
-        self.http_client = http_client
+                 http_client=None,
+                 transport: Optional[RestfulTransport] = None):
+        super().__init__(api_base, api_key, api_type, model_id, http_client=http_client, transport=transport)
 
-    def completion(self,
-                   model,
-                   name: str,
-                   **kwargs):
+    def _build_request(self,
+                       model,
+                       name: str,
+                       **kwargs):
         headers = {
             "app_key": self.api_key,
             "Content-Type": "application/json"
@@ -277,13 +402,7 @@ class RestfulVeoFetchClient():
         if kwargs:
             data.update(kwargs)
 
-        response = requests.post(
-            f"{self.api_base}/{self.api_type}",
-            json=data,
-            headers=headers,
-        )
-
-        return response.json()
+        return {"json": data, "headers": headers}
 
 class RestfulModel(ApiModel):
     """This model connects to an OpenAI-compatible API server.
@@ -306,6 +425,8 @@ class RestfulModel(ApiModel):
             Useful for specific models that do not support specific message roles like "system".
         flatten_messages_as_text (`bool`, default `False`):
             Whether to flatten messages as text.
+        transport (`RestfulTransport`, *optional*):
+            Pooled HTTP transport used by the client. Defaults to the transport shared by all Restful clients.
         **kwargs:
             Additional keyword arguments to pass to the OpenAI API.
     """
@@ -319,6 +440,7 @@ class RestfulModel(ApiModel):
         custom_role_conversions: dict[str, str] | None = None,
         flatten_messages_as_text: bool = False,
         http_client=None,
+        transport: Optional[RestfulTransport] = None,
         **kwargs,
     ):
         self.model_id = model_id
@@ -332,6 +454,7 @@ class RestfulModel(ApiModel):
         )
 
         self.http_client = http_client
+        self.transport = transport
 
         self.message_manager = MessageManager(model_id=model_id)
 
@@ -347,7 +470,8 @@ class RestfulModel(ApiModel):
                              api_key=self.api_key,
                              api_type=self.api_type,
                              model_id=self.model_id,
-                             http_client=self.http_client)
+                             http_client=self.http_client,
+                             transport=self.transport)
 
     def _prepare_completion_kwargs(
             self,
@@ -477,8 +601,8 @@ class RestfulModel(ApiModel):
             **kwargs,
         )
 
-        # Async call to the LiteLLM client for completion
-        response = self.client.completion(**completion_kwargs)
+        # Async call through the pooled transport, so the event loop is not blocked
+        response = await self.client.acompletion(**completion_kwargs)
 
         response = ChatCompletion.model_validate(response)
 
@@ -521,6 +645,7 @@ class RestfulTranscribeModel(ApiModel):
                  api_key: Optional[str] = None,
                  api_type: str = "wisper",
                  http_client=None,
+                 transport: Optional[RestfulTransport] = None,
                  **kwargs):
         self.model_id = model_id
         self.api_base = api_base
@@ -528,6 +653,7 @@ class RestfulTranscribeModel(ApiModel):
         self.api_type = api_type
 
         self.http_client = http_client
+        self.transport = transport
 
         super().__init__(model_id=model_id, **kwargs)
 
@@ -536,7 +662,8 @@ class RestfulTranscribeModel(ApiModel):
                                        api_key=self.api_key,
                                        api_type=self.api_type,
                                        model_id=self.model_id,
-                                       http_client=self.http_client)
+                                       http_client=self.http_client,
+                                       transport=self.transport)
 
     def generate(
         self,
@@ -589,6 +716,7 @@ class RestfulImagenModel(ApiModel):
                  api_key: Optional[str] = None,
                  api_type: str = "imagen",
                  http_client=None,
+                 transport: Optional[RestfulTransport] = None,
                  **kwargs):
         self.model_id = model_id
         self.api_base = api_base
@@ -596,6 +724,7 @@ class RestfulImagenModel(ApiModel):
         self.api_type = api_type
 
         self.http_client = http_client
+        self.transport = transport
 
         super().__init__(model_id=model_id, **kwargs)
 
@@ -604,7 +733,8 @@ class RestfulImagenModel(ApiModel):
                                    api_key=self.api_key,
                                    api_type=self.api_type,
                                    model_id=self.model_id,
-                                   http_client=self.http_client)
+                                   http_client=self.http_client,
+                                   transport=self.transport)
 
     def generate(
         self,
@@ -659,6 +789,7 @@ class RestfulVeoPridictModel(ApiModel):
                  api_key: Optional[str] = None,
                  api_type: str = "veo/predict",
                  http_client=None,
+                 transport: Optional[RestfulTransport] = None,
                  **kwargs):
 
 
@@ -668,6 +799,7 @@ class RestfulVeoPridictModel(ApiModel):
         self.api_type = api_type
 
         self.http_client = http_client
+        self.transport = transport
 
         super().__init__(model_id=model_id, **kwargs)
 
@@ -676,7 +808,8 @@ class RestfulVeoPridictModel(ApiModel):
                                        api_key=self.api_key,
                                        api_type=self.api_type,
                                        model_id=self.model_id,
-                                       http_client=self.http_client)
+                                       http_client=self.http_client,
+                                       transport=self.transport)
 
     def generate(
         self,
@@ -733,6 +866,7 @@ class RestfulVeoFetchModel(ApiModel):
                  api_key: Optional[str] = None,
                  api_type: str = "veo/fetch",
                  http_client=None,
+                 transport: Optional[RestfulTransport] = None,
                  **kwargs):
 
         self.model_id = model_id
@@ -741,6 +875,7 @@ class RestfulVeoFetchModel(ApiModel):
         self.api_type = api_type
 
         self.http_client = http_client
+        self.transport = transport
 
         super().__init__(model_id=model_id, **kwargs)
 
@@ -749,7 +884,8 @@ class RestfulVeoFetchModel(ApiModel):
                                        api_key=self.api_key,
                                        api_type=self.api_type,
                                        model_id=self.model_id,
-                                       http_client=self.http_client)
+                                       http_client=self.http_client,
+                                       transport=self.transport)
 
     def generate(
         self,
@@ -806,6 +942,8 @@ class RestfulResponseModel(ApiModel):
             Useful for specific models that do not support specific message roles like "system".
         flatten_messages_as_text (`bool`, default `False`):
             Whether to flatten messages as text.
+        transport (`RestfulTransport`, *optional*):
+            Pooled HTTP transport used by the client. Defaults to the transport shared by all Restful clients.
         **kwargs:
             Additional keyword arguments to pass to the OpenAI API.
     """
@@ -819,6 +957,7 @@ class RestfulResponseModel(ApiModel):
         custom_role_conversions: dict[str, str] | None = None,
         flatten_messages_as_text: bool = False,
         http_client=None,
+        transport: Optional[RestfulTransport] = None,
         **kwargs,
     ):
         self.model_id = model_id
@@ -832,6 +971,7 @@ class RestfulResponseModel(ApiModel):
         )
 
         self.http_client = http_client
+        self.transport = transport
 
         self.message_manager = MessageManager(model_id=model_id)
 
@@ -847,7 +987,8 @@ class RestfulResponseModel(ApiModel):
                              api_key=self.api_key,
                              api_type=self.api_type,
                              model_id=self.model_id,
-                             http_client=self.http_client)
+                             http_client=self.http_client,
+                             transport=self.transport)
 
     def _prepare_completion_kwargs(
             self,
@@ -985,8 +1126,8 @@ class RestfulResponseModel(ApiModel):
             **kwargs,
         )
 
-        # Async call to the LiteLLM client for completion
-        response = self.client.completion(**completion_kwargs)
+        # Async call through the pooled transport, so the event loop is not blocked
+        response = await self.client.acompletion(**completion_kwargs)
 
         self._last_input_token_count = response["usage"]["input_tokens"]
         self._last_output_token_count = response["usage"]["output_tokens"]
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+🗂️ IZA OS SECURITY EVENT LOG
+============================
+Append-only, segment-rotated record log for security events and audit logs
+Each append writes one length-prefixed record; recovery memory-maps the newest segments
+"""
+
+import bisect
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Record: payload length, crc32 of the payload, unix timestamp, then the JSON payload
+RECORD_HEADER = struct.Struct("<IId")
+# Time index entry: unix timestamp, byte offset of the record in its segment
+INDEX_ENTRY = struct.Struct("<dQ")
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """Serialize a record payload, datetimes as ISO strings"""
+    return json.dumps(record, default=_json_default, separators=(",", ":")).encode()
+
+
+def scan_records(buffer, start: int = 0) -> Iterator[Tuple[int, float, bytes]]:
+    """Yield (offset, timestamp, payload) until the end of the buffer or the first torn record"""
+    offset = start
+    end = len(buffer)
+    while offset + RECORD_HEADER.size <= end:
+        length, crc, timestamp = RECORD_HEADER.unpack_from(buffer, offset)
+        payload_start = offset + RECORD_HEADER.size
+        if payload_start + length > end:
+            return
+        payload = buffer[payload_start:payload_start + length]
+        if zlib.crc32(payload) != crc:
+            return
+        yield offset, timestamp, payload
+        offset = payload_start + length
+
+
+class SegmentedEventLog:
+    """Append-only record log split into size-rotated segments with a sparse time index"""
+
+    def __init__(self, directory: Path, segment_bytes: int = 8 * 1024 * 1024,
+                 max_segments: int = 64, index_interval: int = 128, fsync: bool = False):
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.index_interval = index_interval
+        self.fsync = fsync
+        self.appended = 0
+        self._segments: Optional[List[int]] = None
+        self._file = None
+        self._index_file = None
+        self._size = 0
+        self._records_in_segment = 0
+        self._tail_checked = False
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"{segment:08d}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, segment: int) -> Path:
+        return self.directory / f"{segment:08d}{INDEX_SUFFIX}"
+
+    @property
+    def segments(self) -> List[int]:
+        if self._segments is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._segments = sorted(int(path.stem) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        return self._segments
+
+    def _valid_end(self, segment: int) -> Tuple[int, int]:
+        """Byte length and record count of the intact prefix of a segment"""
+        path = self._segment_path(segment)
+        size = path.stat().st_size
+        if size == 0:
+            return 0, 0
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            end = count = 0
+            for offset, _, payload in scan_records(buffer):
+                end = offset + RECORD_HEADER.size + len(payload)
+                count += 1
+        return end, count
+
+    def _repair_tail(self) -> None:
+        """Truncate a record torn by a crash so appends continue from a clean boundary"""
+        if self._tail_checked or not self.segments:
+            self._tail_checked = True
+            return
+        segment = self.segments[-1]
+        path = self._segment_path(segment)
+        end, _ = self._valid_end(segment)
+        if end < path.stat().st_size:
+            logger.warning(f"⚠️ Truncating torn record in {path} at byte {end}")
+            with open(path, "r+b") as f:
+                f.truncate(end)
+            # Index entries past the cut would point into records written later
+            entries = [entry for entry in self._read_index(segment) if entry[1] < end]
+            self._index_path(segment).write_bytes(b"".join(INDEX_ENTRY.pack(*entry) for entry in entries))
+        self._tail_checked = True
+
+    def _open_segment(self, segment: int) -> None:
+        self._close_files()
+        path = self._segment_path(segment)
+        self._file = open(path, "ab")
+        self._index_file = open(self._index_path(segment), "ab")
+        self._size = self._file.tell()
+        self._records_in_segment = self._valid_end(segment)[1] if self._size else 0
+
+    def _rotate(self) -> None:
+        segment = self.segments[-1] + 1 if self.segments else 0
+        self.segments.append(segment)
+        self._open_segment(segment)
+
+        # Retention: drop the oldest segments beyond max_segments
+        while len(self.segments) > self.max_segments:
+            oldest = self.segments.pop(0)
+            self._segment_path(oldest).unlink(missing_ok=True)
+            self._index_path(oldest).unlink(missing_ok=True)
+
+    def _write(self, record: Dict[str, Any], timestamp: float) -> None:
+        payload = encode_record(record)
+        if self._file is None:
+            self._repair_tail()
+            if self.segments:
+                self._open_segment(self.segments[-1])
+            else:
+                self._rotate()
+        if self._size and self._size + RECORD_HEADER.size + len(payload) > self.segment_bytes:
+            self._rotate()
+
+        if self._records_in_segment % self.index_interval == 0:
+            self._index_file.write(INDEX_ENTRY.pack(timestamp, self._size))
+
+        self._file.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload), timestamp))
+        self._file.write(payload)
+
+        self._size += RECORD_HEADER.size + len(payload)
+        self._records_in_segment += 1
+        self.appended += 1
+
+    def _sync(self) -> None:
+        self._index_file.flush()
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def append(self, record: Dict[str, Any], timestamp: float) -> None:
+        """Write one record; only the new bytes reach the disk"""
+        self._write(record, timestamp)
+        self._sync()
+
+    def append_many(self, records: Iterable[Tuple[Dict[str, Any], float]]) -> int:
+        """Write (record, timestamp) pairs with a single flush at the end"""
+        count = 0
+        for record, timestamp in records:
+            self._write(record, timestamp)
+            count += 1
+        if count:
+            self._sync()
+        return count
+
+    def recover(self, limit: int) -> List[Dict[str, Any]]:
+        """Return the newest limit records, memory-mapping segments from the tail backwards"""
+        self._repair_tail()
+        payloads: List[bytes] = []
+        for segment in reversed(self.segments):
+            path = self._segment_path(segment)
+            if path.stat().st_size == 0:
+                continue
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                segment_payloads = [payload for _, _, payload in scan_records(buffer)]
+            payloads = segment_payloads + payloads
+            if len(payloads) >= limit:
+                break
+        # Only the records that fit the window are decoded
+        return [json.loads(payload) for payload in payloads[-limit:]] if limit > 0 else []
+
+    def _read_index(self, segment: int) -> List[Tuple[float, int]]:
+        path = self._index_path(segment)
+        if not path.exists():
+            return []
+        data = path.read_bytes()
+        data = data[:len(data) - len(data) % INDEX_ENTRY.size]
+        return list(INDEX_ENTRY.iter_unpack(data))
+
+    def read_since(self, since: float) -> Iterator[Dict[str, Any]]:
+        """Yield records stamped at or after since; timestamps are assumed non-decreasing"""
+        if self._file is not None:
+            self._file.flush()
+        segments = self.segments
+        indexes = {segment: self._read_index(segment) for segment in segments}
+
+        # Everything before the last segment that starts earlier than since is older
+        firsts = [indexes[segment][0][0] if indexes[segment] else float("-inf") for segment in segments]
+        position = max(bisect.bisect_left(firsts, since) - 1, 0)
+
+        for i, segment in enumerate(segments[position:]):
+            path = self._segment_path(segment)
+            if path.stat().st_size == 0:
+                continue
+            start = 0
+            if i == 0:
+                entries = indexes[segment]
+                slot = bisect.bisect_left([ts for ts, _ in entries], since) - 1
+                start = entries[slot][1] if slot >= 0 else 0
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                for _, timestamp, payload in scan_records(buffer, start):
+                    if timestamp >= since:
+                        yield json.loads(payload)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "segments": len(self.segments),
+            "bytes": sum(self._segment_path(s).stat().st_size for s in self.segments),
+            "appended": self.appended,
+        }
+
+    def _close_files(self) -> None:
+        for f in (self._file, self._index_file):
+            if f is not None:
+                f.close()
+        self._file = self._index_file = None
+
+    def close(self) -> None:
+        self._close_files()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+IZA OS Task Dependency Graph
+In-memory DAG for the task orchestrator: every task keeps a count of unmet
+dependencies and enters a priority heap of ready tasks when it reaches zero
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+PENDING = "pending"
+CLAIMED = "in_progress"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# (name, priority, dependencies, status, order) as loaded from the tasks table
+TaskRow = Tuple[str, int, Sequence[str], str, int]
+
+
+class TaskCycleError(ValueError):
+    """Raised when task dependencies form a cycle"""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__("Task dependency cycle: " + " -> ".join(cycle + cycle[:1]))
+
+
+@dataclass
+class TaskNode:
+    """A task in the dependency graph"""
+    name: str
+    priority: int
+    order: int
+    dependencies: Tuple[str, ...]
+    status: str = PENDING
+    unmet: int = 0
+
+
+@dataclass
+class TaskGraph:
+    """Dependency graph with indegree counters and a heap of ready tasks"""
+    nodes: Dict[str, TaskNode] = field(default_factory=dict)
+    dependents: Dict[str, Set[str]] = field(default_factory=dict)
+    _ready: List[Tuple[int, int, str]] = field(default_factory=list)
+
+    @classmethod
+    def from_tasks(cls, rows: Iterable[TaskRow]) -> "TaskGraph":
+        """Build a graph from task rows, raising TaskCycleError on a cycle"""
+        graph = cls()
+        for name, priority, dependencies, status, order in rows:
+            graph.add_task(name, priority, dependencies, status, order)
+        graph.check_acyclic()
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.nodes
+
+    def add_task(self, name: str, priority: int, dependencies: Sequence[str] = (),
+                 status: str = PENDING, order: Optional[int] = None) -> None:
+        """Add a task; dependencies that are not in the graph yet count as unmet"""
+        if name in self.nodes:
+            raise ValueError(f"Task already in graph: {name}")
+        node = TaskNode(name, priority, len(self.nodes) if order is None else order,
+                        tuple(dict.fromkeys(dependencies)), status)
+        for dep in node.dependencies:
+            self.dependents.setdefault(dep, set()).add(name)
+            dep_node = self.nodes.get(dep)
+            if dep_node is None or dep_node.status != COMPLETED:
+                node.unmet += 1
+        self.nodes[name] = node
+        self._push_if_ready(node)
+
+        if status == COMPLETED:
+            self._release_dependents(name)
+
+    def check_acyclic(self) -> None:
+        """Raise TaskCycleError naming one cycle if the dependencies are not a DAG"""
+        # Kahn's algorithm over the edges between known tasks
+        indegree = {
+            name: sum(1 for dep in node.dependencies if dep in self.nodes)
+            for name, node in self.nodes.items()
+        }
+        queue = [name for name, count in indegree.items() if count == 0]
+        while queue:
+            name = queue.pop()
+            for child in self.dependents.get(name, ()):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+
+        remaining = {name for name, count in indegree.items() if count}
+        if not remaining:
+            return
+
+        # Every remaining task has a remaining dependency, so walking them must revisit a task
+        path: List[str] = []
+        seen: Dict[str, int] = {}
+        name = min(remaining)
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = next(dep for dep in self.nodes[name].dependencies if dep in remaining)
+        raise TaskCycleError(path[seen[name]:])
+
+    def missing_dependencies(self) -> Dict[str, List[str]]:
+        """Dependencies that name no known task, so their dependents can never run"""
+        return {
+            name: [dep for dep in node.dependencies if dep not in self.nodes]
+            for name, node in self.nodes.items()
+            if any(dep not in self.nodes for dep in node.dependencies)
+        }
+
+    def is_ready(self, name: str) -> bool:
+        node = self.nodes.get(name)
+        return node is not None and node.status == PENDING and node.unmet == 0
+
+    @property
+    def ready_count(self) -> int:
+        return sum(1 for _, _, name in self._ready if self.is_ready(name))
+
+    @property
+    def claimed(self) -> List[str]:
+        return [name for name, node in self.nodes.items() if node.status == CLAIMED]
+
+    def peek_ready(self, limit: int) -> List[str]:
+        """Highest priority ready tasks without claiming them"""
+        entries = heapq.nsmallest(limit, (entry for entry in self._ready if self.is_ready(entry[2])))
+        return [name for _, _, name in entries]
+
+    def pop_ready(self, limit: int = 1) -> List[str]:
+        """Claim up to limit ready tasks in priority order"""
+        claimed = []
+        while self._ready and len(claimed) < limit:
+            _, _, name = heapq.heappop(self._ready)
+            # Entries go stale when a task is completed or claimed elsewhere
+            if self.is_ready(name):
+                self.nodes[name].status = CLAIMED
+                claimed.append(name)
+        return claimed
+
+    def release(self, name: str) -> None:
+        """Return a claimed task to the ready heap"""
+        node = self.nodes[name]
+        if node.status == CLAIMED:
+            node.status = PENDING
+            self._push_if_ready(node)
+
+    def mark_completed(self, name: str) -> List[str]:
+        """Record a completion event and return the tasks it made ready"""
+        node = self.nodes[name]
+        if node.status == COMPLETED:
+            return []
+        node.status = COMPLETED
+        return self._release_dependents(name)
+
+    def mark_failed(self, name: str) -> None:
+        """Record a failure; dependents stay blocked"""
+        node = self.nodes[name]
+        if node.status != COMPLETED:
+            node.status = FAILED
+
+    def _push_if_ready(self, node: TaskNode) -> None:
+        if node.status == PENDING and node.unmet == 0:
+            heapq.heappush(self._ready, (node.priority, node.order, node.name))
+
+    def _release_dependents(self, name: str) -> List[str]:
+        ready = []
+        for child in self.dependents.get(name, ()):
+            child_node = self.nodes.get(child)
+            if child_node is None:
+                continue
+            child_node.unmet -= 1
+            if child_node.status == PENDING and child_node.unmet == 0:
+                self._push_if_ready(child_node)
+                ready.append(child)
+        return ready
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from audit_writer import BLOCK, DROP, AuditWriter
+
+
+class Sink:
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+
+    async def __call__(self, batch):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.batches.append(list(batch))
+
+    @property
+    def records(self):
+        return [record for batch in self.batches for record in batch]
+
+
+def test_batches_by_size_and_flushes_on_stop():
+    async def scenario():
+        sink = Sink()
+        writer = AuditWriter(sink, batch_size=10, flush_interval=60)
+        await writer.start()
+        for i in range(25):
+            await writer.submit(i)
+        await asyncio.sleep(0.01)
+        # Two full batches go out without waiting for the interval
+        assert [len(b) for b in sink.batches] == [10, 10]
+        await writer.stop()
+        return sink, writer
+
+    sink, writer = asyncio.run(scenario())
+    assert sink.records == list(range(25))
+    assert writer.stats()['written'] == 25
+    assert writer.stats()['depth'] == 0
+
+
+def test_partial_batch_flushes_after_interval():
+    async def scenario():
+        sink = Sink()
+        writer = AuditWriter(sink, batch_size=100, flush_interval=0.05)
+        await writer.start()
+        await writer.submit("a")
+        await writer.submit("b")
+        await asyncio.sleep(0.15)
+        flushed = list(sink.batches)
+        await writer.stop()
+        return flushed
+
+    assert asyncio.run(scenario()) == [["a", "b"]]
+
+
+def test_drop_policy_counts_records_lost_to_a_full_queue():
+    async def scenario():
+        sink = Sink()
+        writer = AuditWriter(sink, max_queue=5, batch_size=5, policy=DROP)
+        # Not started, so nothing drains the queue
+        results = [await writer.submit(i) for i in range(8)]
+        await writer.stop()
+        return results, sink, writer
+
+    results, sink, writer = asyncio.run(scenario())
+    assert results == [True] * 5 + [False] * 3
+    assert writer.counters['dropped'] == 3
+    assert sink.records == list(range(5))
+
+
+def test_block_policy_waits_for_space_and_loses_nothing():
+    async def scenario():
+        sink = Sink(delay=0.01)
+        writer = AuditWriter(sink, max_queue=4, batch_size=2, flush_interval=0.01, policy=BLOCK)
+        await writer.start()
+        await asyncio.gather(*(writer.submit(i) for i in range(40)))
+        await writer.stop()
+        return sink, writer
+
+    sink, writer = asyncio.run(scenario())
+    assert sorted(sink.records) == list(range(40))
+    assert writer.counters['blocked'] > 0
+    assert writer.counters['dropped'] == 0
+
+
+def test_flush_failures_are_counted():
+    async def failing(batch):
+        raise IOError("disk full")
+
+    async def scenario():
+        writer = AuditWriter(failing, batch_size=3)
+        await writer.start()
+        for i in range(3):
+            await writer.submit(i)
+        await writer.stop()
+        assert not await writer.submit(99)
+        return writer
+
+    writer = asyncio.run(scenario())
+    assert writer.counters['failed'] == 3
+    assert writer.counters['dropped'] == 1
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        AuditWriter(Sink(), policy="spill")
@@ -0,0 +1,230 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from business_intelligence_system import (
+    BusinessIntelligenceEngine,
+    CSVExtractor,
+    ColumnAggregate,
+    DataPipeline,
+    MetricsCache,
+    RollingMean,
+    RunningMoments,
+    StreamingTransformer,
+    TRAINERS,
+    TrainingScheduler,
+)
+
+TRANSFORMATIONS = ["calculate_returns", "add_technical_indicators", "add_ewma"]
+
+
+def test_refresh_stream_adds_one_daily_row_per_day():
+    pipeline = DataPipeline()
+    end = datetime(2025, 3, 10, 14, 5, 3, 124)
+
+    backfill = asyncio.run(pipeline.refresh_stream("revenue", TRANSFORMATIONS, end))
+    assert len(backfill) == 31
+
+    # Hourly refreshes later the same day find no new daily row
+    for hours in (1, 2, 9):
+        assert asyncio.run(pipeline.refresh_stream("revenue", TRANSFORMATIONS, end + timedelta(hours=hours))).empty
+
+    next_day = asyncio.run(pipeline.refresh_stream("revenue", TRANSFORMATIONS, end + timedelta(days=1)))
+    assert list(next_day["date"]) == [pd.Timestamp(2025, 3, 11)]
+
+
+def test_refresh_stream_resumes_after_the_last_row_of_timestamped_sources():
+    pipeline = DataPipeline()
+    end = datetime(2025, 3, 10, 14)
+
+    asyncio.run(pipeline.refresh_stream("system_performance", [], end, backfill=timedelta(days=1)))
+    refreshed = asyncio.run(pipeline.refresh_stream("system_performance", [], end + timedelta(hours=1)))
+    assert list(refreshed["timestamp"]) == [pd.Timestamp(2025, 3, 10, 15)]
+
+
+
+def hourly_history(hours=200):
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-01 05:00", periods=hours, freq="h"),
+        "revenue": 1000 + np.cumsum(rng.normal(0, 10, hours)),
+        "valuation": 5e6 + np.cumsum(rng.normal(0, 1e4, hours)),
+    })
+
+
+def assert_frames_close(actual, expected):
+    assert list(actual.columns) == list(expected.columns)
+    numeric = expected.select_dtypes(include=[np.number]).columns
+    np.testing.assert_allclose(actual[numeric].to_numpy(float), expected[numeric].to_numpy(float), rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("transformations", [
+    ["calculate_returns", "add_technical_indicators", "add_ewma"],
+    ["calculate_returns", "add_technical_indicators", "add_ewma", "normalize"],
+])
+def test_streaming_batches_match_transform_data_on_the_history_so_far(transformations):
+    pipeline, history = DataPipeline(), hourly_history()
+    stream = StreamingTransformer(transformations)
+    seen = 0
+    for size in (40, 1, 7, 25, 127):
+        emitted = stream.update(history.iloc[seen:seen + size])
+        seen += size
+        full = asyncio.run(pipeline.transform_data(history.iloc[:seen], transformations))
+        assert_frames_close(emitted.reset_index(drop=True), full.iloc[-size:].reset_index(drop=True))
+
+
+def test_streaming_rejects_transformations_after_normalize():
+    with pytest.raises(ValueError, match="normalize"):
+        StreamingTransformer(["normalize", "add_technical_indicators"])
+
+
+def test_streaming_daily_aggregation_holds_back_the_open_day():
+    pipeline, history = DataPipeline(), hourly_history()
+    stream = StreamingTransformer(["aggregate_daily"])
+    # Split mid-day, so the first batch ends inside a day the second one completes
+    emitted = pd.concat([stream.update(history.iloc[:30]), stream.update(history.iloc[30:])], ignore_index=True)
+    full = asyncio.run(pipeline.transform_data(history, ["aggregate_daily"]))
+    assert_frames_close(emitted, full.iloc[:-1].reset_index(drop=True))
+    assert len(stream.open_day) == (history["timestamp"].dt.date == full["date"].iloc[-1]).sum()
+
+
+def test_running_moments_match_batch_statistics_and_skip_nans():
+    rng = np.random.default_rng(3)
+    values = rng.normal(5, 2, (500, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[:, 2] = 4.0
+    moments = RunningMoments(3)
+    for batch in np.array_split(values, [1, 2, 50, 300]):
+        moments.update(batch)
+    np.testing.assert_allclose(moments.mean, np.nanmean(values, axis=0))
+    # Constant columns scale by 1, as with StandardScaler
+    np.testing.assert_allclose(moments.std, [*np.nanstd(values[:, :2], axis=0), 1.0])
+
+
+def test_rolling_mean_matches_pandas_across_batches():
+    values = np.arange(100, dtype=float) ** 1.5
+    values[[20, 55]] = np.nan
+    rolling = RollingMean(7)
+    streamed = np.concatenate([rolling.update(batch) for batch in np.array_split(values, [3, 4, 40, 41])])
+    np.testing.assert_allclose(streamed, pd.Series(values).rolling(7).mean().to_numpy())
+
+def revenue_engine(csv_path):
+    pipeline = DataPipeline()
+    pipeline.register_extractor("revenue", CSVExtractor(str(csv_path)))
+    return BusinessIntelligenceEngine(pipeline, None)
+
+
+@pytest.fixture
+def revenue_csv(tmp_path):
+    dates = pd.date_range("2025-01-01", "2025-03-31", freq="D")
+    day = np.arange(len(dates))
+    path = tmp_path / "revenue.csv"
+    pd.DataFrame({"date": dates, "revenue": 1000 + 10 * day + 50 * np.sin(day)}).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("transformations", [(), ("normalize",), ("calculate_returns", "add_technical_indicators")])
+def test_cached_aggregates_match_a_fresh_full_range(revenue_csv, transformations):
+    engine = revenue_engine(revenue_csv)
+    # Warm the cache with a window inside the one queried next
+    asyncio.run(engine.aggregate_source("revenue", datetime(2025, 1, 10), datetime(2025, 2, 10), transformations))
+    reused = asyncio.run(engine.aggregate_source("revenue", datetime(2025, 1, 1), datetime(2025, 3, 1), transformations))
+    fresh = asyncio.run(revenue_engine(revenue_csv).aggregate_source(
+        "revenue", datetime(2025, 1, 1), datetime(2025, 3, 1), transformations
+    ))
+
+    assert asdict(reused["revenue"]) == pytest.approx(asdict(fresh["revenue"]))
+    assert reused["revenue"].count == 60
+    assert engine.metrics_cache.days_reused == (0 if transformations else 32)
+
+
+def test_invalidated_days_are_recomputed_from_changed_data(revenue_csv):
+    engine = revenue_engine(revenue_csv)
+    window = (datetime(2025, 1, 1), datetime(2025, 3, 1))
+    asyncio.run(engine.aggregate_source("revenue", *window))
+
+    # Late-arriving corrections from March onwards
+    df = pd.read_csv(revenue_csv, parse_dates=["date"])
+    df.loc[df["date"] >= "2025-03-01", "revenue"] += 500
+    df.to_csv(revenue_csv, index=False)
+    engine.metrics_cache.invalidate(source="revenue", since=datetime(2025, 3, 1).date())
+
+    recomputed = asyncio.run(engine.aggregate_source("revenue", *window))
+    fresh = asyncio.run(revenue_engine(revenue_csv).aggregate_source("revenue", *window))
+    assert asdict(recomputed["revenue"]) == pytest.approx(asdict(fresh["revenue"]))
+    assert engine.metrics_cache.days_reused == 59
+
+
+def test_metrics_cache_expires_today_before_settled_days(monkeypatch):
+    cache = MetricsCache(ttl_seconds=60, settled_ttl_seconds=3600)
+    today, settled = datetime.now().date(), datetime(2025, 1, 1).date()
+    aggregates = {"revenue": ColumnAggregate(1, 10.0, 10.0, 10.0)}
+    cache.set_day("revenue", today, aggregates)
+    cache.set_day("revenue", settled, aggregates)
+    cache.set_result(("key",), [1])
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.get_day("revenue", today) is None
+    assert cache.get_day("revenue", settled) == aggregates
+    assert cache.get_result(("key",)) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_column_aggregates_merge_like_one_span():
+    values = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0])
+    parts = [ColumnAggregate(len(p), float(p.sum()), float(p[0]), float(p[-1])) for p in (values[:2], values[2:5], values[5:])]
+    merged = ColumnAggregate(0, 0.0, float("nan"), float("nan"))
+    for part in parts:
+        merged = merged.merge(part)
+    assert merged == ColumnAggregate(6, values.sum(), 3.0, 9.0)
+    assert merged.mean == pytest.approx(values.mean())
+
+
+@pytest.fixture
+def slow_trainer(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setitem(TRAINERS, "revenue_prediction", lambda data, n_jobs: release.wait(5))
+    yield
+    release.set()
+
+
+async def install_nothing(job, result):
+    pass
+
+
+def test_cancelled_training_job_is_not_left_running(slow_trainer):
+    async def scenario():
+        scheduler = TrainingScheduler()
+        scheduler._executor = ThreadPoolExecutor(1)
+        job = scheduler.submit("revenue_prediction", pd.DataFrame(), install_nothing)
+        await asyncio.sleep(0.05)
+        assert job.status == "running"
+        scheduler._tasks[job.job_id].cancel()
+        return await scheduler.wait(job.job_id)
+
+    job = asyncio.run(scenario())
+    assert job.status == "cancelled"
+    assert job.finished_at is not None
+
+
+def test_shutdown_cancels_running_and_queued_jobs(slow_trainer):
+    async def scenario():
+        scheduler = TrainingScheduler()
+        scheduler._executor = ThreadPoolExecutor(1)
+        running = scheduler.submit("revenue_prediction", pd.DataFrame(), install_nothing)
+        await asyncio.sleep(0.05)
+        # Cancelled before the event loop ever steps it
+        queued = scheduler.submit("revenue_prediction", pd.DataFrame(), install_nothing)
+        scheduler.shutdown()
+        await scheduler.wait(running.job_id)
+        return scheduler.list_jobs()
+
+    assert [job.status for job in asyncio.run(scenario())] == ["cancelled", "cancelled"]
@@ -0,0 +1,146 @@
+import asyncio
+import random
+
+import fakeredis.aioredis
+import pytest
+
+from event_counters import RedisWindowCounters, RollingEventTotals, SlidingWindowCounters
+
+T0 = 1_700_000_000.0
+KEY = ("ip", "10.0.0.1", "login")
+
+
+def test_minute_window_slides_per_second():
+    counters = SlidingWindowCounters()
+    for second in range(90):
+        counters.add([KEY], T0 + second)
+        counters.add([KEY], T0 + second + 0.5)
+
+    # Seconds 30..89 are inside the minute ending at second 89
+    assert counters.count(KEY, 60, T0 + 89) == 120
+    assert counters.count(KEY, 10, T0 + 89) == 20
+    assert counters.count(KEY, 60, T0 + 119) == 60
+    assert counters.count(KEY, 60, T0 + 200) == 0
+    assert counters.count(("ip", "10.0.0.2", "login"), 60, T0 + 89) == 0
+
+
+def test_hour_window_uses_minute_buckets():
+    counters = SlidingWindowCounters()
+    for minute in range(120):
+        counters.add([KEY], T0 - T0 % 60 + minute * 60)
+
+    now = T0 - T0 % 60 + 119 * 60
+    assert counters.count(KEY, 3600, now) == 60
+    assert counters.count(KEY, 300, now) == 5
+    with pytest.raises(ValueError):
+        counters.count(KEY, 7200, now)
+
+
+def test_matches_a_brute_force_count_on_random_events():
+    counters = SlidingWindowCounters()
+    rng = random.Random(3)
+    times = sorted(T0 + rng.uniform(0, 600) for _ in range(5000))
+    for t in times:
+        counters.add([KEY], t)
+
+    now = times[-1]
+    expected = sum(1 for t in times if int(t) > int(now) - 60)
+    assert counters.count(KEY, 60, now) == expected
+
+
+def test_idle_keys_are_evicted_and_memory_is_bounded():
+    counters = SlidingWindowCounters(max_keys=1000)
+    for i in range(5000):
+        counters.add([("ip", f"10.0.{i // 256}.{i % 256}", "api_request")], T0 + i / 1000)
+    assert len(counters) <= 1000 + 1
+    assert counters.evicted > 0
+
+    counters = SlidingWindowCounters()
+    counters.add([KEY], T0)
+    counters.add([("ip", "10.0.0.9", "login")], T0 + 3600)
+    counters.add([("ip", "10.0.0.9", "login")], T0 + 7200)
+    assert counters.count(KEY, 3600, T0 + 7200) == 0
+    assert KEY not in counters._current and KEY not in counters._previous
+    assert counters.count(("ip", "10.0.0.9", "login"), 3600, T0 + 7200) == 1
+
+
+def test_redis_counters_agree_with_local_counts():
+    async def scenario():
+        client = fakeredis.aioredis.FakeRedis()
+        # Two workers sharing one Redis see each other's events
+        worker_a, worker_b = RedisWindowCounters(client), RedisWindowCounters(client)
+        local = SlidingWindowCounters()
+        for second in range(90):
+            worker = worker_a if second % 2 else worker_b
+            await worker.add([KEY], T0 + second)
+            local.add([KEY], T0 + second)
+        return [
+            (await worker_a.count(KEY, seconds, T0 + 89), local.count(KEY, seconds, T0 + 89))
+            for seconds in (10, 60, 3600)
+        ]
+
+    for shared, local in asyncio.run(scenario()):
+        assert shared == local
+
+
+SEVERITIES = ['low', 'medium', 'high', 'critical']
+DEDUCTIONS = {'critical': 10, 'high': 5, 'medium': 2, 'low': 0.5}
+
+
+def scan_metrics(events, now):
+    """get_security_metrics and _calculate_security_score as full scans over the events"""
+    recent = [e for e in events if e[0] > now - 24 * 3600]
+    score = 100.0
+    event_types = {}
+    for _, severity, event_type in recent:
+        score -= DEDUCTIONS[severity]
+        event_types[event_type] = event_types.get(event_type, 0) + 1
+    return {
+        'total_events_24h': len(recent),
+        'critical_events_24h': len([e for e in recent if e[1] == 'critical']),
+        'high_events_24h': len([e for e in recent if e[1] == 'high']),
+        'security_score': max(score, 0.0),
+        'event_types': event_types,
+    }
+
+
+def totals_metrics(totals, now):
+    severities = totals.by_severity(now)
+    score = 100.0
+    for severity, deduction in DEDUCTIONS.items():
+        score -= severities.get(severity, 0) * deduction
+    return {
+        'total_events_24h': sum(severities.values()),
+        'critical_events_24h': severities.get('critical', 0),
+        'high_events_24h': severities.get('high', 0),
+        'security_score': max(score, 0.0),
+        'event_types': totals.by_event_type(now),
+    }
+
+
+def test_rolling_totals_match_the_24h_scan():
+    rng = random.Random(8)
+    start = T0 - T0 % 60
+    events = sorted(
+        (start + rng.uniform(0, 40 * 3600), rng.choice(SEVERITIES), rng.choice(['login', 'api_request', 'xss']))
+        for _ in range(20_000)
+    )
+    totals = RollingEventTotals()
+    checkpoints = [start + hours * 3600 for hours in (1, 12, 24, 30, 40)]
+    for timestamp, severity, event_type in events:
+        while checkpoints and checkpoints[0] < timestamp:
+            now = checkpoints.pop(0)
+            seen = [e for e in events if e[0] <= now]
+            assert totals_metrics(totals, now) == scan_metrics(seen, now)
+        totals.add(severity, event_type, timestamp)
+
+    # Between bucket edges the oldest partial minute is left out
+    totals = RollingEventTotals()
+    totals.add('high', 'login', start)
+    assert totals.counts(start) == {('high', 'login'): 1}
+    assert totals.counts(start + 24 * 3600 - 60) == {('high', 'login'): 1}
+    assert totals.counts(start + 24 * 3600 - 30) == {}
+    assert totals.counts(start + 24 * 3600) == {}
+    # Late events older than the window are not counted
+    totals.add('low', 'login', start)
+    assert totals.counts(start + 24 * 3600) == {}
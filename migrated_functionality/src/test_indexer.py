@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+INDEXER_DOC = Path(__file__).resolve().parent / "indexer.py"
+
+
+def load_indexer_classes(*names):
+    """Execute the indexer.py code blocks that define the named classes"""
+    namespace = {
+        "asyncio": asyncio, "hashlib": hashlib, "json": json, "os": os, "re": re,
+        "sqlite3": sqlite3, "time": time, "Path": Path, "logger": logging.getLogger("indexer"),
+        # Only used for Markdown frontmatter, which these tests do not read
+        "MetadataExtractor": lambda: None,
+    }
+    blocks = re.findall(r"^```python\n(.*?)^```", INDEXER_DOC.read_text(), re.MULTILINE | re.DOTALL)
+    for name in names:
+        exec(next(block for block in blocks if f"class {name}" in block), namespace)
+    return namespace
+
+
+class RecordingVectorDB:
+    def __init__(self):
+        self.upserted, self.deleted = [], []
+
+    async def upsert_chunks(self, chunks, embeddings, metadata):
+        self.upserted.extend(chunk["id"] for chunk in chunks)
+
+    async def delete_chunks(self, chunk_ids):
+        self.deleted.extend(chunk_ids)
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    ns = load_indexer_classes("IndexManifest", "ContentExtractor", "RAGIndexer")
+    indexer = ns["RAGIndexer"].__new__(ns["RAGIndexer"])
+    indexer.manifest = ns["IndexManifest"](str(tmp_path / "manifest.sqlite"))
+    indexer.content_extractor = ns["ContentExtractor"]()
+    indexer.vector_db = RecordingVectorDB()
+    return indexer
+
+
+def test_failed_extraction_keeps_existing_chunks(indexer, tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("first version")
+    old_state = {"mtime": 1.0, "size": 13, "content_hash": "old"}
+    indexer.manifest.mark_indexed(str(path), old_state, ["chunk-a", "chunk-b"])
+
+    # A non-UTF-8 byte fails to decode
+    path.write_bytes(b"second version \xff")
+    new_state = {"mtime": path.stat().st_mtime, "size": path.stat().st_size, "content_hash": "new"}
+    with pytest.raises(UnicodeDecodeError):
+        asyncio.run(indexer.process_file(str(path), new_state))
+
+    assert indexer.vector_db.deleted == []
+    entry = indexer.manifest.get(str(path))
+    assert entry["status"] == "indexed"
+    assert entry["chunk_ids"] == ["chunk-a", "chunk-b"]
+    assert entry["mtime"] == 1.0
+    # The stored stat is untouched, so the next run picks the file up again
+    assert [p for p, _ in indexer.manifest.plan([str(path)])["modified"]] == [str(path)]
+
+
+def test_empty_file_still_replaces_its_chunks(indexer, tmp_path):
+    path = tmp_path / "notes.txt"
+    indexer.manifest.mark_indexed(str(path), {"mtime": 1.0, "size": 13, "content_hash": "old"}, ["chunk-a"])
+    path.write_text("")
+    state = {"mtime": path.stat().st_mtime, "size": 0, "content_hash": "empty"}
+
+    stats = asyncio.run(indexer.process_file(str(path), state))
+
+    assert stats["deleted_chunks"] == 1
+    assert indexer.vector_db.deleted == ["chunk-a"]
+    assert indexer.manifest.get(str(path))["chunk_ids"] == []
@@ -1,12 +1,11 @@
 import unittest
-from src.tools.executor.local_python_executor import evaluate_python_code, InterpreterError, BASE_PYTHON_TOOLS, BASE_BUILTIN_MODULES, DEFAULT_MAX_LEN_OUTPUT
+from src.tools.executor.local_python_executor import evaluate_python_code, evaluate_compiled_python_code, CodeCache, LocalPythonExecutor, InterpreterError, BASE_PYTHON_TOOLS, BASE_BUILTIN_MODULES, DEFAULT_MAX_LEN_OUTPUT
 
 # It's good practice to define a small, fixed list for default authorized_imports in tests
 # unless a test specifically needs to modify it.
+# Only the "os.path" submodule: tests that import "os" itself rely on it being blocked.
 TEST_DEFAULT_AUTHORIZED_IMPORTS = [
     "math",
-    "subprocess",
-    "os",
     "os.path",
 ] # Example, can be empty if preferred for stricter tests
 
@@ -220,5 +219,108 @@ finally:
             self._evaluate(code, authorized_imports=[])
 
 
+class TestCompiledPythonInterpreterSandbox(TestPythonInterpreterSandbox):
+    """Runs every sandbox test above against the compiled execution mode."""
+
+    def _evaluate(self, code, authorized_imports=None, state=None):
+        if authorized_imports is None:
+            authorized_imports = list(TEST_DEFAULT_AUTHORIZED_IMPORTS)
+
+        current_state = state if state is not None else {}
+
+        return evaluate_compiled_python_code(
+            code,
+            static_tools=self.static_tools,
+            custom_tools=self.custom_tools,
+            state=current_state,
+            authorized_imports=authorized_imports,
+            max_print_outputs_length=DEFAULT_MAX_LEN_OUTPUT
+        )
+
+    def test_loop_result_and_print_outputs(self):
+        state = {}
+        result, is_final_answer = self._evaluate("total = 0\nfor i in range(10):\n    total += i\nprint('total', total)\ntotal", state=state)
+        self.assertEqual(result, 45)
+        self.assertFalse(is_final_answer)
+        self.assertEqual(str(state["_print_outputs"]), "total 45\n")
+
+    def test_functions_and_classes_persist_in_state(self):
+        state = {}
+        self._evaluate("class A:\n    def __init__(self, v):\n        self.v = v\ndef double(a):\n    return a.v * 2", state=state)
+        result, _ = self._evaluate("double(A(21))", state=state)
+        self.assertEqual(result, 42)
+
+    def test_final_answer(self):
+        self.static_tools["final_answer"] = lambda answer: answer
+        result, is_final_answer = self._evaluate("x = 3\nfinal_answer(x * 2)\nx = 4")
+        self.assertEqual(result, 6)
+        self.assertTrue(is_final_answer)
+
+    def test_dunder_name_blocked(self):
+        with self.assertRaisesRegex(InterpreterError, "Forbidden access to dunder name: __builtins__"):
+            self._evaluate("__builtins__")
+
+    def test_generator_frame_escape_blocked(self):
+        authorized_imports = ["math"]
+        code = """
+gen = (x for x in [1])
+frame = gen.gi_frame.f_back.f_back
+frame.f_locals["authorized_imports"].append("*")
+"""
+        with self.assertRaisesRegex(InterpreterError, "Forbidden access to attribute: f_back"):
+            self._evaluate(code, authorized_imports=authorized_imports)
+        with self.assertRaisesRegex(InterpreterError, "Forbidden access to attribute: gi_frame"):
+            self._evaluate("f = getattr((x for x in [1]), 'gi_frame')", authorized_imports=authorized_imports)
+        with self.assertRaisesRegex(InterpreterError, "Forbidden access to attribute: tb_frame"):
+            self._evaluate("try:\n    1 / 0\nexcept Exception as e:\n    e.with_traceback(None).tb_frame")
+        self.assertEqual(authorized_imports, ["math"])
+        with self.assertRaisesRegex(InterpreterError, "Import of subprocess is not allowed"):
+            self._evaluate("__import__('subprocess')", authorized_imports=authorized_imports)
+
+    def test_submodule_import_persists_across_runs(self):
+        state = {}
+        self._evaluate("import os.path", authorized_imports=["os.path"], state=state)
+        result, _ = self._evaluate("os.path.basename('/a/b')", authorized_imports=["os.path"], state=state)
+        self.assertEqual(result, "b")
+        with self.assertRaisesRegex(InterpreterError, "Forbidden access to module: os"):
+            self._evaluate("os.path.os", authorized_imports=["os.path"], state=state)
+
+
+class TestCodeCache(unittest.TestCase):
+
+    def test_parsed_code_is_reused(self):
+        cache = CodeCache()
+        first = cache.get_parsed("x = 1", ["math"])
+        second = cache.get_parsed("x = 1", ["math"])
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_authorized_imports_are_part_of_the_key(self):
+        cache = CodeCache()
+        cache.get_parsed("x = 1", ["math"])
+        cache.get_parsed("x = 1", ["math", "re"])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = CodeCache(max_size=2)
+        cache.get_parsed("a = 1", [])
+        cache.get_parsed("b = 1", [])
+        cache.get_parsed("a = 1", [])
+        cache.get_parsed("c = 1", [])
+        cache.get_parsed("b = 1", [])
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_executor_counts_hits_across_steps(self):
+        for compiled in (False, True):
+            executor = LocalPythonExecutor([], compiled=compiled)
+            executor.send_tools({})
+            for _ in range(3):
+                output, _, _ = executor("y = 2 * 21")
+            self.assertEqual(output, 42)
+            stats = executor.cache_stats()
+            self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+
 if __name__ == "__main__":
     unittest.main()
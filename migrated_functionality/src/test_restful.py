@@ -0,0 +1,105 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.models.restful import RestfulClient, RestfulTransport
+
+RESPONSE_DELAY = 0.2
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Answers every completion after a fixed delay, like a slow model server."""
+
+    # Keep-alive, so that pooled connections are reused across requests
+    protocol_version = "HTTP/1.1"
+    failures_before_success = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            should_fail = server.requests <= self.failures_before_success
+        if should_fail:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        time.sleep(RESPONSE_DELAY)
+        payload = json.dumps({"model": body["model"], "echo": body["messages"][-1]["content"]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StandInServer(ThreadingHTTPServer):
+    # The default backlog of 5 would make concurrent connects wait for SYN retransmits
+    request_queue_size = 64
+
+
+class TestRestfulTransport(unittest.TestCase):
+
+    def setUp(self):
+        _StandInHandler.failures_before_success = 0
+        self.server = _StandInServer(("127.0.0.1", 0), _StandInHandler)
+        self.server.requests = 0
+        self.server.lock = threading.Lock()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.transport = RestfulTransport(max_connections=16, backoff_factor=0.01)
+        self.client = RestfulClient(api_base=f"http://127.0.0.1:{self.server.server_port}",
+                                    api_key="test",
+                                    transport=self.transport)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_concurrent_completions_run_in_parallel(self):
+        n = 8
+
+        async def run():
+            try:
+                start = time.perf_counter()
+                responses = await asyncio.gather(*[
+                    self.client.acompletion(model="o3", messages=[{"role": "user", "content": str(i)}])
+                    for i in range(n)
+                ])
+                return responses, time.perf_counter() - start
+            finally:
+                await self.transport.aclose()
+
+        responses, elapsed = asyncio.run(run())
+
+        self.assertEqual([response["echo"] for response in responses], [str(i) for i in range(n)])
+        # Serial requests would take n * RESPONSE_DELAY
+        self.assertLess(elapsed, n * RESPONSE_DELAY / 2)
+
+    def test_completions_from_separate_event_loops(self):
+        # Each asyncio.run gets a fresh loop: the second call must not reuse a client bound to the first
+        for i in range(2):
+            response = asyncio.run(
+                self.client.acompletion(model="o3", messages=[{"role": "user", "content": str(i)}])
+            )
+            self.assertEqual(response["echo"], str(i))
+
+    def test_retries_on_rate_limit(self):
+        _StandInHandler.failures_before_success = 2
+
+        response = self.client.completion(model="o3", messages=[{"role": "user", "content": "hi"}])
+
+        self.assertEqual(response["echo"], "hi")
+        self.assertEqual(self.server.requests, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from security_event_log import SegmentedEventLog
+
+
+def fill(log, count, start=0):
+    for i in range(start, start + count):
+        log.append({"event_id": f"event_{i}", "timestamp": datetime.fromtimestamp(1_700_000_000 + i)},
+                   1_700_000_000 + i)
+
+
+def test_recover_returns_newest_records_across_segments(tmp_path):
+    log = SegmentedEventLog(tmp_path, segment_bytes=1024, index_interval=4)
+    fill(log, 200)
+    log.close()
+
+    reopened = SegmentedEventLog(tmp_path, segment_bytes=1024, index_interval=4)
+    assert len(reopened.segments) > 1
+    records = reopened.recover(50)
+    assert [r["event_id"] for r in records] == [f"event_{i}" for i in range(150, 200)]
+    assert records[-1]["timestamp"] == datetime.fromtimestamp(1_700_000_199).isoformat()
+
+    fill(reopened, 1, start=200)
+    assert reopened.recover(1)[0]["event_id"] == "event_200"
+
+
+def test_torn_tail_is_truncated_before_appending(tmp_path):
+    log = SegmentedEventLog(tmp_path, index_interval=1)
+    fill(log, 10)
+    log.close()
+    segment = log._segment_path(log.segments[-1])
+    with open(segment, "ab") as f:
+        f.write(b"\x40\x00\x00\x00partial")
+
+    reopened = SegmentedEventLog(tmp_path, index_interval=1)
+    fill(reopened, 5, start=10)
+    records = reopened.recover(100)
+    assert [r["event_id"] for r in records] == [f"event_{i}" for i in range(15)]
+
+
+def test_read_since_uses_the_time_index(tmp_path):
+    log = SegmentedEventLog(tmp_path, segment_bytes=2048, index_interval=8)
+    fill(log, 300)
+
+    records = list(log.read_since(1_700_000_123))
+    assert [r["event_id"] for r in records] == [f"event_{i}" for i in range(123, 300)]
+    assert list(log.read_since(1_800_000_000)) == []
+    assert len(list(log.read_since(0))) == 300
+
+
+def test_oldest_segments_are_dropped_past_retention(tmp_path):
+    log = SegmentedEventLog(tmp_path, segment_bytes=512, max_segments=3)
+    fill(log, 200)
+
+    assert len(log.segments) == 3
+    assert len(list(tmp_path.glob("*.seg"))) == 3
+    records = log.recover(1000)
+    assert records[-1]["event_id"] == "event_199"
+    assert len(records) < 200
@@ -0,0 +1,73 @@
+import pytest
+
+from task_graph import TaskCycleError, TaskGraph
+
+
+def build(rows):
+    return TaskGraph.from_tasks(
+        (name, priority, deps, status, i) for i, (name, priority, deps, status) in enumerate(rows)
+    )
+
+
+def test_ready_tasks_follow_priority_and_completion_events():
+    graph = build([
+        ("deploy", 1, ["build", "test"], "pending"),
+        ("build", 3, [], "pending"),
+        ("test", 2, ["build"], "pending"),
+        ("docs", 4, [], "pending"),
+    ])
+
+    assert graph.peek_ready(5) == ["build", "docs"]
+    assert graph.pop_ready(1) == ["build"]
+    assert graph.peek_ready(5) == ["docs"]
+
+    assert graph.mark_completed("build") == ["test"]
+    assert graph.pop_ready(5) == ["test", "docs"]
+    assert graph.mark_completed("test") == ["deploy"]
+    assert graph.mark_completed("test") == []
+    assert graph.pop_ready(5) == ["deploy"]
+
+
+def test_dependencies_on_completed_unknown_and_failed_tasks():
+    graph = build([
+        ("report", 2, ["collect"], "pending"),
+        ("collect", 1, [], "completed"),
+        ("publish", 1, ["review"], "pending"),
+        ("archive", 3, ["report"], "pending"),
+    ])
+
+    assert graph.peek_ready(5) == ["report"]
+    assert graph.missing_dependencies() == {"publish": ["review"]}
+
+    graph.pop_ready()
+    graph.mark_failed("report")
+    assert graph.pop_ready(5) == []
+
+    graph.release("report")
+    assert graph.ready_count == 0
+
+
+def test_released_tasks_return_to_the_heap():
+    graph = build([("a", 1, [], "pending"), ("b", 2, [], "pending")])
+
+    assert graph.pop_ready(2) == ["a", "b"]
+    graph.release("b")
+    assert graph.claimed == ["a"]
+    assert graph.pop_ready(2) == ["b"]
+
+
+def test_cycles_are_rejected():
+    rows = [
+        ("a", 1, ["c"], "pending"),
+        ("b", 1, ["a"], "pending"),
+        ("c", 1, ["b"], "pending"),
+        ("d", 1, ["a", "missing"], "pending"),
+    ]
+
+    with pytest.raises(TaskCycleError) as excinfo:
+        build(rows)
+
+    cycle = excinfo.value.cycle
+    assert sorted(cycle) == ["a", "b", "c"]
+    for task, dep in zip(cycle, cycle[1:] + cycle[:1]):
+        assert dep in dict((r[0], r[2]) for r in rows)[task]
@@ -0,0 +1,89 @@
+import json
+import random
+
+import pytest
+
+from threat_signatures import DEFAULT_SIGNATURES, MAX_SIGNATURE_LENGTH, SignatureMatcher, load_signature_matcher
+
+
+def legacy_indicators(text, signatures):
+    """The any(pattern in text) loops the matcher replaces"""
+    text = text.lower()
+    return [indicator for indicator, patterns in signatures.items() if any(p in text for p in patterns)]
+
+
+def test_default_signatures_match_the_legacy_checks():
+    matcher = SignatureMatcher(DEFAULT_SIGNATURES)
+    for text in [
+        "GET /search?q=1 UNION SELECT password FROM users",
+        "<SCRIPT>alert(1)</script> and ../../etc/passwd",
+        "C:\\Windows\\System32 via ..\\..\\",
+        "img onerror=steal() javascript:void(0)",
+        "an ordinary api request",
+        "",
+    ]:
+        assert matcher.indicators_for(text) == legacy_indicators(text, DEFAULT_SIGNATURES)
+
+
+def test_overlapping_and_nested_signatures_are_all_reported():
+    matcher = SignatureMatcher({
+        'a': ['drop table'],
+        'b': ['table users'],
+        'c': ['drop'],
+        'd': ['drop table users;'],
+    })
+    hits = matcher.match("DROP TABLE users")
+    assert hits == {'a': {'drop table'}, 'b': {'table users'}, 'c': {'drop'}}
+    # A longer signature sharing a prefix must not hide the shorter one, nor match partially
+    assert matcher.indicators_for("drop table userz") == ['a', 'c']
+
+
+def test_matches_brute_force_scan_on_random_signatures():
+    rng = random.Random(5)
+    alphabet = "abc<>/'= "
+    signatures = {
+        f"indicator_{i}": [''.join(rng.choices(alphabet, k=rng.randint(2, 6))) for _ in range(20)]
+        for i in range(50)
+    }
+    matcher = SignatureMatcher(signatures)
+    for _ in range(200):
+        text = ''.join(rng.choices(alphabet + "ABC", k=rng.randint(0, 200)))
+        assert matcher.indicators_for(text) == legacy_indicators(text, signatures)
+
+
+def test_signature_file_replaces_defaults(tmp_path):
+    path = tmp_path / "signatures.json"
+    path.write_text(json.dumps({'ldap_injection_attempt': ['*)(uid=*'], 'xss_attempt': ['<svg onload']}))
+    matcher = load_signature_matcher(str(path))
+    assert len(matcher) == 2
+    assert matcher.indicators_for("user=*)(UID=*))") == ['ldap_injection_attempt']
+    assert matcher.indicators_for("<script>") == []
+
+    # An unreadable file falls back to the built-in signatures
+    fallback = load_signature_matcher(str(tmp_path / "missing.json"))
+    assert fallback.indicators_for("<script>") == ['xss_attempt']
+
+
+def test_long_and_deeply_nested_signatures_compile():
+    # Every prefix of one long signature is a signature too: the deepest nesting the trie can produce
+    longest = 'a' * MAX_SIGNATURE_LENGTH
+    matcher = SignatureMatcher({'long': [longest[:n] for n in range(1, MAX_SIGNATURE_LENGTH + 1)]})
+    assert len(matcher.match('x' + longest)['long']) == MAX_SIGNATURE_LENGTH
+
+    with pytest.raises(ValueError, match="limit"):
+        SignatureMatcher({'long': ['x' * 500]})
+
+
+@pytest.mark.parametrize("content", [
+    json.dumps({'too_long': ['x' * 500]}),
+    json.dumps(['<script>']),
+    json.dumps({'xss_attempt': '<script>'}),
+    json.dumps({'xss_attempt': [1, 2]}),
+    "{not json",
+])
+def test_invalid_signature_files_fall_back_to_defaults(tmp_path, content):
+    path = tmp_path / "signatures.json"
+    path.write_text(content)
+    matcher = load_signature_matcher(str(path))
+    assert matcher.indicators == list(DEFAULT_SIGNATURES)
+    assert matcher.indicators_for("<script>") == ['xss_attempt']
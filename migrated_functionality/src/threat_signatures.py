@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🧬 IZA OS THREAT SIGNATURES
+===========================
+Compiled multi-pattern matching of threat signatures
+All signatures fold into one trie-shaped regex, so a payload is scanned once however many there are
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# The signatures ThreatDetectionEngine has always checked, used when no signature file is configured
+DEFAULT_SIGNATURES: Dict[str, List[str]] = {
+    'sql_injection_attempt': ['union select', 'drop table', 'insert into', 'delete from', 'update set'],
+    'xss_attempt': ['<script>', 'javascript:', 'onerror=', 'onload='],
+    'path_traversal_attempt': ['../', '..\\', '/etc/passwd', 'windows/system32'],
+}
+
+# Nested signatures nest optional groups, and the re compiler recurses once per group
+MAX_SIGNATURE_LENGTH = 256
+
+_TERMINAL = ''
+
+
+def _trie_pattern(root: Dict[str, dict]) -> str:
+    """Regex for a trie that only matches complete signatures, longest first, built bottom-up without recursion"""
+    patterns: Dict[int, str] = {}
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        children = [(char, child) for char, child in node.items() if char != _TERMINAL]
+        if not children_done:
+            stack.append((node, True))
+            stack.extend((child, False) for _, child in children)
+            continue
+        branches = [re.escape(char) + patterns.pop(id(child)) for char, child in children]
+        body = ''
+        if branches:
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if _TERMINAL in node:
+                # A signature ends here, so the longer ones below are optional
+                body = '(?:' + body + ')?'
+        patterns[id(node)] = body
+    return patterns[id(root)]
+
+
+def _validate_signatures(signatures: Any) -> None:
+    """Raise ValueError unless signatures is {indicator: [signature, ...]} with usable signatures"""
+    if not isinstance(signatures, dict):
+        raise ValueError(f"Threat signatures must map indicators to lists, got {type(signatures).__name__}")
+    for indicator, patterns in signatures.items():
+        if not isinstance(patterns, list) or not all(isinstance(pattern, str) for pattern in patterns):
+            raise ValueError(f"Signatures for {indicator} must be a list of strings")
+        for pattern in patterns:
+            length = len(pattern.lower())
+            if length > MAX_SIGNATURE_LENGTH:
+                raise ValueError(
+                    f"Signature for {indicator} is {length} characters, the limit is {MAX_SIGNATURE_LENGTH}"
+                )
+
+
+class SignatureMatcher:
+    """Case-insensitive literal signatures grouped by indicator, matched in one pass"""
+
+    def __init__(self, signatures: Dict[str, List[str]]):
+        _validate_signatures(signatures)
+        self.indicators: List[str] = list(signatures)
+        self._owners: Dict[str, Set[str]] = {}
+        for indicator, patterns in signatures.items():
+            for pattern in patterns:
+                pattern = pattern.lower()
+                if pattern:
+                    self._owners.setdefault(pattern, set()).add(indicator)
+
+        self._trie: Dict[str, dict] = {}
+        for pattern in self._owners:
+            node = self._trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = {}
+
+        # The lookahead reports the longest signature starting at every position, overlaps included
+        self._regex = re.compile('(?=(' + _trie_pattern(self._trie) + '))', re.DOTALL) if self._owners else None
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "SignatureMatcher":
+        """Load {indicator: [signature, ...]} from a JSON file"""
+        with open(path) as f:
+            signatures = json.load(f)
+        matcher = cls(signatures)
+        logger.info(f"✅ Loaded {len(matcher)} threat signatures for {len(matcher.indicators)} indicators from {path}")
+        return matcher
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def _signatures_at(self, longest: str) -> Iterable[str]:
+        """Every signature that is a prefix of the longest one found at a position"""
+        node = self._trie
+        for end, char in enumerate(longest, 1):
+            node = node[char]
+            if _TERMINAL in node:
+                yield longest[:end]
+
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """Indicator -> signatures found in text"""
+        hits: Dict[str, Set[str]] = {}
+        if self._regex is None or not text:
+            return hits
+        for found in self._regex.finditer(text.lower()):
+            for signature in self._signatures_at(found.group(1)):
+                for indicator in self._owners[signature]:
+                    hits.setdefault(indicator, set()).add(signature)
+        return hits
+
+    def indicators_for(self, text: str) -> List[str]:
+        """Indicators hit by text, in signature file order"""
+        hits = self.match(text)
+        return [indicator for indicator in self.indicators if indicator in hits]
+
+
+def load_signature_matcher(path: Optional[str] = None) -> SignatureMatcher:
+    """Matcher for the signature file at path, or the built-in signatures"""
+    if path:
+        try:
+            return SignatureMatcher.from_file(path)
+        except (OSError, ValueError, re.error, RecursionError) as e:
+            logger.error(f"❌ Failed to load threat signatures from {path}, using built-in signatures: {e}")
+    return SignatureMatcher(DEFAULT_SIGNATURES)
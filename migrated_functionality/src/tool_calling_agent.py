@@ -52,7 +52,7 @@ from src.base.multistep_agent import (MultiStepAgent,
                                       ToolOutput,
                                       StreamEvent)
 from src.models import (Model,
-                        agglomerate_stream_deltas,
+                        StreamDeltaAccumulator,
                         parse_json_if_needed)
 from src.utils import (
     AgentImage,
@@ -144,15 +144,13 @@ class ToolCallingAgent(MultiStepAgent):
                     tools_to_call_from=self.tools_and_managed_agents,
                 )
 
-                chat_message_stream_deltas: list[ChatMessageStreamDelta] = []
+                stream_accumulator = StreamDeltaAccumulator()
                 with Live("", console=self.logger.console, vertical_overflow="visible") as live:
                     for event in output_stream:
-                        chat_message_stream_deltas.append(event)
-                        live.update(
-                            Markdown(agglomerate_stream_deltas(chat_message_stream_deltas).render_as_markdown())
-                        )
+                        stream_accumulator.add(event)
+                        live.update(Markdown(stream_accumulator.to_chat_message().render_as_markdown()))
                         yield event
-                chat_message = agglomerate_stream_deltas(chat_message_stream_deltas)
+                chat_message = stream_accumulator.to_chat_message()
             else:
                 chat_message: ChatMessage = self.model.generate(
                     input_messages,
@@ -0,0 +1,679 @@
+#!/usr/bin/env python3
+"""
+🗄️ IZA OS VENTURE STORE
+=======================
+Async, pooled data access for the venture management API
+PostgreSQL through asyncpg in production, SQLite through aiosqlite for local runs and tests
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import re
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+from uuid import uuid4
+
+try:
+    import asyncpg
+except ImportError:  # Only needed for PostgreSQL
+    asyncpg = None
+
+try:
+    import aiosqlite
+except ImportError:  # Only needed for SQLite
+    aiosqlite = None
+
+logger = logging.getLogger(__name__)
+
+VENTURE_COLUMNS = (
+    "id, name, description, industry, stage, status, valuation, funding, "
+    "team_size, founders, metrics, created_at, updated_at"
+)
+
+# Columns that may be changed through update_venture
+UPDATABLE_COLUMNS = ("name", "description", "industry", "stage", "valuation", "funding", "team_size", "founders")
+
+# Columns the per-user portfolio summary depends on
+STATS_COLUMNS = ("status", "stage", "industry", "valuation", "funding")
+
+TOP_PERFORMERS_SQL = """
+    SELECT name, valuation, funding, stage
+    FROM ventures
+    WHERE user_id = $1 AND status = 'ACTIVE'
+    ORDER BY valuation DESC NULLS LAST, funding DESC NULLS LAST
+    LIMIT 5
+"""
+
+class VentureConnection:
+    """One pooled connection; queries use $1, $2, ... placeholders on every backend"""
+
+    async def fetch(self, query: str, *args) -> List[Sequence[Any]]:
+        raise NotImplementedError
+
+    async def fetchrow(self, query: str, *args) -> Optional[Sequence[Any]]:
+        rows = await self.fetch(query, *args)
+        return rows[0] if rows else None
+
+    async def execute(self, query: str, *args) -> int:
+        """Run a statement and return the number of affected rows"""
+        raise NotImplementedError
+
+class VentureDatabase:
+    """Async connection pool for the ventures schema"""
+
+    SCHEMA: Tuple[str, ...] = ()
+    # Appended to the SELECT that reads a row before it is changed
+    ROW_LOCK = ""
+
+    async def connect(self):
+        raise NotImplementedError
+
+    async def close(self):
+        raise NotImplementedError
+
+    def acquire(self) -> "AsyncIterator[VentureConnection]":
+        """Connection for reads; each statement runs on its own"""
+        raise NotImplementedError
+
+    def transaction(self) -> "AsyncIterator[VentureConnection]":
+        """Connection whose statements commit together, or roll back on error"""
+        raise NotImplementedError
+
+    async def init_schema(self):
+        async with self.transaction() as conn:
+            for statement in self.SCHEMA + PORTFOLIO_STATS_SCHEMA:
+                await conn.execute(statement)
+
+    # Value conversion between Python and the backend's column types
+    def encode_array(self, values: List[str]) -> Any:
+        return values
+
+    def encode_timestamp(self, value: datetime) -> Any:
+        return value
+
+class PostgresConnection(VentureConnection):
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def fetch(self, query, *args):
+        return await self.conn.fetch(query, *args)
+
+    async def fetchrow(self, query, *args):
+        return await self.conn.fetchrow(query, *args)
+
+    async def execute(self, query, *args):
+        # asyncpg returns the command tag, e.g. "UPDATE 1"
+        status = await self.conn.execute(query, *args)
+        count = status.rsplit(" ", 1)[-1]
+        return int(count) if count.isdigit() else 0
+
+class PostgresVentureDatabase(VentureDatabase):
+    """asyncpg pool"""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS ventures (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            name VARCHAR(255) NOT NULL,
+            description TEXT,
+            industry VARCHAR(100),
+            stage VARCHAR(20) DEFAULT 'IDEA',
+            status VARCHAR(20) DEFAULT 'ACTIVE',
+            valuation DECIMAL(15,2),
+            funding DECIMAL(15,2),
+            team_size INTEGER,
+            founders TEXT[], -- PostgreSQL array
+            metrics JSONB DEFAULT '{}',
+            user_id UUID NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_ventures_stage ON ventures(stage)",
+        "CREATE INDEX IF NOT EXISTS idx_ventures_industry ON ventures(industry)",
+        # Serves user filtering and keyset pagination in index order
+        "CREATE INDEX IF NOT EXISTS idx_ventures_user_created ON ventures(user_id, created_at DESC, id DESC)",
+        # Top performers read the first five entries
+        "CREATE INDEX IF NOT EXISTS idx_ventures_user_top ON ventures"
+        "(user_id, status, valuation DESC NULLS LAST, funding DESC NULLS LAST)",
+    )
+    ROW_LOCK = " FOR UPDATE"
+
+    def __init__(self, dsn: str, min_size: int = 5, max_size: int = 20):
+        if asyncpg is None:
+            raise ImportError("PostgresVentureDatabase requires asyncpg: `pip install asyncpg`")
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.pool = None
+
+    @staticmethod
+    async def _init_connection(conn):
+        await conn.set_type_codec("jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+
+    async def connect(self):
+        self.pool = await asyncpg.create_pool(
+            self.dsn, min_size=self.min_size, max_size=self.max_size, init=self._init_connection
+        )
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self.pool.acquire() as conn:
+            yield PostgresConnection(conn)
+
+    @asynccontextmanager
+    async def transaction(self):
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                yield PostgresConnection(conn)
+
+# Per-user summaries of active ventures, maintained in the same transaction as each venture write.
+# Plain SQL types and ON CONFLICT upserts, so one definition serves both backends.
+PORTFOLIO_STATS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS venture_portfolio_stats (
+        user_id TEXT PRIMARY KEY,
+        total_ventures INTEGER NOT NULL DEFAULT 0,
+        total_valuation DOUBLE PRECISION NOT NULL DEFAULT 0,
+        valuation_count INTEGER NOT NULL DEFAULT 0,
+        total_funding DOUBLE PRECISION NOT NULL DEFAULT 0,
+        funding_count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    # value_key is the JSON encoding of the stage or industry, so NULL gets its own bucket
+    """
+    CREATE TABLE IF NOT EXISTS venture_portfolio_counts (
+        user_id TEXT NOT NULL,
+        dimension TEXT NOT NULL,
+        value_key TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (user_id, dimension, value_key)
+    )
+    """,
+)
+
+@lru_cache(maxsize=256)
+def _sqlite_query(query: str) -> str:
+    """$1-style placeholders to SQLite's equivalent ?1 form"""
+    return re.sub(r"\$(\d+)", r"?\1", query)
+
+class SQLiteConnection(VentureConnection):
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def fetch(self, query, *args):
+        async with self.conn.execute(_sqlite_query(query), args) as cursor:
+            return await cursor.fetchall()
+
+    async def execute(self, query, *args):
+        async with self.conn.execute(_sqlite_query(query), args) as cursor:
+            return cursor.rowcount
+
+class SQLiteVentureDatabase(VentureDatabase):
+    """Fixed-size pool of aiosqlite connections to one WAL-mode database file"""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS ventures (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            description TEXT,
+            industry TEXT,
+            stage TEXT DEFAULT 'IDEA',
+            status TEXT DEFAULT 'ACTIVE',
+            valuation REAL,
+            funding REAL,
+            team_size INTEGER,
+            founders TEXT DEFAULT '[]', -- JSON array
+            metrics TEXT DEFAULT '{}',
+            user_id TEXT NOT NULL,
+            created_at TEXT,
+            updated_at TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_ventures_stage ON ventures(stage)",
+        "CREATE INDEX IF NOT EXISTS idx_ventures_industry ON ventures(industry)",
+        "CREATE INDEX IF NOT EXISTS idx_ventures_user_created ON ventures(user_id, created_at DESC, id DESC)",
+        # SQLite sorts NULLs last in descending order already
+        "CREATE INDEX IF NOT EXISTS idx_ventures_user_top ON ventures(user_id, status, valuation DESC, funding DESC)",
+    )
+
+    def __init__(self, path: str, pool_size: int = 4):
+        if aiosqlite is None:
+            raise ImportError("SQLiteVentureDatabase requires aiosqlite: `pip install aiosqlite`")
+        self.path = path
+        self.pool_size = pool_size
+        self._pool: Optional[asyncio.Queue] = None
+        self._connections = []
+
+    async def connect(self):
+        self._pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            # Autocommit mode; transaction() issues BEGIN IMMEDIATE itself
+            conn = await aiosqlite.connect(self.path, isolation_level=None)
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute("PRAGMA synchronous=NORMAL")
+            await conn.execute("PRAGMA busy_timeout=5000")
+            self._connections.append(conn)
+            self._pool.put_nowait(conn)
+
+    async def close(self):
+        for conn in self._connections:
+            await conn.close()
+        self._connections = []
+        self._pool = None
+
+    @asynccontextmanager
+    async def acquire(self):
+        conn = await self._pool.get()
+        try:
+            yield SQLiteConnection(conn)
+        finally:
+            self._pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def transaction(self):
+        async with self.acquire() as conn:
+            # Take the write lock up front so concurrent writers wait instead of failing on upgrade
+            await conn.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                await conn.conn.execute("ROLLBACK")
+                raise
+            await conn.conn.execute("COMMIT")
+
+    def encode_array(self, values):
+        return json.dumps(values)
+
+    def encode_timestamp(self, value):
+        # Fixed-width ISO text sorts in time order
+        return value.isoformat(sep=" ", timespec="microseconds")
+
+def venture_database_url() -> str:
+    """VENTURE_DATABASE_URL, else the shared DATABASE_URL, else PostgreSQL from the DB_* settings"""
+    url = os.getenv("VENTURE_DATABASE_URL") or os.getenv("DATABASE_URL")
+    if url:
+        return url
+    # Same defaults as DatabaseManager; SQLite is only ever used when a sqlite:/// URL is given
+    user = quote(os.getenv("DB_USER", "postgres"), safe="")
+    password = quote(os.getenv("DB_PASSWORD", "password"), safe="")
+    host = os.getenv("DB_HOST", "localhost")
+    port = os.getenv("DB_PORT", "5432")
+    name = os.getenv("DB_NAME", "iza_os")
+    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
+
+def create_venture_database(url: str, pool_size: int = 10) -> VentureDatabase:
+    """Database for a postgresql:// DSN or a sqlite:///path URL"""
+    if url.startswith(("postgres://", "postgresql://")):
+        return PostgresVentureDatabase(url, min_size=min(5, pool_size), max_size=pool_size)
+    if url.startswith("sqlite:///"):
+        return SQLiteVentureDatabase(url[len("sqlite:///"):], pool_size=pool_size)
+    raise ValueError(f"Unsupported venture database URL: {url}")
+
+def encode_cursor(created_at: datetime, venture_id: str, total: int) -> str:
+    """Opaque page cursor: the last row's sort key plus the total counted on the first page"""
+    payload = json.dumps([created_at.isoformat(), venture_id, total])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str, int]:
+    try:
+        created_at, venture_id, total = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), venture_id, int(total)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page cursor: {e}") from e
+
+def _as_datetime(value: Any) -> Any:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+def _as_json(value: Any, default: Any) -> Any:
+    if value is None:
+        return default
+    return json.loads(value) if isinstance(value, str) else value
+
+def venture_from_row(row: Sequence[Any]) -> Dict[str, Any]:
+    """Row selected with VENTURE_COLUMNS as a plain dict"""
+    return {
+        "id": str(row[0]),
+        "name": row[1],
+        "description": row[2],
+        "industry": row[3],
+        "stage": row[4],
+        "status": row[5],
+        "valuation": float(row[6]) if row[6] else None,
+        "funding": float(row[7]) if row[7] else None,
+        "team_size": row[8],
+        "founders": list(_as_json(row[9], [])),
+        "metrics": _as_json(row[10], {}),
+        "created_at": _as_datetime(row[11]),
+        "updated_at": _as_datetime(row[12]),
+    }
+
+class VentureRepository:
+    """Venture queries over a VentureDatabase"""
+
+    def __init__(self, db: VentureDatabase):
+        self.db = db
+
+    async def create(self, user_id: str, name: str, description: Optional[str] = None,
+                     industry: Optional[str] = None, stage: str = "IDEA", funding: Optional[float] = None,
+                     team_size: Optional[int] = None, founders: Optional[List[str]] = None) -> Dict[str, Any]:
+        venture_id = str(uuid4())
+        now = self.db.encode_timestamp(datetime.utcnow())
+        async with self.db.transaction() as conn:
+            await conn.execute(
+                """
+                INSERT INTO ventures (
+                    id, name, description, industry, stage, status,
+                    valuation, funding, team_size, founders, user_id, created_at, updated_at
+                ) VALUES ($1, $2, $3, $4, $5, 'ACTIVE', $6, $6, $7, $8, $9, $10, $10)
+                """,
+                venture_id, name, description, industry, stage, funding, team_size,
+                self.db.encode_array(founders or []), user_id, now
+            )
+            await self._apply_stats_delta(conn, user_id, None, {
+                "status": "ACTIVE", "stage": stage, "industry": industry, "valuation": funding, "funding": funding
+            })
+        return await self.get(venture_id, user_id)
+
+    async def get(self, venture_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        async with self.db.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {VENTURE_COLUMNS} FROM ventures WHERE id = $1 AND user_id = $2",
+                venture_id, user_id
+            )
+        return venture_from_row(row) if row else None
+
+    async def list_page(self, user_id: str, limit: int = 20, stage: Optional[str] = None,
+                        industry: Optional[str] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """One page, newest first, continuing after the cursor's (created_at, id)"""
+        conditions = ["user_id = $1"]
+        params: List[Any] = [user_id]
+
+        if stage:
+            params.append(stage)
+            conditions.append(f"stage = ${len(params)}")
+
+        if industry:
+            params.append(industry)
+            conditions.append(f"industry = ${len(params)}")
+
+        filters = " AND ".join(conditions)
+        total = None
+        if cursor:
+            created_at, venture_id, total = decode_cursor(cursor)
+            params.extend([self.db.encode_timestamp(created_at), venture_id])
+            conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)})")
+
+        # The first page counts matches in the same round trip; later pages carry the count in the cursor.
+        # A scalar subquery counts from the index alone, where COUNT(*) OVER () would read every matching row.
+        count_column = f", (SELECT COUNT(*) FROM ventures WHERE {filters})" if total is None else ""
+        params.append(limit + 1)
+        query = f"""
+            SELECT {VENTURE_COLUMNS}{count_column}
+            FROM ventures
+            WHERE {' AND '.join(conditions)}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ${len(params)}
+        """
+
+        async with self.db.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+
+        if total is None:
+            total = rows[0][len(rows[0]) - 1] if rows else 0
+        ventures = [venture_from_row(row) for row in rows[:limit]]
+        has_next = len(rows) > limit
+        next_cursor = None
+        if has_next:
+            last = ventures[-1]
+            next_cursor = encode_cursor(last["created_at"], last["id"], total)
+
+        return {"ventures": ventures, "total": total, "has_next": has_next, "next_cursor": next_cursor}
+
+    async def update(self, venture_id: str, user_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply non-None changes; returns None if the venture does not exist"""
+        assignments = []
+        params: List[Any] = []
+        for column in UPDATABLE_COLUMNS:
+            value = changes.get(column)
+            if value is None:
+                continue
+            params.append(self.db.encode_array(value) if column == "founders" else value)
+            assignments.append(f"{column} = ${len(params)}")
+        if not assignments:
+            raise ValueError("No fields to update")
+
+        params.append(self.db.encode_timestamp(datetime.utcnow()))
+        assignments.append(f"updated_at = ${len(params)}")
+        params.extend([venture_id, user_id])
+
+        async with self.db.transaction() as conn:
+            before = await conn.fetchrow(
+                f"SELECT {', '.join(STATS_COLUMNS)} FROM ventures WHERE id = $1 AND user_id = $2{self.db.ROW_LOCK}",
+                venture_id, user_id
+            )
+            if before is None:
+                return None
+            await conn.execute(
+                f"UPDATE ventures SET {', '.join(assignments)} WHERE id = ${len(params) - 1} AND user_id = ${len(params)}",
+                *params
+            )
+            before = dict(zip(STATS_COLUMNS, before))
+            after = {column: changes[column] if changes.get(column) is not None else before[column]
+                     for column in STATS_COLUMNS}
+            await self._apply_stats_delta(conn, user_id, before, after)
+        return await self.get(venture_id, user_id)
+
+    async def delete(self, venture_id: str, user_id: str) -> bool:
+        async with self.db.transaction() as conn:
+            before = await conn.fetchrow(
+                f"DELETE FROM ventures WHERE id = $1 AND user_id = $2 RETURNING {', '.join(STATS_COLUMNS)}",
+                venture_id, user_id
+            )
+            if before is None:
+                return False
+            await self._apply_stats_delta(conn, user_id, dict(zip(STATS_COLUMNS, before)), None)
+        return True
+
+    async def _apply_stats_delta(self, conn: VentureConnection, user_id: str,
+                                 before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]):
+        """Move one venture's contribution to the user's summary from its old to its new values"""
+        ventures = valuation_count = funding_count = 0
+        total_valuation = total_funding = 0.0
+        counts: Dict[Tuple[str, str], int] = {}
+        for row, sign in ((before, -1), (after, 1)):
+            # Only active ventures are counted, as in the from-scratch queries
+            if not row or row["status"] != "ACTIVE":
+                continue
+            ventures += sign
+            if row["valuation"] is not None:
+                total_valuation += sign * float(row["valuation"])
+                valuation_count += sign
+            if row["funding"] is not None:
+                total_funding += sign * float(row["funding"])
+                funding_count += sign
+            for dimension in ("stage", "industry"):
+                key = (dimension, json.dumps(row[dimension]))
+                counts[key] = counts.get(key, 0) + sign
+
+        if ventures or valuation_count or funding_count or total_valuation or total_funding:
+            await conn.execute(
+                """
+                INSERT INTO venture_portfolio_stats
+                    (user_id, total_ventures, total_valuation, valuation_count, total_funding, funding_count)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                ON CONFLICT (user_id) DO UPDATE SET
+                    total_ventures = venture_portfolio_stats.total_ventures + excluded.total_ventures,
+                    total_valuation = venture_portfolio_stats.total_valuation + excluded.total_valuation,
+                    valuation_count = venture_portfolio_stats.valuation_count + excluded.valuation_count,
+                    total_funding = venture_portfolio_stats.total_funding + excluded.total_funding,
+                    funding_count = venture_portfolio_stats.funding_count + excluded.funding_count
+                """,
+                user_id, ventures, total_valuation, valuation_count, total_funding, funding_count
+            )
+
+        changed = [(dimension, value_key, delta) for (dimension, value_key), delta in counts.items() if delta]
+        for dimension, value_key, delta in changed:
+            await conn.execute(
+                """
+                INSERT INTO venture_portfolio_counts (user_id, dimension, value_key, count)
+                VALUES ($1, $2, $3, $4)
+                ON CONFLICT (user_id, dimension, value_key) DO UPDATE SET
+                    count = venture_portfolio_counts.count + excluded.count
+                """,
+                user_id, dimension, value_key, delta
+            )
+        if any(delta < 0 for _, _, delta in changed):
+            # GROUP BY never reports empty buckets
+            await conn.execute("DELETE FROM venture_portfolio_counts WHERE user_id = $1 AND count <= 0", user_id)
+
+    async def rebuild_portfolio_stats(self, user_id: Optional[str] = None):
+        """Recompute summaries from the ventures table, e.g. after the summary tables were added"""
+        user_filter = "user_id = $1 AND " if user_id else ""
+        params = [user_id] if user_id else []
+        async with self.db.transaction() as conn:
+            await conn.execute(f"DELETE FROM venture_portfolio_stats{' WHERE user_id = $1' if user_id else ''}", *params)
+            await conn.execute(f"DELETE FROM venture_portfolio_counts{' WHERE user_id = $1' if user_id else ''}", *params)
+            await conn.execute(
+                f"""
+                INSERT INTO venture_portfolio_stats
+                    (user_id, total_ventures, total_valuation, valuation_count, total_funding, funding_count)
+                SELECT CAST(user_id AS TEXT), COUNT(*), COALESCE(SUM(valuation), 0), COUNT(valuation),
+                       COALESCE(SUM(funding), 0), COUNT(funding)
+                FROM ventures
+                WHERE {user_filter}status = 'ACTIVE'
+                GROUP BY user_id
+                """,
+                *params
+            )
+            for dimension in ("stage", "industry"):
+                rows = await conn.fetch(
+                    f"""
+                    SELECT CAST(user_id AS TEXT), {dimension}, COUNT(*)
+                    FROM ventures
+                    WHERE {user_filter}status = 'ACTIVE'
+                    GROUP BY user_id, {dimension}
+                    """,
+                    *params
+                )
+                for row in rows:
+                    await conn.execute(
+                        "INSERT INTO venture_portfolio_counts (user_id, dimension, value_key, count) VALUES ($1, $2, $3, $4)",
+                        row[0], dimension, json.dumps(row[1]), row[2]
+                    )
+
+    async def ensure_portfolio_stats(self):
+        """Build the summaries once if ventures exist but no summary has been written yet"""
+        async with self.db.acquire() as conn:
+            has_stats = await conn.fetchrow("SELECT 1 FROM venture_portfolio_stats LIMIT 1")
+            has_ventures = await conn.fetchrow("SELECT 1 FROM ventures LIMIT 1")
+        if has_ventures and not has_stats:
+            await self.rebuild_portfolio_stats()
+
+    async def analytics(self, user_id: str) -> Dict[str, Any]:
+        """Portfolio totals, distributions and top performers from the maintained summaries"""
+        async with self.db.acquire() as conn:
+            stats = await conn.fetchrow(
+                """
+                SELECT total_ventures, total_valuation, valuation_count, total_funding, funding_count
+                FROM venture_portfolio_stats
+                WHERE user_id = $1
+                """,
+                user_id
+            )
+            count_rows = await conn.fetch(
+                "SELECT dimension, value_key, count FROM venture_portfolio_counts WHERE user_id = $1",
+                user_id
+            )
+            top_rows = await conn.fetch(TOP_PERFORMERS_SQL, user_id)
+
+        total_ventures, total_valuation, valuation_count, total_funding, funding_count = stats or (0, 0, 0, 0, 0)
+        distributions = {"stage": {}, "industry": {}}
+        for dimension, value_key, count in count_rows:
+            distributions[dimension][json.loads(value_key)] = count
+
+        return {
+            "total_ventures": total_ventures,
+            "total_valuation": float(total_valuation),
+            "total_funding": float(total_funding),
+            "avg_valuation": float(total_valuation) / valuation_count if valuation_count else 0,
+            "avg_funding": float(total_funding) / funding_count if funding_count else 0,
+            "stage_distribution": distributions["stage"],
+            "industry_distribution": distributions["industry"],
+            "top_performers": self._top_performers(top_rows),
+        }
+
+    @staticmethod
+    def _top_performers(rows) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": row[0],
+                "valuation": float(row[1]) if row[1] else 0,
+                "funding": float(row[2]) if row[2] else 0,
+                "stage": row[3],
+            }
+            for row in rows
+        ]
+
+    async def analytics_from_scratch(self, user_id: str) -> Dict[str, Any]:
+        """The same analytics aggregated directly over the ventures table"""
+        async with self.db.acquire() as conn:
+            basic_stats = await conn.fetchrow(
+                """
+                SELECT
+                    COUNT(*) as total_ventures,
+                    COALESCE(SUM(valuation), 0) as total_valuation,
+                    COALESCE(SUM(funding), 0) as total_funding,
+                    AVG(valuation) as avg_valuation,
+                    AVG(funding) as avg_funding
+                FROM ventures
+                WHERE user_id = $1 AND status = 'ACTIVE'
+                """,
+                user_id
+            )
+            stage_rows = await conn.fetch(
+                """
+                SELECT stage, COUNT(*) as count
+                FROM ventures
+                WHERE user_id = $1 AND status = 'ACTIVE'
+                GROUP BY stage
+                """,
+                user_id
+            )
+            industry_rows = await conn.fetch(
+                """
+                SELECT industry, COUNT(*) as count
+                FROM ventures
+                WHERE user_id = $1 AND status = 'ACTIVE'
+                GROUP BY industry
+                """,
+                user_id
+            )
+            top_rows = await conn.fetch(TOP_PERFORMERS_SQL, user_id)
+
+        return {
+            "total_ventures": basic_stats[0],
+            "total_valuation": float(basic_stats[1]),
+            "total_funding": float(basic_stats[2]),
+            "avg_valuation": float(basic_stats[3]) if basic_stats[3] else 0,
+            "avg_funding": float(basic_stats[4]) if basic_stats[4] else 0,
+            "stage_distribution": {row[0]: row[1] for row in stage_rows},
+            "industry_distribution": {row[0]: row[1] for row in industry_rows},
+            "top_performers": self._top_performers(top_rows),
+        }
+
+    async def ping(self):
+        async with self.db.acquire() as conn:
+            await conn.fetchrow("SELECT 1")